@@ -33,6 +33,7 @@ class ModdySystems(commands.Bot):
         self.session = None
         self.team_members = set()  # IDs des membres de l'équipe de développement
         self.app_id = None  # ID de l'application (renommé)
+        self.shutdown_hooks = []  # Coroutines appelées avant la fermeture
 
     async def setup_hook(self):
         """Hook appelé lors de l'initialisation du bot"""
@@ -89,6 +90,9 @@ class ModdySystems(commands.Bot):
         for filename in os.listdir(cogs_dir):
             if filename.endswith('.py') and not filename.startswith('_'):
                 extension_name = f'cogs.{filename[:-3]}'
+                # Déjà chargé comme dépendance d'un autre cog
+                if extension_name in self.extensions:
+                    continue
                 try:
                     await self.load_extension(extension_name)
                     logger.info(f"Cog loaded: {extension_name}")
@@ -184,8 +188,25 @@ class ModdySystems(commands.Bot):
                 )
             )
 
+    def add_shutdown_hook(self, hook):
+        """Enregistre une coroutine à appeler avant la fermeture du bot"""
+        if hook not in self.shutdown_hooks:
+            self.shutdown_hooks.append(hook)
+
+    def remove_shutdown_hook(self, hook):
+        """Retire une coroutine enregistrée avec add_shutdown_hook"""
+        if hook in self.shutdown_hooks:
+            self.shutdown_hooks.remove(hook)
+
     async def close(self):
         """Fermeture propre du bot"""
+        # Exécuter les hooks de fermeture (ex: flush des écritures en attente)
+        for hook in self.shutdown_hooks:
+            try:
+                await hook()
+            except Exception as e:
+                logger.error(f"Error in shutdown hook {hook.__qualname__}: {e}")
+
         if self.session:
             await self.session.close()
         await super().close()
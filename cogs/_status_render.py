@@ -0,0 +1,214 @@
+"""
+Status message rendering shared by the status cog.
+
+Turns an incident/maintenance record into its Components V2 tree. Not a cog:
+bot.py skips files starting with an underscore.
+"""
+import discord
+from discord import ui
+from collections import OrderedDict
+from datetime import datetime
+from enum import Enum
+from typing import Optional, Tuple
+import hashlib
+import json
+
+# Rendered reports kept in memory, keyed by (message id, version, duration)
+RENDER_CACHE_SIZE = 256
+
+
+# Status configurations
+class IncidentStatus(Enum):
+    ONGOING = ("ongoing", "<:rstatus:1424029736048267317>", "Ongoing")
+    INVESTIGATING = ("investigating", "<:ystatus:1424029739496112200>", "Investigating")
+    IDENTIFIED = ("identified", "<:ystatus:1424029739496112200>", "Identified")
+    MONITORING = ("monitoring", "<:ystatus:1424029739496112200>", "Monitoring")
+    PARTIALLY_RESOLVED = ("partially_resolved", "<:ystatus:1424029739496112200>", "Partially Resolved")
+    REMAINS_UNSTABLE = ("remains_unstable", "<:ystatus:1424029739496112200>", "Remains Unstable")
+    KNOWN_ISSUES = ("known_issues", "<:ystatus:1424029739496112200>", "Known Issues")
+    RESOLVED = ("resolved", "<:gstatus:1424029737977778206>", "Resolved")
+
+
+class MaintenanceStatus(Enum):
+    SCHEDULED = ("scheduled", "<:ystatus:1424029739496112200>", "Scheduled")
+    IN_PROGRESS = ("in_progress", "<:rstatus:1424029736048267317>", "In Progress")
+    EXTENDED = ("extended", "<:ystatus:1424029739496112200>", "Extended")
+    PARTIALLY_COMPLETE = ("partially_complete", "<:ystatus:1424029739496112200>", "Partially Complete")
+    COMPLETED = ("completed", "<:gstatus:1424029737977778206>", "Completed")
+    CANCELLED = ("cancelled", "<:gstatus:1424029737977778206>", "Cancelled")
+
+
+# Severity levels for incidents
+class Severity(Enum):
+    CRITICAL = "Critical"
+    MAJOR = "Major"
+    MINOR = "Minor"
+    LOW = "Low"
+
+
+def get_status_emoji_and_text(status_value: str, is_maintenance: bool = False) -> tuple:
+    """Get the appropriate emoji and text for a status"""
+    if is_maintenance:
+        for status in MaintenanceStatus:
+            if status.value[0] == status_value.lower():
+                return status.value[1], status.value[2]
+        return MaintenanceStatus.SCHEDULED.value[1], "Unknown"
+    else:
+        for status in IncidentStatus:
+            if status.value[0] == status_value.lower():
+                return status.value[1], status.value[2]
+        return IncidentStatus.ONGOING.value[1], "Unknown"
+
+
+def format_duration(start_timestamp: int, end_timestamp: Optional[int] = None) -> str:
+    """Format duration between two timestamps"""
+    if end_timestamp is None:
+        end_timestamp = int(datetime.now().timestamp())
+
+    duration = end_timestamp - start_timestamp
+    hours = duration // 3600
+    minutes = (duration % 3600) // 60
+
+    if hours > 0:
+        return f"{hours}h {minutes}m"
+    return f"{minutes}m"
+
+
+
+def report_duration(incident: dict) -> Optional[str]:
+    """Running duration of an active incident, total once resolved"""
+    if incident.get('type') == 'maintenance' or not incident.get('start_time'):
+        return None
+    end_time = incident.get('resolution_time') if incident['status'] == 'resolved' else None
+    return format_duration(incident['start_time'], end_time)
+
+
+def build_report_view(incident: dict, duration: Optional[str] = None) -> ui.LayoutView:
+    """Component tree of a status message, with its updates"""
+    view = ui.LayoutView(timeout=None)
+    container = ui.Container()
+
+    is_maintenance = incident.get('type') == 'maintenance'
+
+    # Get status emoji and text
+    emoji, status_text = get_status_emoji_and_text(incident['status'], is_maintenance)
+
+    if not is_maintenance:
+        duration_text = f" (Duration: {duration})" if duration else ""
+
+        # Title with status
+        title_text = f"{emoji} **{incident['title']} — {status_text}**{duration_text}"
+
+        content_parts = [
+            title_text,
+            f"* **Issue:** {incident['issue']}",
+            f"* **Type:** `Incident`",
+            f"* **Severity:** `{incident.get('severity', 'Major')}`",
+            f"* **Affected services:** `{incident['services']}`",
+            f"* **Status:** `{status_text}`",
+            f"* **ETA:** `{incident.get('eta', 'TBD')}`",
+            f"* **Started:** <t:{incident['start_time']}:F>"
+        ]
+    else:
+        # Maintenance
+        title_text = f"{emoji} **Maintenance: {incident['title']}**"
+        if incident['status'] == 'completed':
+            title_text = f"{emoji} **Maintenance: {incident['title']} — Completed**"
+
+        content_parts = [
+            title_text,
+            f"* **Description:** {incident['description']}",
+            f"* **Type:** `Maintenance`",
+            f"* **Affected services:** `{incident['services']}`",
+            f"* **Status:** `{status_text}`"
+        ]
+
+        if incident.get('scheduled_time'):
+            scheduled_time = incident['scheduled_time']
+            content_parts.append(f"* **Scheduled time:** <t:{scheduled_time}:F> (<t:{scheduled_time}:R>)")
+        if incident.get('duration'):
+            content_parts.append(f"* **Expected duration:** `{incident['duration']}`")
+
+    if incident.get('status_link'):
+        content_parts.append(f"* **Status link:** {incident['status_link']}")
+
+    if incident.get('status_id'):
+        content_parts.append(f"* **Status ID:** `#{incident['status_id']}`")
+
+    container.add_item(ui.TextDisplay('\n'.join(content_parts)))
+
+    # Separator
+    container.add_item(ui.Separator(spacing=discord.SeparatorSpacing.large))
+
+    # Add updates
+    if incident.get('updates'):
+        update_texts = []
+        for upd in incident['updates']:
+            upd_status = upd.get('status') or incident['status']
+            upd_emoji, upd_status_text = get_status_emoji_and_text(upd_status, is_maintenance)
+            update_texts.append(
+                f"> {upd_emoji} **Update {upd['number']} — {upd_status_text}, <t:{upd['timestamp']}:R>:**\n"
+                f"> {upd['description']}"
+            )
+        container.add_item(ui.TextDisplay('\n'.join(update_texts)))
+
+        # Add separator before footer
+        container.add_item(ui.Separator(spacing=discord.SeparatorSpacing.large))
+
+    # Footer
+    container.add_item(ui.TextDisplay("*Updates will be edited in this message*"))
+
+    # Mentions must be in the view content, not the message content field, with V2 components
+    if incident.get('mentions'):
+        mentions_text = " / ".join(incident['mentions'])
+        container.add_item(ui.TextDisplay(f"-# {mentions_text}"))
+    else:
+        container.add_item(ui.TextDisplay("-# Status updates"))
+
+    view.add_item(container)
+
+    return view
+
+
+def render_hash(view: ui.LayoutView) -> str:
+    """Digest of a rendered status message, to skip edits that wouldn't change it"""
+    payload = json.dumps(view.to_components(), sort_keys=True)
+    return hashlib.sha1(payload.encode()).hexdigest()
+
+
+class ReportRenderer:
+    """
+    Memoized build_report_view(), keyed by (message id, version).
+
+    The displayed duration is part of the key, so an active incident's render is
+    reused until the report changes or its duration ticks over. Rendered views
+    have no interactive items and no timeout, so one instance can be sent or
+    edited any number of times.
+    """
+
+    def __init__(self, max_size: int = RENDER_CACHE_SIZE):
+        self.max_size = max_size
+        self.cache: OrderedDict = OrderedDict()
+
+    def render(self, incident: dict, message_id: Optional[str] = None) -> Tuple[ui.LayoutView, str]:
+        """Returns the report's view and its digest"""
+        duration = report_duration(incident)
+        version = incident.get('version')
+
+        # Reports not stored yet (no message, no version) aren't cached
+        key = (str(message_id), version, duration) if message_id and version is not None else None
+        if key in self.cache:
+            self.cache.move_to_end(key)
+            return self.cache[key]
+
+        view = build_report_view(incident, duration)
+        rendered = (view, render_hash(view))
+
+        if key is not None:
+            self.cache[key] = rendered
+            if len(self.cache) > self.max_size:
+                self.cache.popitem(last=False)
+        return rendered
+
+
+report_renderer = ReportRenderer()
@@ -3,71 +3,903 @@ from discord import app_commands, ui
 from discord.ext import commands, tasks
 from typing import Optional, List, Dict, Literal
 from datetime import datetime, timedelta
+from itertools import groupby
 import re
+import io
 import json
 import os
 import asyncio
-from enum import Enum
+import functools
+from abc import ABC, abstractmethod
+import sqlite3
+import asyncpg
+from concurrent.futures import ThreadPoolExecutor
+from cogs._status_render import get_status_emoji_and_text, format_duration, report_renderer
 
 # Channel ID for status updates
 STATUS_CHANNEL_ID = 1398625686301704323
 
+# Incident persistence: auto (ModdySystems DB when DATABASE_URL is set, local SQLite
+# otherwise), postgres, sqlite or journal (in-memory state + append-only event file)
+INCIDENT_STORE = os.getenv('INCIDENT_STORE', 'auto').lower()
+INCIDENT_DB_PATH = os.getenv('INCIDENT_DB_PATH', 'incidents.db')
+INCIDENT_JOURNAL_PATH = os.getenv('INCIDENT_JOURNAL_PATH', 'incidents.journal')
+INCIDENT_SNAPSHOT_PATH = os.getenv('INCIDENT_SNAPSHOT_PATH', 'incidents.snapshot.json')
+INCIDENT_JOURNAL_COMPACT_EVERY = int(os.getenv('INCIDENT_JOURNAL_COMPACT_EVERY', '500'))
+# Legacy whole-file store, imported once into the incident store and then renamed
+INCIDENTS_JSON_PATH = 'incidents.json'
 
-# Status configurations
-class IncidentStatus(Enum):
-    ONGOING = ("ongoing", "<:rstatus:1424029736048267317>", "Ongoing")
-    INVESTIGATING = ("investigating", "<:ystatus:1424029739496112200>", "Investigating")
-    IDENTIFIED = ("identified", "<:ystatus:1424029739496112200>", "Identified")
-    MONITORING = ("monitoring", "<:ystatus:1424029739496112200>", "Monitoring")
-    PARTIALLY_RESOLVED = ("partially_resolved", "<:ystatus:1424029739496112200>", "Partially Resolved")
-    REMAINS_UNSTABLE = ("remains_unstable", "<:ystatus:1424029739496112200>", "Remains Unstable")
-    KNOWN_ISSUES = ("known_issues", "<:ystatus:1424029739496112200>", "Known Issues")
-    RESOLVED = ("resolved", "<:gstatus:1424029737977778206>", "Resolved")
+# Reports read per query by /export_incidents
+INCIDENT_EXPORT_PAGE_SIZE = 100
 
+# Statuses after which a report is no longer active (unpinned, not refreshed)
+CLOSED_STATUSES = ('resolved', 'completed', 'cancelled')
 
-class MaintenanceStatus(Enum):
-    SCHEDULED = ("scheduled", "<:ystatus:1424029739496112200>", "Scheduled")
-    IN_PROGRESS = ("in_progress", "<:rstatus:1424029736048267317>", "In Progress")
-    EXTENDED = ("extended", "<:ystatus:1424029739496112200>", "Extended")
-    PARTIALLY_COMPLETE = ("partially_complete", "<:ystatus:1424029739496112200>", "Partially Complete")
-    COMPLETED = ("completed", "<:gstatus:1424029737977778206>", "Completed")
-    CANCELLED = ("cancelled", "<:gstatus:1424029737977778206>", "Cancelled")
 
+def _message_key(message_id) -> Optional[int]:
+    """Status message IDs are stored as integers, anything else can't be a report"""
+    try:
+        return int(message_id)
+    except (TypeError, ValueError):
+        return None
 
-# Severity levels for incidents
-class Severity(Enum):
-    CRITICAL = "Critical"
-    MAJOR = "Major"
-    MINOR = "Minor"
-    LOW = "Low"
 
+def _sort_time(incident: dict) -> int:
+    """Start time of an incident, scheduled time of a maintenance"""
+    try:
+        return int(incident.get('start_time') or incident.get('scheduled_time') or 0)
+    except (TypeError, ValueError):
+        return 0
 
-def get_status_emoji_and_text(status_value: str, is_maintenance: bool = False) -> tuple:
-    """Get the appropriate emoji and text for a status"""
-    if is_maintenance:
-        for status in MaintenanceStatus:
-            if status.value[0] == status_value.lower():
-                return status.value[1], status.value[2]
-        return MaintenanceStatus.SCHEDULED.value[1], "Unknown"
-    else:
-        for status in IncidentStatus:
-            if status.value[0] == status_value.lower():
-                return status.value[1], status.value[2]
-        return IncidentStatus.ONGOING.value[1], "Unknown"
 
+def _row_columns(data: dict) -> tuple:
+    """Indexed columns (type, status, start_time) derived from a report's fields"""
+    return data.get('type', 'incident'), data.get('status', 'ongoing'), _sort_time(data)
 
-def format_duration(start_timestamp: int, end_timestamp: Optional[int] = None) -> str:
-    """Format duration between two timestamps"""
-    if end_timestamp is None:
-        end_timestamp = int(datetime.now().timestamp())
 
-    duration = end_timestamp - start_timestamp
-    hours = duration // 3600
-    minutes = (duration % 3600) // 60
+def _build_record(data: dict, version: int, updates: list) -> dict:
+    """Rebuilds the report dict from its row and its (description, timestamp, status) updates"""
+    incident = dict(data)
+    incident['updates'] = [
+        {'description': description, 'timestamp': str(timestamp), 'number': number, 'status': status}
+        for number, (description, timestamp, status) in enumerate(updates, 1)
+    ]
+    incident['version'] = version
+    return incident
 
-    if hours > 0:
-        return f"{hours}h {minutes}m"
-    return f"{minutes}m"
+
+def _export_chunk(page: Dict[str, dict]) -> str:
+    """Entries of one export page, formatted as in a json.dumps(..., indent=2) of the whole export"""
+    return json.dumps(page, indent=2)[2:-2]
+
+
+def _read_json(path: str) -> dict:
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def _read_legacy_json(path: str) -> Optional[dict]:
+    if not os.path.exists(path):
+        return None
+    return _read_json(path)
+
+
+class IncidentIO:
+    """
+    Single worker thread for every incident file and SQLite access.
+
+    Jobs run one at a time in submission order, so writers are serialized
+    without locks and the event loop never waits on the disk.
+    """
+
+    def __init__(self):
+        self.executor = None
+
+    async def run(self, fn, *args):
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='incident-io')
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, functools.partial(fn, *args))
+
+    def shutdown(self):
+        """Lets queued jobs finish; a new worker is started on the next run()"""
+        if self.executor:
+            self.executor.shutdown(wait=False)
+            self.executor = None
+
+
+incident_io = IncidentIO()
+
+
+# Inlined rather than bound so the planner can use the partial "active" indexes
+CLOSED_SQL = ", ".join(f"'{status}'" for status in CLOSED_STATUSES)
+
+
+class IncidentStore(ABC):
+    """
+    Row-level persistence of status reports, keyed by their status message ID.
+
+    Records are the same dicts the cog always worked with. Updates live in their
+    own rows so adding one never rewrites the report, and are numbered in
+    (timestamp, insertion) order when read back. Every change bumps `version`.
+    """
+
+    name = 'base'
+
+    @abstractmethod
+    async def open(self):
+        ...
+
+    async def close(self):
+        pass
+
+    @abstractmethod
+    async def get(self, message_id: str) -> Optional[dict]:
+        ...
+
+    @abstractmethod
+    async def get_many(self, message_ids: List[str]) -> Dict[str, dict]:
+        """The stored reports among message_ids"""
+        ...
+
+    @abstractmethod
+    async def list(self, report_type: Optional[str] = None, active: Optional[bool] = None,
+                   limit: Optional[int] = None, newest_first: bool = True, offset: int = 0) -> Dict[str, dict]:
+        """Reports ordered by start/scheduled time, filtered on type and active status"""
+        ...
+
+    @abstractmethod
+    async def count(self, report_type: Optional[str] = None, active: Optional[bool] = None) -> int:
+        ...
+
+    @abstractmethod
+    async def stats(self) -> dict:
+        """Aggregates for /incident_stats, computed without loading the reports
+
+        {'types': {type: count}, 'severities': {severity: incident count},
+         'resolved': resolved incidents with a duration, 'resolution_total': sum of their durations}
+        """
+        ...
+
+    @abstractmethod
+    async def create(self, message_id: str, incident: dict) -> bool:
+        """Inserts a report with its updates, returns False if it already exists"""
+        ...
+
+    @abstractmethod
+    async def update_fields(self, message_id: str, fields: dict) -> Optional[dict]:
+        """Merges fields into a report, returns the updated record (None if unknown)"""
+        ...
+
+    @abstractmethod
+    async def add_update(self, message_id: str, update: dict,
+                         fields: Optional[dict] = None) -> Optional[dict]:
+        """Appends an update (and optional field changes), returns the updated record"""
+        ...
+
+    @abstractmethod
+    async def delete_update(self, message_id: str, number: int) -> Optional[dict]:
+        """Removes the update shown as `number`, returns the updated record"""
+        ...
+
+    @abstractmethod
+    async def delete(self, message_id: str):
+        ...
+
+    async def import_json(self, path: str = INCIDENTS_JSON_PATH) -> int:
+        """One-shot import of the legacy incidents.json file, renamed once imported"""
+        incidents = await incident_io.run(_read_legacy_json, path)
+        if incidents is None:
+            return 0
+
+        imported = 0
+        for message_id, incident in incidents.items():
+            if _message_key(message_id) is None:
+                continue
+            if await self.create(message_id, incident):
+                imported += 1
+
+        await incident_io.run(os.replace, path, f"{path}.imported")
+        return imported
+
+
+class PostgresIncidentStore(IncidentStore):
+    """
+    Incident store backed by tables in the ModdySystems database.
+
+    Runs on the tickets cog's systems pool; its tables are created by the
+    versioned MIGRATIONS of cogs/tickets.py.
+    """
+
+    name = 'postgres'
+
+    SELECT = """
+        SELECT i.message_id, i.data, i.version, COALESCE(u.updates, '[]'::json) AS updates
+        FROM status_incidents i
+        LEFT JOIN LATERAL (
+            SELECT json_agg(json_build_array(description, timestamp, status) ORDER BY timestamp, id) AS updates
+            FROM status_incident_updates
+            WHERE message_id = i.message_id
+        ) u ON TRUE
+    """
+
+    def __init__(self, pool: asyncpg.Pool):
+        self.pool = pool
+
+    async def open(self):
+        async with self.pool.acquire() as conn:
+            if not await conn.fetchval("SELECT to_regclass('status_incidents') IS NOT NULL"):
+                raise RuntimeError("status_incidents table missing, ModdySystems migrations not applied")
+
+    @staticmethod
+    def _record(row) -> dict:
+        return _build_record(json.loads(row['data']), row['version'], json.loads(row['updates']))
+
+    @staticmethod
+    def _filters(report_type: Optional[str], active: Optional[bool]) -> tuple:
+        clauses, args = [], []
+        if report_type:
+            args.append(report_type)
+            clauses.append(f"i.type = ${len(args)}")
+        if active is True:
+            clauses.append(f"i.status NOT IN ({CLOSED_SQL})")
+        elif active is False:
+            clauses.append(f"i.status IN ({CLOSED_SQL})")
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        return where, args
+
+    async def _fetch_one(self, conn, key: int) -> Optional[dict]:
+        row = await conn.fetchrow(f"{self.SELECT} WHERE i.message_id = $1", key)
+        return self._record(row) if row else None
+
+    async def get(self, message_id: str) -> Optional[dict]:
+        key = _message_key(message_id)
+        if key is None:
+            return None
+        async with self.pool.acquire() as conn:
+            return await self._fetch_one(conn, key)
+
+    async def get_many(self, message_ids: List[str]) -> Dict[str, dict]:
+        keys = [key for key in map(_message_key, message_ids) if key is not None]
+        if not keys:
+            return {}
+        async with self.pool.acquire() as conn:
+            rows = await conn.fetch(f"{self.SELECT} WHERE i.message_id = ANY($1::bigint[])", keys)
+        return {str(row['message_id']): self._record(row) for row in rows}
+
+    async def list(self, report_type=None, active=None, limit=None, newest_first=True, offset=0) -> Dict[str, dict]:
+        where, args = self._filters(report_type, active)
+        query = (f"{self.SELECT} {where} "
+                 f"ORDER BY i.start_time {'DESC' if newest_first else 'ASC'}, i.message_id")
+        if limit:
+            args.append(limit)
+            query += f" LIMIT ${len(args)}"
+        if offset:
+            args.append(offset)
+            query += f" OFFSET ${len(args)}"
+        async with self.pool.acquire() as conn:
+            rows = await conn.fetch(query, *args)
+        return {str(row['message_id']): self._record(row) for row in rows}
+
+    async def count(self, report_type=None, active=None) -> int:
+        where, args = self._filters(report_type, active)
+        async with self.pool.acquire() as conn:
+            return await conn.fetchval(f"SELECT COUNT(*) FROM status_incidents i {where}", *args)
+
+    async def stats(self) -> dict:
+        async with self.pool.acquire() as conn:
+            types = await conn.fetch("SELECT type, COUNT(*) FROM status_incidents GROUP BY type")
+            severities = await conn.fetch("""
+                SELECT data->>'severity', COUNT(*) FROM status_incidents
+                WHERE type = 'incident' AND COALESCE(data->>'severity', '') <> ''
+                GROUP BY 1
+            """)
+            resolved = await conn.fetchrow("""
+                SELECT COUNT(*), COALESCE(SUM((data->>'resolution_time')::numeric - (data->>'start_time')::numeric), 0)
+                FROM status_incidents
+                WHERE type = 'incident' AND status = 'resolved'
+                AND COALESCE(data->>'start_time', '0') NOT IN ('', '0')
+                AND COALESCE(data->>'resolution_time', '0') NOT IN ('', '0')
+            """)
+        return {
+            'types': dict(map(tuple, types)),
+            'severities': dict(map(tuple, severities)),
+            'resolved': resolved[0],
+            'resolution_total': float(resolved[1]),
+        }
+
+    async def create(self, message_id: str, incident: dict) -> bool:
+        key = _message_key(message_id)
+        data = {k: v for k, v in incident.items() if k not in ('updates', 'version')}
+        async with self.pool.acquire() as conn:
+            async with conn.transaction():
+                inserted = await conn.fetchval("""
+                    INSERT INTO status_incidents (message_id, type, status, start_time, data)
+                    VALUES ($1, $2, $3, $4, $5::jsonb)
+                    ON CONFLICT (message_id) DO NOTHING
+                    RETURNING TRUE
+                """, key, *_row_columns(data), json.dumps(data))
+                if not inserted:
+                    return False
+
+                updates = sorted(incident.get('updates') or [], key=lambda u: int(u['timestamp']))
+                await conn.executemany("""
+                    INSERT INTO status_incident_updates (message_id, timestamp, status, description)
+                    VALUES ($1, $2, $3, $4)
+                """, [(key, int(u['timestamp']), u.get('status'), u['description']) for u in updates])
+        return True
+
+    async def _apply_fields(self, conn, key: int, fields: dict) -> bool:
+        """Merges fields into the locked row and bumps its version"""
+        data = await conn.fetchval(
+            "SELECT data FROM status_incidents WHERE message_id = $1 FOR UPDATE", key
+        )
+        if data is None:
+            return False
+        data = {**json.loads(data), **fields}
+        await conn.execute("""
+            UPDATE status_incidents
+            SET type = $2, status = $3, start_time = $4, data = $5::jsonb, version = version + 1
+            WHERE message_id = $1
+        """, key, *_row_columns(data), json.dumps(data))
+        return True
+
+    async def update_fields(self, message_id: str, fields: dict) -> Optional[dict]:
+        key = _message_key(message_id)
+        if key is None:
+            return None
+        async with self.pool.acquire() as conn:
+            async with conn.transaction():
+                if not await self._apply_fields(conn, key, fields):
+                    return None
+            return await self._fetch_one(conn, key)
+
+    async def add_update(self, message_id: str, update: dict, fields: Optional[dict] = None) -> Optional[dict]:
+        key = _message_key(message_id)
+        if key is None:
+            return None
+        async with self.pool.acquire() as conn:
+            async with conn.transaction():
+                if not await self._apply_fields(conn, key, fields or {}):
+                    return None
+                await conn.execute("""
+                    INSERT INTO status_incident_updates (message_id, timestamp, status, description)
+                    VALUES ($1, $2, $3, $4)
+                """, key, int(update['timestamp']), update.get('status'), update['description'])
+            return await self._fetch_one(conn, key)
+
+    async def delete_update(self, message_id: str, number: int) -> Optional[dict]:
+        key = _message_key(message_id)
+        if key is None:
+            return None
+        async with self.pool.acquire() as conn:
+            async with conn.transaction():
+                if not await self._apply_fields(conn, key, {}):
+                    return None
+                await conn.execute("""
+                    DELETE FROM status_incident_updates
+                    WHERE id = (
+                        SELECT id FROM status_incident_updates
+                        WHERE message_id = $1
+                        ORDER BY timestamp, id
+                        OFFSET $2 LIMIT 1
+                    )
+                """, key, number - 1)
+            return await self._fetch_one(conn, key)
+
+    async def delete(self, message_id: str):
+        key = _message_key(message_id)
+        if key is None:
+            return
+        async with self.pool.acquire() as conn:
+            await conn.execute("DELETE FROM status_incidents WHERE message_id = $1", key)
+
+
+class SQLiteIncidentStore(IncidentStore):
+    """Local fallback store; every sqlite call runs on the incident I/O thread"""
+
+    name = 'sqlite'
+
+    SCHEMA = f"""
+        CREATE TABLE IF NOT EXISTS status_incidents (
+            message_id INTEGER PRIMARY KEY,
+            type TEXT NOT NULL,
+            status TEXT NOT NULL,
+            start_time INTEGER NOT NULL DEFAULT 0,
+            version INTEGER NOT NULL DEFAULT 1,
+            data TEXT NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS status_incident_updates (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            message_id INTEGER NOT NULL REFERENCES status_incidents (message_id) ON DELETE CASCADE,
+            timestamp INTEGER NOT NULL,
+            status TEXT,
+            description TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_status_incidents_status
+            ON status_incidents (status);
+        CREATE INDEX IF NOT EXISTS idx_status_incidents_type_start
+            ON status_incidents (type, start_time DESC);
+        CREATE INDEX IF NOT EXISTS idx_status_incidents_active
+            ON status_incidents (type, start_time)
+            WHERE status NOT IN ({CLOSED_SQL});
+        CREATE INDEX IF NOT EXISTS idx_status_incident_updates_message
+            ON status_incident_updates (message_id, timestamp, id);
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.conn = None
+
+    async def _run(self, fn, *args):
+        return await incident_io.run(self._transaction, fn, *args)
+
+    def _transaction(self, fn, *args):
+        # One transaction per call, committed or rolled back by the connection context
+        with self.conn:
+            return fn(*args)
+
+    def _connect(self):
+        conn = sqlite3.connect(self.path, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.execute("PRAGMA foreign_keys = ON")
+        conn.executescript(self.SCHEMA)
+        return conn
+
+    async def open(self):
+        self.conn = await incident_io.run(self._connect)
+
+    async def close(self):
+        if self.conn:
+            await incident_io.run(self.conn.close)
+
+    def _records(self, rows) -> Dict[str, dict]:
+        keys = [row[0] for row in rows]
+        updates = {}
+        if keys:
+            placeholders = ", ".join("?" * len(keys))
+            update_rows = self.conn.execute(f"""
+                SELECT message_id, description, timestamp, status FROM status_incident_updates
+                WHERE message_id IN ({placeholders})
+                ORDER BY message_id, timestamp, id
+            """, keys).fetchall()
+            for key, group in groupby(update_rows, key=lambda row: row[0]):
+                updates[key] = [row[1:] for row in group]
+
+        return {
+            str(key): _build_record(json.loads(data), version, updates.get(key, []))
+            for key, data, version in rows
+        }
+
+    def _get(self, key: int) -> Optional[dict]:
+        rows = self.conn.execute(
+            "SELECT message_id, data, version FROM status_incidents WHERE message_id = ?", (key,)
+        ).fetchall()
+        return self._records(rows).get(str(key))
+
+    @staticmethod
+    def _filters(report_type: Optional[str], active: Optional[bool]) -> tuple:
+        clauses, args = [], []
+        if report_type:
+            clauses.append("type = ?")
+            args.append(report_type)
+        if active is True:
+            clauses.append(f"status NOT IN ({CLOSED_SQL})")
+        elif active is False:
+            clauses.append(f"status IN ({CLOSED_SQL})")
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        return where, args
+
+    def _get_many(self, keys: List[int]) -> Dict[str, dict]:
+        placeholders = ", ".join("?" * len(keys))
+        rows = self.conn.execute(
+            f"SELECT message_id, data, version FROM status_incidents WHERE message_id IN ({placeholders})", keys
+        ).fetchall()
+        return self._records(rows)
+
+    def _list(self, report_type, active, limit, newest_first, offset) -> Dict[str, dict]:
+        where, args = self._filters(report_type, active)
+        query = (f"SELECT message_id, data, version FROM status_incidents {where} "
+                 f"ORDER BY start_time {'DESC' if newest_first else 'ASC'}, message_id")
+        if limit or offset:
+            query += " LIMIT ? OFFSET ?"
+            args.extend((limit or -1, offset))
+        return self._records(self.conn.execute(query, args).fetchall())
+
+    def _count(self, report_type, active) -> int:
+        where, args = self._filters(report_type, active)
+        return self.conn.execute(f"SELECT COUNT(*) FROM status_incidents {where}", args).fetchone()[0]
+
+    def _stats(self) -> dict:
+        types = self.conn.execute("SELECT type, COUNT(*) FROM status_incidents GROUP BY type").fetchall()
+        severities = self.conn.execute("""
+            SELECT json_extract(data, '$.severity'), COUNT(*) FROM status_incidents
+            WHERE type = 'incident' AND COALESCE(json_extract(data, '$.severity'), '') <> ''
+            GROUP BY 1
+        """).fetchall()
+        resolved = self.conn.execute("""
+            SELECT COUNT(*), COALESCE(SUM(json_extract(data, '$.resolution_time') - json_extract(data, '$.start_time')), 0)
+            FROM status_incidents
+            WHERE type = 'incident' AND status = 'resolved'
+            AND COALESCE(json_extract(data, '$.start_time'), 0) NOT IN ('', 0)
+            AND COALESCE(json_extract(data, '$.resolution_time'), 0) NOT IN ('', 0)
+        """).fetchone()
+        return {
+            'types': dict(types),
+            'severities': dict(severities),
+            'resolved': resolved[0],
+            'resolution_total': float(resolved[1]),
+        }
+
+    def _create(self, key: int, incident: dict) -> bool:
+        data = {k: v for k, v in incident.items() if k not in ('updates', 'version')}
+        cursor = self.conn.execute("""
+            INSERT OR IGNORE INTO status_incidents (message_id, type, status, start_time, data)
+            VALUES (?, ?, ?, ?, ?)
+        """, (key, *_row_columns(data), json.dumps(data)))
+        if not cursor.rowcount:
+            return False
+
+        updates = sorted(incident.get('updates') or [], key=lambda u: int(u['timestamp']))
+        self.conn.executemany("""
+            INSERT INTO status_incident_updates (message_id, timestamp, status, description)
+            VALUES (?, ?, ?, ?)
+        """, [(key, int(u['timestamp']), u.get('status'), u['description']) for u in updates])
+        return True
+
+    def _apply_fields(self, key: int, fields: dict) -> bool:
+        row = self.conn.execute("SELECT data FROM status_incidents WHERE message_id = ?", (key,)).fetchone()
+        if row is None:
+            return False
+        data = {**json.loads(row[0]), **fields}
+        self.conn.execute("""
+            UPDATE status_incidents
+            SET type = ?, status = ?, start_time = ?, data = ?, version = version + 1
+            WHERE message_id = ?
+        """, (*_row_columns(data), json.dumps(data), key))
+        return True
+
+    def _update_fields(self, key: int, fields: dict) -> Optional[dict]:
+        if not self._apply_fields(key, fields):
+            return None
+        return self._get(key)
+
+    def _add_update(self, key: int, update: dict, fields: dict) -> Optional[dict]:
+        if not self._apply_fields(key, fields):
+            return None
+        self.conn.execute("""
+            INSERT INTO status_incident_updates (message_id, timestamp, status, description)
+            VALUES (?, ?, ?, ?)
+        """, (key, int(update['timestamp']), update.get('status'), update['description']))
+        return self._get(key)
+
+    def _delete_update(self, key: int, number: int) -> Optional[dict]:
+        if not self._apply_fields(key, {}):
+            return None
+        self.conn.execute("""
+            DELETE FROM status_incident_updates
+            WHERE id = (
+                SELECT id FROM status_incident_updates
+                WHERE message_id = ?
+                ORDER BY timestamp, id
+                LIMIT 1 OFFSET ?
+            )
+        """, (key, number - 1))
+        return self._get(key)
+
+    def _delete(self, key: int):
+        self.conn.execute("DELETE FROM status_incidents WHERE message_id = ?", (key,))
+
+    async def get(self, message_id: str) -> Optional[dict]:
+        key = _message_key(message_id)
+        return await self._run(self._get, key) if key is not None else None
+
+    async def get_many(self, message_ids: List[str]) -> Dict[str, dict]:
+        keys = [key for key in map(_message_key, message_ids) if key is not None]
+        return await self._run(self._get_many, keys) if keys else {}
+
+    async def list(self, report_type=None, active=None, limit=None, newest_first=True, offset=0) -> Dict[str, dict]:
+        return await self._run(self._list, report_type, active, limit, newest_first, offset)
+
+    async def count(self, report_type=None, active=None) -> int:
+        return await self._run(self._count, report_type, active)
+
+    async def stats(self) -> dict:
+        return await self._run(self._stats)
+
+    async def create(self, message_id: str, incident: dict) -> bool:
+        return await self._run(self._create, _message_key(message_id), incident)
+
+    async def update_fields(self, message_id: str, fields: dict) -> Optional[dict]:
+        key = _message_key(message_id)
+        return await self._run(self._update_fields, key, fields) if key is not None else None
+
+    async def add_update(self, message_id: str, update: dict, fields: Optional[dict] = None) -> Optional[dict]:
+        key = _message_key(message_id)
+        return await self._run(self._add_update, key, update, fields or {}) if key is not None else None
+
+    async def delete_update(self, message_id: str, number: int) -> Optional[dict]:
+        key = _message_key(message_id)
+        return await self._run(self._delete_update, key, number) if key is not None else None
+
+    async def delete(self, message_id: str):
+        key = _message_key(message_id)
+        if key is not None:
+            await self._run(self._delete, key)
+
+
+def _fsync_dir(path: str):
+    """Makes a rename in `path` durable (no-op where directories can't be opened)"""
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+class JournalIncidentStore(IncidentStore):
+    """
+    In-memory incident state backed by an append-only journal of change events.
+
+    Each change is one fsync'd JSON line (created, fields_changed, update_added,
+    update_deleted, deleted). Every INCIDENT_JOURNAL_COMPACT_EVERY events the state
+    is written to a snapshot (temp file + rename) and the journal truncated, so a
+    restart replays at most that many events.
+    """
+
+    name = 'journal'
+
+    def __init__(self, path: str, snapshot_path: str):
+        self.path = path
+        self.snapshot_path = snapshot_path
+        # message_id -> {'data': {...}, 'version': n, 'updates': [[description, timestamp, status, seq], ...]}
+        self.state: Dict[str, dict] = {}
+        self.seq = 0
+        self.pending = 0  # events appended since the last snapshot
+        self.journal = None
+        self.lock = asyncio.Lock()
+
+    def _load(self):
+        snapshot_seq = 0
+        if os.path.exists(self.snapshot_path):
+            snapshot = _read_json(self.snapshot_path)
+            self.state = snapshot['incidents']
+            self.seq = snapshot_seq = snapshot['seq']
+
+        if os.path.exists(self.path):
+            with open(self.path, 'rb') as f:
+                for line in f:
+                    try:
+                        event = json.loads(line)
+                    except ValueError:
+                        # Torn write from a crash mid-append, it was never acknowledged
+                        print(f"Ignoring incomplete event at the end of {self.path}")
+                        break
+                    # Already in the snapshot if we crashed before truncating the journal
+                    if event['seq'] <= snapshot_seq:
+                        continue
+                    self._apply(event)
+                    self.seq = event['seq']
+                    self.pending += 1
+
+        self.journal = open(self.path, 'ab')
+        # Start from a clean journal, this also drops any torn tail
+        if self.pending or self.journal.tell():
+            self._compact()
+
+    def _apply(self, event: dict):
+        key = event['id']
+        kind = event['event']
+
+        if kind == 'created':
+            updates = sorted(event['updates'], key=lambda u: u[1])
+            self.state[key] = {
+                'data': event['data'],
+                'version': 1,
+                'updates': [[*update, event['seq']] for update in updates],
+            }
+            return
+        if kind == 'deleted':
+            self.state.pop(key, None)
+            return
+
+        record = self.state.get(key)
+        if record is None:
+            return
+
+        record['data'].update(event.get('fields') or {})
+        if kind == 'update_added':
+            record['updates'].append([*event['update'], event['seq']])
+            record['updates'].sort(key=lambda u: (u[1], u[3]))
+        elif kind == 'update_deleted':
+            index = event['number'] - 1
+            if 0 <= index < len(record['updates']):
+                del record['updates'][index]
+        record['version'] += 1
+
+    def _append(self, line: bytes):
+        position = self.journal.tell()
+        try:
+            self.journal.write(line)
+            self.journal.flush()
+            os.fsync(self.journal.fileno())
+        except Exception:
+            # Don't leave a partial line for the next append to run into
+            self.journal.truncate(position)
+            raise
+
+    def _compact(self):
+        snapshot = json.dumps({'seq': self.seq, 'incidents': self.state})
+        temp_path = f"{self.snapshot_path}.tmp"
+        with open(temp_path, 'w') as f:
+            f.write(snapshot)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, self.snapshot_path)
+        _fsync_dir(os.path.dirname(os.path.abspath(self.snapshot_path)))
+
+        # Events up to self.seq are skipped on replay, so a crash here loses nothing
+        self.journal.truncate(0)
+        os.fsync(self.journal.fileno())
+        self.pending = 0
+
+    async def _commit(self, event: dict):
+        """Appends an event, then applies it. Callers hold self.lock"""
+        event['seq'] = self.seq + 1
+        await incident_io.run(self._append, (json.dumps(event) + '\n').encode())
+        self.seq = event['seq']
+        self._apply(event)
+
+        self.pending += 1
+        if self.pending >= INCIDENT_JOURNAL_COMPACT_EVERY:
+            # Writers wait on the lock, so the state can't change while it's serialized
+            try:
+                await incident_io.run(self._compact)
+            except Exception as e:
+                # The event is durable in the journal, compaction is retried on the next one
+                print(f"Could not snapshot incident journal: {e}")
+
+    async def open(self):
+        await incident_io.run(self._load)
+
+    async def close(self):
+        if self.journal:
+            async with self.lock:
+                await incident_io.run(self._compact)
+                await incident_io.run(self.journal.close)
+                self.journal = None
+
+    def _record(self, key: str) -> Optional[dict]:
+        record = self.state.get(key)
+        if record is None:
+            return None
+        # Copied so callers can't mutate the state behind the journal's back
+        return _build_record(
+            json.loads(json.dumps(record['data'])),
+            record['version'],
+            [update[:3] for update in record['updates']]
+        )
+
+    def _matching(self, report_type: Optional[str], active: Optional[bool]) -> List[str]:
+        keys = []
+        for key, record in self.state.items():
+            data = record['data']
+            if report_type and data.get('type', 'incident') != report_type:
+                continue
+            if active is not None and (data.get('status') not in CLOSED_STATUSES) != active:
+                continue
+            keys.append(key)
+        return keys
+
+    async def get(self, message_id: str) -> Optional[dict]:
+        key = _message_key(message_id)
+        return self._record(str(key)) if key is not None else None
+
+    async def get_many(self, message_ids: List[str]) -> Dict[str, dict]:
+        keys = {str(key) for key in map(_message_key, message_ids) if key is not None}
+        return {key: self._record(key) for key in keys if key in self.state}
+
+    async def list(self, report_type=None, active=None, limit=None, newest_first=True, offset=0) -> Dict[str, dict]:
+        keys = sorted(self._matching(report_type, active), key=int)
+        keys.sort(key=lambda k: _sort_time(self.state[k]['data']), reverse=newest_first)
+        keys = keys[offset:offset + limit] if limit else keys[offset:]
+        return {key: self._record(key) for key in keys}
+
+    async def count(self, report_type=None, active=None) -> int:
+        return len(self._matching(report_type, active))
+
+    async def stats(self) -> dict:
+        stats = {'types': {}, 'severities': {}, 'resolved': 0, 'resolution_total': 0.0}
+        for record in self.state.values():
+            data = record['data']
+            report_type = data.get('type', 'incident')
+            stats['types'][report_type] = stats['types'].get(report_type, 0) + 1
+            if report_type != 'incident':
+                continue
+            if data.get('severity'):
+                stats['severities'][data['severity']] = stats['severities'].get(data['severity'], 0) + 1
+            if data.get('status') == 'resolved' and data.get('start_time') and data.get('resolution_time'):
+                stats['resolved'] += 1
+                stats['resolution_total'] += data['resolution_time'] - data['start_time']
+        return stats
+
+    async def create(self, message_id: str, incident: dict) -> bool:
+        key = str(_message_key(message_id))
+        data = {k: v for k, v in incident.items() if k not in ('updates', 'version')}
+        updates = [
+            [u['description'], int(u['timestamp']), u.get('status')]
+            for u in incident.get('updates') or []
+        ]
+        async with self.lock:
+            if key in self.state:
+                return False
+            await self._commit({'event': 'created', 'id': key, 'data': data, 'updates': updates})
+        return True
+
+    async def _change(self, message_id: str, event: dict) -> Optional[dict]:
+        key = _message_key(message_id)
+        if key is None:
+            return None
+        key = str(key)
+        async with self.lock:
+            if key not in self.state:
+                return None
+            await self._commit({**event, 'id': key})
+            return self._record(key)
+
+    async def update_fields(self, message_id: str, fields: dict) -> Optional[dict]:
+        return await self._change(message_id, {'event': 'fields_changed', 'fields': fields})
+
+    async def add_update(self, message_id: str, update: dict, fields: Optional[dict] = None) -> Optional[dict]:
+        return await self._change(message_id, {
+            'event': 'update_added',
+            'update': [update['description'], int(update['timestamp']), update.get('status')],
+            'fields': fields or {},
+        })
+
+    async def delete_update(self, message_id: str, number: int) -> Optional[dict]:
+        return await self._change(message_id, {'event': 'update_deleted', 'number': number})
+
+    async def delete(self, message_id: str):
+        await self._change(message_id, {'event': 'deleted'})
+
+
+async def get_systems_pool(bot) -> asyncpg.Pool:
+    """ModdySystems pool of the tickets cog (loaded first if needed, it applies the migrations)"""
+    if 'cogs.tickets' not in bot.extensions:
+        await bot.load_extension('cogs.tickets')
+
+    from cogs.tickets import db
+    if not db.systems_pool:
+        raise RuntimeError("ModdySystems database is not connected")
+    return db.systems_pool
+
+
+async def open_incident_store(bot) -> IncidentStore:
+    """Opens the backend picked by INCIDENT_STORE (auto: ModdySystems DB, else SQLite)"""
+    if INCIDENT_STORE == 'journal':
+        store = JournalIncidentStore(INCIDENT_JOURNAL_PATH, INCIDENT_SNAPSHOT_PATH)
+        await store.open()
+        return store
+
+    if os.getenv('DATABASE_URL') and INCIDENT_STORE != 'sqlite':
+        try:
+            store = PostgresIncidentStore(await get_systems_pool(bot))
+            await store.open()
+            return store
+        except Exception as e:
+            print(f"Could not open incident store in the ModdySystems database, using SQLite: {e}")
+
+    store = SQLiteIncidentStore(INCIDENT_DB_PATH)
+    await store.open()
+    return store
+
+
+# Opened in Status.cog_load
+incident_store: Optional[IncidentStore] = None
 
 
 class IncidentModal(ui.Modal):
@@ -270,71 +1102,17 @@ class MentionsView(discord.ui.View):
             )
             return
 
-        # Create the V2 components view
-        view = ui.LayoutView()
-        container = ui.Container()
-
-        if self.report_type == 'incident':
-            # Get status emoji and text
-            emoji, status_text = get_status_emoji_and_text(self.data['status'])
-
-            # Title with status
-            title_text = f"{emoji} **{self.data['title']} — {status_text}**"
-
-            # Build the main content
-            content_parts = [
-                title_text,
-                f"* **Issue:** {self.data['issue']}",
-                f"* **Type:** `Incident`",
-                f"* **Severity:** `{self.data['severity']}`",
-                f"* **Affected services:** `{self.data['services']}`",
-                f"* **Status:** `{status_text}`",
-                f"* **ETA:** `{self.data['eta']}`",
-                f"* **Started:** <t:{self.data['start_time']}:F>"
-            ]
-        else:
-            # Maintenance
-            emoji, status_text = get_status_emoji_and_text(self.data['status'], True)
-
-            title_text = f"{emoji} **Scheduled Maintenance: {self.data['title']}**"
-
-            content_parts = [
-                title_text,
-                f"* **Description:** {self.data['description']}",
-                f"* **Type:** `Maintenance`",
-                f"* **Affected services:** `{self.data['services']}`",
-                f"* **Status:** `{status_text}`",
-                f"* **Scheduled time:** <t:{self.data['scheduled_time']}:F> (<t:{self.data['scheduled_time']}:R>)",
-                f"* **Expected duration:** `{self.data['duration']}`"
-            ]
-
-        if self.status_link:
-            content_parts.append(f"* **Status link:** {self.status_link}")
-
         # Add status ID
         status_id = f"{datetime.now().strftime('%Y%m%d')}{int(datetime.now().timestamp()) % 10000:04d}"
-        content_parts.append(f"* **Status ID:** `#{status_id}`")
-
-        container.add_item(ui.TextDisplay('\n'.join(content_parts)))
-
-        # Separator
-        container.add_item(ui.Separator(spacing=discord.SeparatorSpacing.large))
 
-        # Updates section
-        container.add_item(ui.TextDisplay("*Updates will be edited in this message*"))
+        self.data['updates'] = []
+        self.data['type'] = self.report_type
+        self.data['status_link'] = self.status_link
+        self.data['mentions'] = self.mentions
+        self.data['status_id'] = status_id
 
-        # Footer with mentions
-        if self.mentions:
-            # To support V2 components, mentions must be in the view content, not the message content field.
-            # The mention is included in the line below, so a separate raw mention display is not needed.
-            # This prevents a second, large mention from appearing.
-
-            mentions_text = " / ".join(self.mentions)
-            container.add_item(ui.TextDisplay(f"-# {mentions_text}"))
-        else:
-            container.add_item(ui.TextDisplay("-# Status updates"))
-
-        view.add_item(container)
+        # Not stored yet, so not memoized: the first update renders it from the store
+        view, digest = report_renderer.render(self.data)
 
         # Prepare allowed mentions
         allowed_mentions = discord.AllowedMentions(
@@ -349,23 +1127,11 @@ class MentionsView(discord.ui.View):
                 allowed_mentions=allowed_mentions
             )
 
-            # Store incident data
-            self.data['updates'] = []
-            self.data['type'] = self.report_type
-            self.data['status_link'] = self.status_link
-            self.data['mentions'] = self.mentions
-            self.data['status_id'] = status_id
-
-            # Save to JSON
-            incidents = {}
-            if os.path.exists('incidents.json'):
-                with open('incidents.json', 'r') as f:
-                    incidents = json.load(f)
-
-            incidents[str(message.id)] = self.data
+            await incident_store.create(str(message.id), self.data)
 
-            with open('incidents.json', 'w') as f:
-                json.dump(incidents, f, indent=2)
+            cog = interaction.client.get_cog('Status')
+            if cog:
+                cog.render_hashes[str(message.id)] = digest
 
             await interaction.response.edit_message(
                 content=f"✅ {self.report_type.capitalize()} created successfully!\n"
@@ -437,7 +1203,7 @@ class RoleMentionModal(ui.Modal):
 
 
 class UpdateModal(ui.Modal):
-    def __init__(self, message_id: str):
+    def __init__(self, message_id: str, report_type: Optional[str] = None):
         super().__init__(title="Add Update")
         self.message_id = message_id
 
@@ -449,15 +1215,9 @@ class UpdateModal(ui.Modal):
             max_length=500
         )
 
-        # Load current incident to show status options
-        incident = {}
-        if os.path.exists('incidents.json'):
-            with open('incidents.json', 'r') as f:
-                incidents = json.load(f)
-                incident = incidents.get(message_id, {})
-
-        status_placeholder = "investigating/monitoring/resolved" if incident.get(
-            'type') == 'incident' else "in_progress/completed"
+        # The report type is looked up by the caller, modals can't await
+        status_placeholder = "investigating/monitoring/resolved" if report_type == 'incident' \
+            else "in_progress/completed"
 
         self.new_status = ui.TextInput(
             label="New Status (optional)",
@@ -487,48 +1247,37 @@ class UpdateModal(ui.Modal):
         self.add_item(self.timestamp)
 
     async def on_submit(self, interaction: discord.Interaction):
-        # Load incident data
-        incidents = {}
-        if os.path.exists('incidents.json'):
-            with open('incidents.json', 'r') as f:
-                incidents = json.load(f)
+        timestamp = self.timestamp.value.strip() or str(int(datetime.now().timestamp()))
+        if not timestamp.isdigit():
+            await interaction.response.send_message("❌ Timestamp must be a Unix timestamp!", ephemeral=True)
+            return
 
-        if self.message_id not in incidents:
+        incident = await incident_store.get(self.message_id)
+        if not incident:
             await interaction.response.send_message("❌ Report not found!", ephemeral=True)
             return
 
-        incident = incidents[self.message_id]
+        fields = {}
 
         # Update status if provided
         if self.new_status.value:
-            incident['status'] = self.new_status.value.lower().replace(" ", "_")
+            fields['status'] = self.new_status.value.lower().replace(" ", "_")
+
+        # Update ETA if provided
+        if self.eta.value:
+            fields['eta'] = self.eta.value
 
-        # Add the update
-        timestamp = self.timestamp.value or str(int(datetime.now().timestamp()))
+        # Updates are numbered by timestamp when the report is read back
         update = {
             'description': self.description.value,
             'timestamp': timestamp,
-            'number': len(incident['updates']) + 1,
-            'status': incident['status']
+            'status': fields.get('status', incident['status'])
         }
 
-        # Update ETA if provided
-        if self.eta.value:
-            incident['eta'] = self.eta.value
-
-        incident['updates'].append(update)
-
-        # Sort updates by timestamp
-        incident['updates'].sort(key=lambda x: int(x['timestamp']))
-
-        # Re-number updates after sorting
-        for i, upd in enumerate(incident['updates'], 1):
-            upd['number'] = i
-
-        # Save data
-        incidents[self.message_id] = incident
-        with open('incidents.json', 'w') as f:
-            json.dump(incidents, f, indent=2)
+        incident = await incident_store.add_update(self.message_id, update, fields)
+        if not incident:
+            await interaction.response.send_message("❌ Report not found!", ephemeral=True)
+            return
 
         # Update the message
         await self.update_message(interaction, incident)
@@ -547,87 +1296,9 @@ class UpdateModal(ui.Modal):
             return
 
         # Recreate the view with updates
-        view = ui.LayoutView()
-        container = ui.Container()
-
+        view, digest = report_renderer.render(incident, self.message_id)
         is_maintenance = incident.get('type') == 'maintenance'
-
-        # Get status emoji and text
-        emoji, status_text = get_status_emoji_and_text(incident['status'], is_maintenance)
-
-        if not is_maintenance:
-            # Calculate duration if resolved
-            duration_text = ""
-            if incident['status'] == 'resolved' and incident.get('start_time'):
-                duration = format_duration(incident['start_time'])
-                duration_text = f" (Duration: {duration})"
-
-            # Title with status
-            title_text = f"{emoji} **{incident['title']} — {status_text}**{duration_text}"
-
-            content_parts = [
-                title_text,
-                f"* **Issue:** {incident['issue']}",
-                f"* **Type:** `Incident`",
-                f"* **Severity:** `{incident.get('severity', 'Major')}`",
-                f"* **Affected services:** `{incident['services']}`",
-                f"* **Status:** `{status_text}`",
-                f"* **ETA:** `{incident.get('eta', 'TBD')}`",
-                f"* **Started:** <t:{incident['start_time']}:F>"
-            ]
-        else:
-            # Maintenance
-            title_text = f"{emoji} **Maintenance: {incident['title']}**"
-            if incident['status'] == 'completed':
-                title_text = f"{emoji} **Maintenance: {incident['title']} — Completed**"
-
-            content_parts = [
-                title_text,
-                f"* **Description:** {incident['description']}",
-                f"* **Type:** `Maintenance`",
-                f"* **Affected services:** `{incident['services']}`",
-                f"* **Status:** `{status_text}`"
-            ]
-
-            if incident.get('scheduled_time'):
-                content_parts.append(f"* **Scheduled time:** <t:{incident['scheduled_time']}:F>")
-            if incident.get('duration'):
-                content_parts.append(f"* **Expected duration:** `{incident['duration']}`")
-
-        if incident.get('status_link'):
-            content_parts.append(f"* **Status link:** {incident['status_link']}")
-
-        if incident.get('status_id'):
-            content_parts.append(f"* **Status ID:** `#{incident['status_id']}`")
-
-        container.add_item(ui.TextDisplay('\n'.join(content_parts)))
-
-        # Separator
-        container.add_item(ui.Separator(spacing=discord.SeparatorSpacing.large))
-
-        # Add updates
-        if incident['updates']:
-            update_texts = []
-            for upd in incident['updates']:
-                upd_status = upd.get('status', incident['status'])
-                upd_emoji, upd_status_text = get_status_emoji_and_text(upd_status, is_maintenance)
-                update_texts.append(
-                    f"> {upd_emoji} **Update {upd['number']} — {upd_status_text}, <t:{upd['timestamp']}:R>:**\n"
-                    f"> {upd['description']}"
-                )
-            container.add_item(ui.TextDisplay('\n'.join(update_texts)))
-
-            # Add separator before footer
-            container.add_item(ui.Separator(spacing=discord.SeparatorSpacing.large))
-
-        # Footer
-        container.add_item(ui.TextDisplay("*Updates will be edited in this message*"))
-
-        if incident.get('mentions'):
-            mentions_text = " / ".join(incident['mentions'])
-            container.add_item(ui.TextDisplay(f"-# {mentions_text}"))
-
-        view.add_item(container)
+        _, status_text = get_status_emoji_and_text(incident['status'], is_maintenance)
 
         # Edit the message
         await message.edit(view=view)
@@ -635,6 +1306,7 @@ class UpdateModal(ui.Modal):
         # Manage pin status based on incident status
         cog = interaction.client.get_cog('Status')
         if cog:
+            cog.render_hashes[self.message_id] = digest
             await cog.pin_incident_message(message, incident)
 
         # Send confirmation with update summary
@@ -655,12 +1327,26 @@ class Status(commands.Cog):
 
     def __init__(self, bot):
         self.bot = bot
+        # message_id -> digest of the last render posted, for auto_update
+        self.render_hashes: Dict[str, str] = {}
         self.auto_update.start()
         # Load and sync incidents on startup
         self.bot.loop.create_task(self.sync_incidents_on_startup())
 
-    def cog_unload(self):
+    async def cog_load(self):
+        global incident_store
+        incident_store = await open_incident_store(self.bot)
+        print(f"Incident store ready ({incident_store.name})")
+
+        imported = await incident_store.import_json(INCIDENTS_JSON_PATH)
+        if imported:
+            print(f"Imported {imported} reports from {INCIDENTS_JSON_PATH}")
+
+    async def cog_unload(self):
         self.auto_update.cancel()
+        if incident_store:
+            await incident_store.close()
+        incident_io.shutdown()
 
     async def sync_incidents_on_startup(self):
         """Sync all incidents from the status channel on bot startup"""
@@ -673,36 +1359,33 @@ class Status(commands.Cog):
 
         print(f"Syncing incidents from channel {channel.name}...")
 
-        # Load existing incidents file
-        incidents = {}
-        if os.path.exists('incidents.json'):
-            with open('incidents.json', 'r') as f:
-                incidents = json.load(f)
-
-        # Get all pinned messages to track active incidents
         try:
+            # Only active reports need a pin, and only pinned messages can be wrongly pinned
+            active = await incident_store.list(active=True)
+
+            # Get all pinned messages to track active incidents
             pinned_messages = await channel.pins()
             pinned_ids = {str(msg.id) for msg in pinned_messages}
 
-            # Update status of incidents based on pin status
-            for msg_id in list(incidents.keys()):
-                if msg_id in pinned_ids:
-                    # Message is pinned, ensure it's not marked as resolved
-                    if incidents[msg_id].get('status') == 'resolved':
-                        print(f"Warning: Incident {msg_id} is pinned but marked as resolved")
-                else:
-                    # Message is not pinned, check if it should be
-                    if incidents[msg_id].get('status') not in ['resolved', 'completed', 'cancelled']:
-                        try:
-                            message = await channel.fetch_message(int(msg_id))
-                            if message:
-                                await message.pin()
-                                print(f"Re-pinned active incident {msg_id}")
-                        except:
-                            print(f"Could not find or pin message {msg_id}")
+            # Pinned messages must not be marked as resolved
+            for msg_id, incident in (await incident_store.get_many(list(pinned_ids))).items():
+                if incident.get('status') == 'resolved':
+                    print(f"Warning: Incident {msg_id} is pinned but marked as resolved")
+
+            # Active reports whose message is not pinned
+            for msg_id in active.keys() - pinned_ids:
+                try:
+                    message = await channel.fetch_message(int(msg_id))
+                    if message:
+                        await message.pin()
+                        print(f"Re-pinned active incident {msg_id}")
+                except:
+                    print(f"Could not find or pin message {msg_id}")
 
             # Scan recent messages for any incidents not in our database
-            async for message in channel.history(limit=100):
+            history = [message async for message in channel.history(limit=100)]
+            incidents = await incident_store.get_many([str(message.id) for message in history])
+            for message in history:
                 msg_id = str(message.id)
 
                 # Check if this is an incident/maintenance message by looking for our format
@@ -726,13 +1409,10 @@ class Status(commands.Cog):
                             'recovered': True,
                             'message_id': msg_id
                         }
+                        await incident_store.create(msg_id, incident_data)
                         incidents[msg_id] = incident_data
 
-            # Save updated incidents
-            with open('incidents.json', 'w') as f:
-                json.dump(incidents, f, indent=2)
-
-            print(f"Incident sync complete. Tracking {len(incidents)} incidents/maintenances")
+            print(f"Incident sync complete. Tracking {await incident_store.count()} incidents/maintenances")
 
         except Exception as e:
             print(f"Error during incident sync: {e}")
@@ -740,7 +1420,7 @@ class Status(commands.Cog):
     async def pin_incident_message(self, message: discord.Message, incident: dict):
         """Pin or unpin a message based on incident status"""
         try:
-            is_active = incident['status'] not in ['resolved', 'completed', 'cancelled']
+            is_active = incident['status'] not in CLOSED_STATUSES
 
             if is_active and not message.pinned:
                 await message.pin()
@@ -753,27 +1433,32 @@ class Status(commands.Cog):
 
     @tasks.loop(minutes=5)
     async def auto_update(self):
-        """Auto-update incident durations"""
-        if not os.path.exists('incidents.json'):
-            return
-
-        with open('incidents.json', 'r') as f:
-            incidents = json.load(f)
-
+        """Re-renders active incidents, editing only messages whose content changed"""
         channel = self.bot.get_channel(STATUS_CHANNEL_ID)
         if not channel:
             return
 
+        incidents = await incident_store.list('incident', active=True)
+
         for message_id, incident in incidents.items():
-            # Only update ongoing incidents
-            if incident.get('type') == 'incident' and incident['status'] not in ['resolved', 'closed']:
-                try:
-                    message = await channel.fetch_message(int(message_id))
-                    # Re-render the message to update relative times
-                    modal = UpdateModal(message_id)
-                    # This will update the relative timestamps
-                except:
-                    continue
+            # Recovered reports only have placeholder fields, don't overwrite their message
+            if incident.get('recovered'):
+                continue
+
+            view, digest = report_renderer.render(incident, message_id)
+            if self.render_hashes.get(message_id) == digest:
+                continue
+
+            try:
+                # Editing through a partial message skips the fetch
+                await channel.get_partial_message(int(message_id)).edit(view=view)
+                self.render_hashes[message_id] = digest
+            except discord.HTTPException as e:
+                print(f"Could not refresh status message {message_id}: {e}")
+
+        # Reports that are no longer active aren't refreshed anymore
+        for message_id in set(self.render_hashes) - set(incidents):
+            del self.render_hashes[message_id]
 
     @auto_update.before_loop
     async def before_auto_update(self):
@@ -790,23 +1475,22 @@ class Status(commands.Cog):
             await interaction.followup.send("❌ Status channel not found!", ephemeral=True)
             return
 
-        # Load existing incidents
-        incidents = {}
-        if os.path.exists('incidents.json'):
-            with open('incidents.json', 'r') as f:
-                incidents = json.load(f)
+        # Active reports should be pinned, closed ones only matter while their message still is
+        incidents = await incident_store.list(active=True)
+        pinned_ids = {str(msg.id) for msg in await channel.pins()}
+        incidents.update(await incident_store.get_many(list(pinned_ids - incidents.keys())))
 
         synced = 0
         errors = 0
 
-        # Check all messages in incidents.json
+        # Check every report that may need a pin change
         for msg_id in list(incidents.keys()):
             try:
                 message = await channel.fetch_message(int(msg_id))
                 incident = incidents[msg_id]
 
                 # Update pin status
-                is_active = incident['status'] not in ['resolved', 'completed', 'cancelled']
+                is_active = incident['status'] not in CLOSED_STATUSES
 
                 if is_active and not message.pinned:
                     await message.pin()
@@ -817,19 +1501,17 @@ class Status(commands.Cog):
 
             except discord.NotFound:
                 print(f"Message {msg_id} not found, removing from database")
+                await incident_store.delete(msg_id)
                 del incidents[msg_id]
                 errors += 1
             except Exception as e:
                 print(f"Error syncing {msg_id}: {e}")
                 errors += 1
 
-        # Save updated incidents
-        with open('incidents.json', 'w') as f:
-            json.dump(incidents, f, indent=2)
-
+        tracked = await incident_store.count()
         embed = discord.Embed(
             title="✅ Sync Complete",
-            description=f"**Synced:** {synced} messages\n**Errors:** {errors}\n**Total tracked:** {len(incidents)}",
+            description=f"**Synced:** {synced} messages\n**Errors:** {errors}\n**Total tracked:** {tracked}",
             color=discord.Color.green(),
             timestamp=datetime.now()
         )
@@ -849,7 +1531,12 @@ class Status(commands.Cog):
     @app_commands.describe(message_id="The message ID of the incident to update")
     async def incident_update(self, interaction: discord.Interaction, message_id: str):
         """Add an update to an existing incident"""
-        modal = UpdateModal(message_id)
+        incident = await incident_store.get(message_id)
+        if not incident:
+            await interaction.response.send_message("❌ Incident not found!", ephemeral=True)
+            return
+
+        modal = UpdateModal(message_id, incident.get('type', 'incident'))
         await interaction.response.send_modal(modal)
 
     @incident_group.command(name="status", description="Quick status change")
@@ -869,31 +1556,19 @@ class Status(commands.Cog):
     ])
     async def incident_status(self, interaction: discord.Interaction, message_id: str, status: str):
         """Quick status update without adding an update entry"""
-        # Load incident data
-        incidents = {}
-        if os.path.exists('incidents.json'):
-            with open('incidents.json', 'r') as f:
-                incidents = json.load(f)
-
-        if message_id not in incidents:
-            await interaction.response.send_message("❌ Incident not found!", ephemeral=True)
-            return
-
-        incident = incidents[message_id]
-        old_status = incident['status']
-        incident['status'] = status
+        fields = {'status': status}
 
         # If resolving, update ETA
         if status == 'resolved':
-            incident['eta'] = 'Resolved'
+            fields['eta'] = 'Resolved'
 
-        # Save data
-        incidents[message_id] = incident
-        with open('incidents.json', 'w') as f:
-            json.dump(incidents, f, indent=2)
+        incident = await incident_store.update_fields(message_id, fields)
+        if not incident:
+            await interaction.response.send_message("❌ Incident not found!", ephemeral=True)
+            return
 
         # Update the message
-        modal = UpdateModal(message_id)
+        modal = UpdateModal(message_id, incident.get('type', 'incident'))
         await modal.update_message(interaction, incident)
 
     @incident_group.command(name="delete_update", description="Delete an update from an incident")
@@ -903,79 +1578,52 @@ class Status(commands.Cog):
     )
     async def incident_delete_update(self, interaction: discord.Interaction, message_id: str, update_number: int):
         """Delete a specific update from an incident"""
-        # Load incident data
-        incidents = {}
-        if os.path.exists('incidents.json'):
-            with open('incidents.json', 'r') as f:
-                incidents = json.load(f)
-
-        if message_id not in incidents:
+        incident = await incident_store.get(message_id)
+        if not incident:
             await interaction.response.send_message("❌ Incident not found!", ephemeral=True)
             return
 
-        incident = incidents[message_id]
-
         # Find and remove the update
         if update_number <= 0 or update_number > len(incident['updates']):
             await interaction.response.send_message("❌ Invalid update number!", ephemeral=True)
             return
 
-        # Remove the update
-        incident['updates'] = [u for u in incident['updates'] if u['number'] != update_number]
-
-        # Re-number remaining updates
-        for i, upd in enumerate(incident['updates'], 1):
-            upd['number'] = i
-
-        # Save data
-        incidents[message_id] = incident
-        with open('incidents.json', 'w') as f:
-            json.dump(incidents, f, indent=2)
+        # Remaining updates are re-numbered when read back
+        incident = await incident_store.delete_update(message_id, update_number)
+        if not incident:
+            await interaction.response.send_message("❌ Incident not found!", ephemeral=True)
+            return
 
         # Update the message
-        modal = UpdateModal(message_id)
+        modal = UpdateModal(message_id, incident.get('type', 'incident'))
         await modal.update_message(interaction, incident)
 
     @incident_group.command(name="list", description="List all active incidents")
     async def incident_list(self, interaction: discord.Interaction):
         """List all active incidents with their status"""
-        if not os.path.exists('incidents.json'):
-            await interaction.response.send_message("📊 No incidents recorded.", ephemeral=True)
-            return
+        active_count = await incident_store.count('incident', active=True)
+        resolved_count = await incident_store.count('incident', active=False)
 
-        with open('incidents.json', 'r') as f:
-            incidents = json.load(f)
-
-        if not incidents:
+        if not active_count and not resolved_count:
             await interaction.response.send_message("📊 No incidents recorded.", ephemeral=True)
             return
 
-        # Filter and categorize incidents
-        active_incidents = []
-        resolved_incidents = []
-
-        for msg_id, incident in incidents.items():
-            if incident.get('type') != 'incident':
-                continue
-
-            emoji, status_text = get_status_emoji_and_text(incident['status'])
-            entry = {
-                'id': incident.get('status_id', 'N/A'),
-                'title': incident['title'],
-                'status': status_text,
-                'emoji': emoji,
-                'message_id': msg_id,
-                'start_time': incident.get('start_time', 0)
-            }
-
-            if incident['status'] == 'resolved':
-                resolved_incidents.append(entry)
-            else:
-                active_incidents.append(entry)
-
-        # Sort by start time (newest first)
-        active_incidents.sort(key=lambda x: x['start_time'], reverse=True)
-        resolved_incidents.sort(key=lambda x: x['start_time'], reverse=True)
+        def entries(incidents: Dict[str, dict]) -> List[dict]:
+            result = []
+            for msg_id, incident in incidents.items():
+                emoji, status_text = get_status_emoji_and_text(incident['status'])
+                result.append({
+                    'id': incident.get('status_id', 'N/A'),
+                    'title': incident['title'],
+                    'status': status_text,
+                    'emoji': emoji,
+                    'message_id': msg_id
+                })
+            return result
+
+        # Newest first, only as many as the embed shows
+        active_incidents = entries(await incident_store.list('incident', active=True, limit=10))
+        resolved_incidents = entries(await incident_store.list('incident', active=False, limit=5))
 
         # Create embed
         embed = discord.Embed(
@@ -987,7 +1635,7 @@ class Status(commands.Cog):
         # Add active incidents
         if active_incidents:
             active_text = []
-            for inc in active_incidents[:10]:  # Show max 10
+            for inc in active_incidents:  # Show max 10
                 active_text.append(
                     f"{inc['emoji']} **{inc['title'][:30]}**\n"
                     f"└ ID: `{inc['id']}` | Status: `{inc['status']}`"
@@ -1007,7 +1655,7 @@ class Status(commands.Cog):
         # Add recent resolved
         if resolved_incidents:
             resolved_text = []
-            for inc in resolved_incidents[:5]:  # Show max 5
+            for inc in resolved_incidents:  # Show max 5
                 resolved_text.append(f"{inc['emoji']} {inc['title'][:40]}")
             embed.add_field(
                 name="📝 Recently Resolved",
@@ -1016,9 +1664,9 @@ class Status(commands.Cog):
             )
 
         # Add statistics
-        total_incidents = len(active_incidents) + len(resolved_incidents)
+        total_incidents = active_count + resolved_count
         embed.set_footer(
-            text=f"Total: {total_incidents} | Active: {len(active_incidents)} | Resolved: {len(resolved_incidents)}"
+            text=f"Total: {total_incidents} | Active: {active_count} | Resolved: {resolved_count}"
         )
 
         await interaction.response.send_message(embed=embed, ephemeral=True)
@@ -1033,7 +1681,12 @@ class Status(commands.Cog):
     @app_commands.describe(message_id="The message ID of the maintenance to update")
     async def maintenance_update(self, interaction: discord.Interaction, message_id: str):
         """Add an update to an existing maintenance"""
-        modal = UpdateModal(message_id)
+        incident = await incident_store.get(message_id)
+        if not incident:
+            await interaction.response.send_message("❌ Maintenance not found!", ephemeral=True)
+            return
+
+        modal = UpdateModal(message_id, incident.get('type', 'incident'))
         await interaction.response.send_modal(modal)
 
     @maintenance_group.command(name="status", description="Quick maintenance status change")
@@ -1051,26 +1704,13 @@ class Status(commands.Cog):
     ])
     async def maintenance_status(self, interaction: discord.Interaction, message_id: str, status: str):
         """Quick status update for maintenance"""
-        # Load data
-        incidents = {}
-        if os.path.exists('incidents.json'):
-            with open('incidents.json', 'r') as f:
-                incidents = json.load(f)
-
-        if message_id not in incidents:
+        incident = await incident_store.update_fields(message_id, {'status': status})
+        if not incident:
             await interaction.response.send_message("❌ Maintenance not found!", ephemeral=True)
             return
 
-        incident = incidents[message_id]
-        incident['status'] = status
-
-        # Save data
-        incidents[message_id] = incident
-        with open('incidents.json', 'w') as f:
-            json.dump(incidents, f, indent=2)
-
         # Update the message
-        modal = UpdateModal(message_id)
+        modal = UpdateModal(message_id, incident.get('type', 'incident'))
         await modal.update_message(interaction, incident)
 
     @maintenance_group.command(name="complete", description="Mark maintenance as completed")
@@ -1081,19 +1721,6 @@ class Status(commands.Cog):
     async def maintenance_complete(self, interaction: discord.Interaction, message_id: str,
                                    notes: Optional[str] = None):
         """Mark a maintenance as completed with notes"""
-        # Load data
-        incidents = {}
-        if os.path.exists('incidents.json'):
-            with open('incidents.json', 'r') as f:
-                incidents = json.load(f)
-
-        if message_id not in incidents:
-            await interaction.response.send_message("❌ Maintenance not found!", ephemeral=True)
-            return
-
-        incident = incidents[message_id]
-        incident['status'] = 'completed'
-
         # Add completion update
         timestamp = str(int(datetime.now().timestamp()))
         completion_text = "**COMPLETED:** Maintenance completed successfully."
@@ -1103,59 +1730,40 @@ class Status(commands.Cog):
         update = {
             'description': completion_text,
             'timestamp': timestamp,
-            'number': len(incident['updates']) + 1,
             'status': 'completed'
         }
-        incident['updates'].append(update)
-
-        # Save data
-        incidents[message_id] = incident
-        with open('incidents.json', 'w') as f:
-            json.dump(incidents, f, indent=2)
+        incident = await incident_store.add_update(message_id, update, {'status': 'completed'})
+        if not incident:
+            await interaction.response.send_message("❌ Maintenance not found!", ephemeral=True)
+            return
 
         # Update the message
-        modal = UpdateModal(message_id)
+        modal = UpdateModal(message_id, incident.get('type', 'incident'))
         await modal.update_message(interaction, incident)
 
     @maintenance_group.command(name="list", description="List all scheduled maintenances")
     async def maintenance_list(self, interaction: discord.Interaction):
         """List all scheduled and recent maintenances"""
-        if not os.path.exists('incidents.json'):
+        if not await incident_store.count('maintenance'):
             await interaction.response.send_message("📊 No maintenances recorded.", ephemeral=True)
             return
 
-        with open('incidents.json', 'r') as f:
-            incidents = json.load(f)
-
-        if not incidents:
-            await interaction.response.send_message("📊 No maintenances recorded.", ephemeral=True)
-            return
-
-        # Filter maintenances
-        scheduled = []
-        completed = []
-
-        for msg_id, incident in incidents.items():
-            if incident.get('type') != 'maintenance':
-                continue
-
-            emoji, status_text = get_status_emoji_and_text(incident['status'], True)
-            entry = {
-                'title': incident['title'],
-                'status': status_text,
-                'emoji': emoji,
-                'message_id': msg_id,
-                'scheduled_time': int(incident.get('scheduled_time', 0))
-            }
-
-            if incident['status'] in ['completed', 'cancelled']:
-                completed.append(entry)
-            else:
-                scheduled.append(entry)
-
-        # Sort by scheduled time
-        scheduled.sort(key=lambda x: x['scheduled_time'])
-        completed.sort(key=lambda x: x['scheduled_time'], reverse=True)
+        def entries(incidents: Dict[str, dict]) -> List[dict]:
+            result = []
+            for msg_id, incident in incidents.items():
+                emoji, status_text = get_status_emoji_and_text(incident['status'], True)
+                result.append({
+                    'title': incident['title'],
+                    'status': status_text,
+                    'emoji': emoji,
+                    'message_id': msg_id,
+                    'scheduled_time': _sort_time(incident)
+                })
+            return result
+
+        # Upcoming soonest first, completed most recent first
+        scheduled = entries(await incident_store.list('maintenance', active=True, limit=10, newest_first=False))
+        completed = entries(await incident_store.list('maintenance', active=False, limit=5))
 
         # Create embed
         embed = discord.Embed(
@@ -1167,7 +1775,7 @@ class Status(commands.Cog):
         # Add scheduled maintenances
         if scheduled:
             sched_text = []
-            for maint in scheduled[:10]:
+            for maint in scheduled:
                 sched_text.append(
                     f"{maint['emoji']} **{maint['title'][:40]}**\n"
                     f"└ <t:{maint['scheduled_time']}:F>"
@@ -1187,7 +1795,7 @@ class Status(commands.Cog):
         # Add recent completed
         if completed:
             comp_text = []
-            for maint in completed[:5]:
+            for maint in completed:
                 comp_text.append(f"{maint['emoji']} {maint['title'][:40]}")
             embed.add_field(
                 name="✅ Recently Completed",
@@ -1202,14 +1810,24 @@ class Status(commands.Cog):
     @app_commands.default_permissions(administrator=True)
     async def export_incidents(self, interaction: discord.Interaction):
         """Export all incident data as a file"""
-        if not os.path.exists('incidents.json'):
+        if not await incident_store.count():
             await interaction.response.send_message("❌ No data to export.", ephemeral=True)
             return
+        await interaction.response.defer(ephemeral=True)
 
-        with open('incidents.json', 'rb') as f:
-            file = discord.File(f, filename=f"incidents_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+        # Read page by page, so no single query loads the whole history with its updates
+        chunks = []
+        offset = 0
+        while True:
+            page = await incident_store.list(limit=INCIDENT_EXPORT_PAGE_SIZE, offset=offset)
+            if not page:
+                break
+            chunks.append(await incident_io.run(_export_chunk, page))
+            offset += len(page)
+        data = ("{\n" + ",\n".join(chunks) + "\n}").encode()
+        file = discord.File(io.BytesIO(data), filename=f"incidents_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
 
-        await interaction.response.send_message(
+        await interaction.followup.send(
             "📊 **Incident Data Export**\nHere's the complete incident database:",
             file=file,
             ephemeral=True
@@ -1219,32 +1837,15 @@ class Status(commands.Cog):
     @app_commands.command(name="incident_stats", description="View incident statistics")
     async def incident_stats(self, interaction: discord.Interaction):
         """Display incident statistics"""
-        if not os.path.exists('incidents.json'):
+        # Aggregated by the store, the reports themselves are never loaded
+        stats = await incident_store.stats()
+        if not sum(stats['types'].values()):
             await interaction.response.send_message("📊 No statistics available.", ephemeral=True)
             return
 
-        with open('incidents.json', 'r') as f:
-            incidents = json.load(f)
-
-        # Calculate statistics
-        total_incidents = 0
-        total_maintenances = 0
-        avg_resolution_time = []
-        severity_count = {'Critical': 0, 'Major': 0, 'Minor': 0, 'Low': 0}
-
-        for incident in incidents.values():
-            if incident.get('type') == 'incident':
-                total_incidents += 1
-                if incident.get('severity'):
-                    severity_count[incident['severity']] = severity_count.get(incident['severity'], 0) + 1
-
-                # Calculate resolution time if resolved
-                if incident.get('status') == 'resolved' and incident.get('start_time'):
-                    if incident.get('resolution_time'):
-                        resolution_time = incident['resolution_time'] - incident['start_time']
-                        avg_resolution_time.append(resolution_time)
-            elif incident.get('type') == 'maintenance':
-                total_maintenances += 1
+        total_incidents = stats['types'].get('incident', 0)
+        total_maintenances = stats['types'].get('maintenance', 0)
+        severity_count = {'Critical': 0, 'Major': 0, 'Minor': 0, 'Low': 0, **stats['severities']}
 
         # Create statistics embed
         embed = discord.Embed(
@@ -1269,8 +1870,8 @@ class Status(commands.Cog):
         )
 
         # Average resolution time
-        if avg_resolution_time:
-            avg_time = sum(avg_resolution_time) / len(avg_resolution_time)
+        if stats['resolved']:
+            avg_time = stats['resolution_total'] / stats['resolved']
             hours = int(avg_time // 3600)
             minutes = int((avg_time % 3600) // 60)
             embed.add_field(
@@ -1288,43 +1889,33 @@ class Status(commands.Cog):
     )
     async def incident_resolve(self, interaction: discord.Interaction, message_id: str, resolution: str):
         """Mark an incident as resolved with a resolution message"""
-        # Load incident data
-        incidents = {}
-        if os.path.exists('incidents.json'):
-            with open('incidents.json', 'r') as f:
-                incidents = json.load(f)
-
-        if message_id not in incidents:
+        incident = await incident_store.get(message_id)
+        if not incident:
             await interaction.response.send_message("❌ Incident not found!", ephemeral=True)
             return
 
-        incident = incidents[message_id]
-        incident['status'] = 'resolved'
-        incident['eta'] = 'Resolved'
+        fields = {'status': 'resolved', 'eta': 'Resolved'}
 
         # Add resolution update
         timestamp = str(int(datetime.now().timestamp()))
         update = {
             'description': f"**RESOLVED:** {resolution}",
             'timestamp': timestamp,
-            'number': len(incident['updates']) + 1,
             'status': 'resolved'
         }
-        incident['updates'].append(update)
 
         # Calculate and add duration
         if incident.get('start_time'):
-            duration = format_duration(incident['start_time'])
-            incident['resolution_time'] = int(datetime.now().timestamp())
-            incident['total_duration'] = duration
+            fields['resolution_time'] = int(datetime.now().timestamp())
+            fields['total_duration'] = format_duration(incident['start_time'])
 
-        # Save data
-        incidents[message_id] = incident
-        with open('incidents.json', 'w') as f:
-            json.dump(incidents, f, indent=2)
+        incident = await incident_store.add_update(message_id, update, fields)
+        if not incident:
+            await interaction.response.send_message("❌ Incident not found!", ephemeral=True)
+            return
 
         # Update the message
-        modal = UpdateModal(message_id)
+        modal = UpdateModal(message_id, incident.get('type', 'incident'))
         await modal.update_message(interaction, incident)
 
 
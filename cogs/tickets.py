@@ -1,14 +1,25 @@
 import discord
-from discord.ext import commands
-from discord import ui
+from discord.ext import commands, tasks
+from discord import app_commands, ui
 import asyncpg
+import asyncio
 import os
 import re
+import time
 import logging
 from typing import Optional, Dict, List, Any
 import aiohttp
 import json
-from datetime import datetime
+import heapq
+import io
+import html
+import shutil
+import tempfile
+import zlib
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager
+from itertools import groupby
+from datetime import datetime, timedelta, timezone
 
 logger = logging.getLogger('ModdySystems.Tickets')
 
@@ -43,6 +54,654 @@ EMOJIS = {
     'block': '<:block:1448364162592932004>',
 }
 
+# Staff permissions cache (seconds)
+STAFF_CACHE_TTL = int(os.getenv('STAFF_CACHE_TTL', '300'))
+STAFF_CACHE_POLL_INTERVAL = int(os.getenv('STAFF_CACHE_POLL_INTERVAL', '60'))
+# Max number of users kept in the staff cache (LRU)
+STAFF_CACHE_SIZE = int(os.getenv('STAFF_CACHE_SIZE', '2000'))
+
+# Max number of ticket records kept in memory (LRU)
+TICKET_CACHE_SIZE = int(os.getenv('TICKET_CACHE_SIZE', '1000'))
+
+# Write-behind mode for ticket mutations (batched group commits)
+WRITE_BEHIND = os.getenv('TICKET_WRITE_BEHIND', 'false').lower() in ('1', 'true', 'yes')
+WRITE_BEHIND_BATCH_SIZE = int(os.getenv('TICKET_WRITE_BEHIND_BATCH_SIZE', '50'))
+WRITE_BEHIND_FLUSH_INTERVAL = float(os.getenv('TICKET_WRITE_BEHIND_FLUSH_INTERVAL', '0.5'))
+
+# Max seconds to wait for a pooled connection
+DB_ACQUIRE_TIMEOUT = float(os.getenv('DB_ACQUIRE_TIMEOUT', '2'))
+
+# Moddy DB circuit breaker
+MODDY_BREAKER_THRESHOLD = int(os.getenv('MODDYDB_BREAKER_THRESHOLD', '5'))
+MODDY_BREAKER_RESET = float(os.getenv('MODDYDB_BREAKER_RESET', '30'))
+
+DB_UNAVAILABLE_MESSAGE = "The Moddy database is currently unavailable. Please try again in a moment."
+
+# Invite code -> guild ID cache (seconds)
+INVITE_CACHE_TTL = int(os.getenv('INVITE_CACHE_TTL', '3600'))
+INVITE_NEGATIVE_TTL = int(os.getenv('INVITE_NEGATIVE_TTL', '300'))
+INVITE_CACHE_SIZE = 5000
+
+# Error code resolution (bug reports)
+ERROR_CODE_LENGTH = 8
+# Shorter codes are resolved by prefix, one extra character as a typo
+ERROR_CODE_MIN_LENGTH = 6
+ERROR_CODE_MAX_LENGTH = ERROR_CODE_LENGTH + 1
+ERROR_CACHE_SIZE = 1000
+ERROR_CACHE_TTL = int(os.getenv('ERROR_CACHE_TTL', '3600'))
+ERROR_NEGATIVE_TTL = int(os.getenv('ERROR_NEGATIVE_TTL', '30'))
+ERROR_FUZZY_WINDOW_HOURS = int(os.getenv('ERROR_FUZZY_WINDOW_HOURS', '48'))
+ERROR_FUZZY_MAX_CODES = 5000
+ERROR_RECENT_CODES_TTL = 30
+
+# Max seconds for the lookups of a ticket creation flow (invite, cases, error code)
+FLOW_TIMEOUT = float(os.getenv('TICKET_FLOW_TIMEOUT', '10'))
+
+# Ticket creation admission control
+MAX_OPEN_TICKETS_PER_USER = int(os.getenv('TICKET_MAX_OPEN_PER_USER', '3'))
+CREATION_QUEUE_SIZE = int(os.getenv('TICKET_CREATION_QUEUE_SIZE', '200'))
+CREATION_CATEGORY_CAP = int(os.getenv('TICKET_CREATION_CATEGORY_CAP', '50'))
+CREATION_WORKERS = int(os.getenv('TICKET_CREATION_WORKERS', '2'))
+
+# Seconds between two reconciliations of the dashboard counters with the DB
+AGGREGATES_RECONCILE_INTERVAL = int(os.getenv('TICKET_AGGREGATES_RECONCILE_INTERVAL', '300'))
+DASHBOARD_MAX_STAFF = 20
+
+# Transcripts captured on archive: 'db', 'local' (TICKET_TRANSCRIPT_DIR) or 'off'
+TRANSCRIPT_STORAGE = os.getenv('TICKET_TRANSCRIPTS', 'db').lower()
+TRANSCRIPT_DIR = os.getenv('TICKET_TRANSCRIPT_DIR', 'transcripts')
+TRANSCRIPT_HTML = os.getenv('TICKET_TRANSCRIPT_HTML', 'false').lower() in ('1', 'true', 'yes')
+TRANSCRIPT_CONCURRENCY = int(os.getenv('TICKET_TRANSCRIPT_CONCURRENCY', '2'))
+TRANSCRIPT_PAGE_SIZE = 100
+TRANSCRIPT_SPOOL_SIZE = 1024 * 1024  # bytes kept in memory before spilling to disk
+TRANSCRIPT_MAX_DB_BYTES = 8 * 1024 * 1024  # larger transcripts are stored locally
+TRANSCRIPT_SEARCH_CHARS = 200_000  # transcript text indexed for /ticket-search
+
+# /ticket-search results per page
+SEARCH_PAGE_SIZE = 10
+
+# Stale ticket sweeper: archive request after TICKET_STALE_AFTER_HOURS without
+# activity (0 disables), auto-archive TICKET_STALE_GRACE_HOURS later without answer
+STALE_AFTER_HOURS = float(os.getenv('TICKET_STALE_AFTER_HOURS', '72'))
+STALE_GRACE_HOURS = float(os.getenv('TICKET_STALE_GRACE_HOURS', '48'))
+SWEEP_INTERVAL = int(os.getenv('TICKET_SWEEP_INTERVAL', '600'))
+SWEEP_BATCH_SIZE = int(os.getenv('TICKET_SWEEP_BATCH_SIZE', '10'))
+SWEEP_REST_BUDGET = int(os.getenv('TICKET_SWEEP_REST_PER_MINUTE', '20'))
+
+# Days of ticket history replayed into the SLA histograms at startup
+SLA_WINDOW_DAYS = int(os.getenv('TICKET_SLA_WINDOW_DAYS', '30'))
+SLA_MAX_STAFF = 10
+
+
+class DatabaseUnavailable(Exception):
+    """Raised when a database is degraded and requests fail fast"""
+
+
+# Errors that mean the database itself is slow or unreachable
+DEGRADED_ERRORS = (
+    asyncio.TimeoutError,
+    OSError,
+    asyncpg.QueryCanceledError,
+    asyncpg.PostgresConnectionError,
+    asyncpg.InterfaceError,
+    asyncpg.CannotConnectNowError,
+)
+
+
+def get_pool_settings(prefix: str, statement_timeout_ms: int) -> Dict[str, Any]:
+    """Reads asyncpg pool settings from {prefix}_POOL_* env variables"""
+    return {
+        'min_size': int(os.getenv(f'{prefix}_POOL_MIN_SIZE', '2')),
+        'max_size': int(os.getenv(f'{prefix}_POOL_MAX_SIZE', '10')),
+        'command_timeout': float(os.getenv(f'{prefix}_COMMAND_TIMEOUT', '10')),
+        'max_inactive_connection_lifetime': float(os.getenv(f'{prefix}_POOL_MAX_IDLE', '300')),
+        # Applied to every pooled connection when it's opened
+        'server_settings': {
+            'application_name': os.getenv('DB_APPLICATION_NAME', 'moddysystems'),
+            'statement_timeout': os.getenv(f'{prefix}_STATEMENT_TIMEOUT_MS', str(statement_timeout_ms)),
+        },
+    }
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram (milliseconds)"""
+
+    BUCKETS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+    def __init__(self):
+        self.counts = [0] * (len(self.BUCKETS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float):
+        """Records one value"""
+        index = len(self.BUCKETS)
+        for i, bound in enumerate(self.BUCKETS):
+            if value <= bound:
+                index = i
+                break
+        self.counts[index] += 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+    def percentile(self, p: float) -> float:
+        """Returns the upper bound of the bucket holding the p-th percentile"""
+        if not self.count:
+            return 0.0
+        rank = p / 100 * self.count
+        seen = 0
+        for i, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= rank:
+                return min(float(self.BUCKETS[i]), self.max) if i < len(self.BUCKETS) else self.max
+        return self.max
+
+    def summary(self) -> Dict[str, float]:
+        """Returns count, average, p50/p90/p99 and max"""
+        return {
+            'count': self.count,
+            'avg': self.total / self.count if self.count else 0.0,
+            'p50': self.percentile(50),
+            'p90': self.percentile(90),
+            'p99': self.percentile(99),
+            'max': self.max,
+        }
+
+
+class CircuitBreaker:
+    """Opens after consecutive failures, then lets a single trial request through after reset_timeout"""
+
+    def __init__(self, name: str, failure_threshold: int, reset_timeout: float):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        # A half-open trial is running, other callers are still rejected
+        self.probing = False
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return 'closed'
+        if time.monotonic() - self.opened_at >= self.reset_timeout:
+            return 'half_open'
+        return 'open'
+
+    def allow_request(self) -> tuple:
+        """Returns (allowed, is_probe); a call that gets the half-open trial must end it"""
+        state = self.state
+        if state == 'half_open':
+            if self.probing:
+                return False, False
+            self.probing = True
+            return True, True
+        return state == 'closed', False
+
+    def end_probe(self):
+        """Releases a trial that ended without a verdict (e.g. a query error)"""
+        self.probing = False
+
+    def record_success(self):
+        if self.opened_at is not None:
+            logger.info(f"Circuit breaker '{self.name}' closed")
+        self.failures = 0
+        self.opened_at = None
+        self.probing = False
+
+    def record_failure(self):
+        self.probing = False
+        self.failures += 1
+        if self.state == 'half_open' or self.failures >= self.failure_threshold:
+            if self.state != 'open':
+                logger.warning(f"Circuit breaker '{self.name}' opened after {self.failures} failure(s)")
+            self.opened_at = time.monotonic()
+
+
+class RestBudget:
+    """Caps background REST calls over a sliding one-minute window"""
+
+    def __init__(self, per_minute: int):
+        self.per_minute = per_minute
+        self.calls = deque()
+
+    async def spend(self, cost: int = 1):
+        """Waits until `cost` calls fit in the window, then records them"""
+        while True:
+            now = time.monotonic()
+            while self.calls and now - self.calls[0] >= 60:
+                self.calls.popleft()
+            if len(self.calls) + cost <= self.per_minute:
+                self.calls.extend([now] * cost)
+                return
+            await asyncio.sleep(60 - (now - self.calls[0]))
+
+
+# Named queries, projecting only the columns the bot uses.
+# asyncpg prepares each of them once per pooled connection (statement cache),
+# so repeated calls skip parse/plan.
+QUERIES = {
+    # Moddy DB
+    'error_by_code': """
+        SELECT error_code, error_type, message, file_source, line_number,
+               user_id, guild_id, command, timestamp
+        FROM errors
+        WHERE error_code = $1
+    """,
+    'recent_error_codes': """
+        SELECT error_code
+        FROM errors
+        WHERE timestamp > NOW() - make_interval(hours => $1)
+        ORDER BY timestamp DESC
+        LIMIT $2
+    """,
+    'open_cases_summary': """
+        SELECT case_id, sanction_type, LEFT(reason, 100) AS reason
+        FROM moderation_cases
+        WHERE entity_type = $1
+        AND entity_id = $2
+        AND status = 'open'
+        ORDER BY created_at DESC
+        LIMIT 25
+    """,
+    'case_detail': """
+        SELECT case_id, case_type, sanction_type, entity_type, entity_id,
+               status, reason, created_by, created_at
+        FROM moderation_cases
+        WHERE case_id = $1
+    """,
+    'staff_by_user': """
+        SELECT user_id, roles, denied_commands, role_permissions, updated_at
+        FROM staff_permissions
+        WHERE user_id = $1
+    """,
+    'staff_watermark': "SELECT COALESCE(MAX(updated_at), NOW()) FROM staff_permissions",
+    'staff_updated_since': "SELECT user_id, updated_at FROM staff_permissions WHERE updated_at > $1",
+
+    # ModdySystems DB
+    'ticket_insert': """
+        INSERT INTO tickets (thread_id, user_id, category, metadata)
+        VALUES ($1, $2, $3, $4::jsonb)
+    """,
+    'ticket_by_thread': """
+        SELECT thread_id, user_id, category, claimed_by, created_at,
+               archived, archived_at, metadata, claimed_at, first_staff_reply_at
+        FROM tickets
+        WHERE thread_id = $1
+    """,
+    'open_tickets_by_user': """
+        SELECT thread_id
+        FROM tickets
+        WHERE user_id = $1
+        AND archived = FALSE
+        LIMIT $2
+    """,
+    'open_tickets': """
+        SELECT thread_id, category, claimed_by, created_at
+        FROM tickets
+        WHERE archived = FALSE
+    """,
+    'ticket_claim': """
+        UPDATE tickets
+        SET claimed_by = $1, claimed_at = COALESCE(claimed_at, NOW()),
+            first_claimed_by = COALESCE(first_claimed_by, $1)
+        WHERE thread_id = $2
+    """,
+    'ticket_first_staff_reply': """
+        UPDATE tickets
+        SET first_staff_reply_at = $2, first_staff_reply_by = $3
+        WHERE thread_id = $1
+        AND first_staff_reply_at IS NULL
+    """,
+    'sla_history': """
+        SELECT category, claimed_by, created_at, claimed_at, first_claimed_by,
+               first_staff_reply_at, first_staff_reply_by, archived_at
+        FROM tickets
+        WHERE created_at > $1
+    """,
+    'ticket_unclaim': "UPDATE tickets SET claimed_by = NULL WHERE thread_id = $1",
+    'ticket_archive': "UPDATE tickets SET archived = TRUE, archived_at = NOW() WHERE thread_id = $1",
+    'ticket_unarchive': """
+        UPDATE tickets
+        SET archived = FALSE, archived_at = NULL, archive_requested_at = NULL, last_activity_at = NOW()
+        WHERE thread_id = $1
+    """,
+    'ticket_archive_requested': "UPDATE tickets SET archive_requested_at = NOW() WHERE thread_id = $1",
+    # A message after the archive request cancels it
+    'ticket_touch': """
+        UPDATE tickets
+        SET last_activity_at = GREATEST(last_activity_at, $2),
+            archive_requested_at = CASE WHEN archive_requested_at < $2 THEN NULL ELSE archive_requested_at END
+        WHERE thread_id = $1
+    """,
+    'stale_tickets_to_request': """
+        SELECT thread_id
+        FROM tickets
+        WHERE archived = FALSE
+        AND archive_requested_at IS NULL
+        AND last_activity_at < $1
+        ORDER BY last_activity_at
+        LIMIT $2
+    """,
+    'stale_tickets_to_archive': """
+        SELECT thread_id
+        FROM tickets
+        WHERE archived = FALSE
+        AND archive_requested_at < $1
+        ORDER BY archive_requested_at
+        LIMIT $2
+    """,
+    'transcript_upsert': """
+        INSERT INTO ticket_transcripts (thread_id, message_count, storage, path, jsonl_gz, html_gz, search_vector)
+        VALUES ($1, $2, $3, $4, $5, $6, to_tsvector('simple', $7))
+        ON CONFLICT (thread_id) DO UPDATE
+        SET message_count = EXCLUDED.message_count, storage = EXCLUDED.storage,
+            path = EXCLUDED.path, jsonl_gz = EXCLUDED.jsonl_gz,
+            html_gz = EXCLUDED.html_gz, search_vector = EXCLUDED.search_vector,
+            captured_at = NOW()
+    """,
+    # Ranked matches from ticket metadata and transcripts, keyset paginated on (rank, thread_id)
+    'ticket_search': """
+        WITH matches AS (
+            SELECT thread_id, ts_rank(search_vector, query) AS rank
+            FROM tickets, websearch_to_tsquery('simple', $1) AS query
+            WHERE search_vector @@ query
+            UNION ALL
+            SELECT thread_id, ts_rank(search_vector, query) AS rank
+            FROM ticket_transcripts, websearch_to_tsquery('simple', $1) AS query
+            WHERE search_vector @@ query
+        ), ranked AS (
+            SELECT thread_id, SUM(rank)::real AS rank
+            FROM matches
+            GROUP BY thread_id
+        )
+        SELECT t.thread_id, t.user_id, t.category, t.claimed_by, t.created_at, t.archived, r.rank
+        FROM ranked r
+        JOIN tickets t USING (thread_id)
+        WHERE t.category = ANY($2::text[])
+        AND ($3::bigint IS NULL OR t.user_id = $3)
+        AND ($4::timestamptz IS NULL OR t.created_at >= $4)
+        AND ($5::timestamptz IS NULL OR t.created_at < $5)
+        AND ($6::real IS NULL OR (r.rank, t.thread_id) < ($6, $7::bigint))
+        ORDER BY r.rank DESC, t.thread_id DESC
+        LIMIT $8
+    """,
+}
+
+
+# ModdySystems DB schema migrations: (version, name, SQL), applied in order.
+# Never edit an applied migration, add a new one instead.
+MIGRATIONS = [
+    (1, 'create_tickets', """
+        CREATE TABLE IF NOT EXISTS tickets (
+            thread_id BIGINT PRIMARY KEY,
+            user_id BIGINT NOT NULL,
+            category VARCHAR(50) NOT NULL,
+            claimed_by BIGINT,
+            created_at TIMESTAMPTZ DEFAULT NOW(),
+            archived BOOLEAN DEFAULT FALSE,
+            archived_at TIMESTAMPTZ,
+            metadata JSONB DEFAULT '{}'::jsonb
+        )
+    """),
+    (2, 'tickets_indexes', """
+        CREATE INDEX IF NOT EXISTS idx_tickets_user_created
+            ON tickets (user_id, created_at DESC);
+        CREATE INDEX IF NOT EXISTS idx_tickets_open_by_category
+            ON tickets (category, created_at)
+            WHERE archived = FALSE;
+        CREATE INDEX IF NOT EXISTS idx_tickets_claimed_by_staff
+            ON tickets (claimed_by, created_at DESC)
+            WHERE claimed_by IS NOT NULL;
+        CREATE INDEX IF NOT EXISTS idx_tickets_created_at
+            ON tickets (created_at);
+        CREATE INDEX IF NOT EXISTS idx_tickets_archived_at
+            ON tickets (archived_at)
+            WHERE archived = TRUE;
+        CREATE INDEX IF NOT EXISTS idx_tickets_metadata
+            ON tickets USING GIN (metadata);
+    """),
+    (3, 'tickets_open_by_user', """
+        CREATE INDEX IF NOT EXISTS idx_tickets_open_by_user
+            ON tickets (user_id)
+            WHERE archived = FALSE;
+    """),
+    (4, 'create_ticket_transcripts', """
+        CREATE TABLE IF NOT EXISTS ticket_transcripts (
+            thread_id BIGINT PRIMARY KEY REFERENCES tickets (thread_id) ON DELETE CASCADE,
+            message_count INTEGER NOT NULL,
+            storage VARCHAR(10) NOT NULL,
+            path TEXT,
+            jsonl_gz BYTEA,
+            html_gz BYTEA,
+            captured_at TIMESTAMPTZ DEFAULT NOW()
+        );
+    """),
+    (5, 'ticket_search', """
+        ALTER TABLE tickets ADD COLUMN IF NOT EXISTS search_vector tsvector
+            GENERATED ALWAYS AS (jsonb_to_tsvector('simple', metadata, '["string", "numeric"]')) STORED;
+        CREATE INDEX IF NOT EXISTS idx_tickets_search
+            ON tickets USING GIN (search_vector);
+        ALTER TABLE ticket_transcripts ADD COLUMN IF NOT EXISTS search_vector tsvector;
+        CREATE INDEX IF NOT EXISTS idx_ticket_transcripts_search
+            ON ticket_transcripts USING GIN (search_vector);
+    """),
+    (6, 'tickets_activity', """
+        -- No default yet: on PG11+ it would stamp every existing ticket with NOW()
+        ALTER TABLE tickets ADD COLUMN IF NOT EXISTS last_activity_at TIMESTAMPTZ;
+        ALTER TABLE tickets ADD COLUMN IF NOT EXISTS archive_requested_at TIMESTAMPTZ;
+        UPDATE tickets SET last_activity_at = COALESCE(archived_at, created_at, NOW())
+            WHERE last_activity_at IS NULL;
+        ALTER TABLE tickets ALTER COLUMN last_activity_at SET DEFAULT NOW();
+        CREATE INDEX IF NOT EXISTS idx_tickets_stale
+            ON tickets (last_activity_at)
+            WHERE archived = FALSE AND archive_requested_at IS NULL;
+        CREATE INDEX IF NOT EXISTS idx_tickets_archive_requested
+            ON tickets (archive_requested_at)
+            WHERE archived = FALSE AND archive_requested_at IS NOT NULL;
+    """),
+    (7, 'tickets_lifecycle', """
+        ALTER TABLE tickets ADD COLUMN IF NOT EXISTS claimed_at TIMESTAMPTZ;
+        ALTER TABLE tickets ADD COLUMN IF NOT EXISTS first_claimed_by BIGINT;
+        ALTER TABLE tickets ADD COLUMN IF NOT EXISTS first_staff_reply_at TIMESTAMPTZ;
+        ALTER TABLE tickets ADD COLUMN IF NOT EXISTS first_staff_reply_by BIGINT;
+    """),
+    # Status reports of cogs/status.py (may already exist, created ad hoc by that cog before)
+    (8, 'create_status_incidents', """
+        CREATE TABLE IF NOT EXISTS status_incidents (
+            message_id BIGINT PRIMARY KEY,
+            type VARCHAR(20) NOT NULL,
+            status VARCHAR(50) NOT NULL,
+            start_time BIGINT NOT NULL DEFAULT 0,
+            version INTEGER NOT NULL DEFAULT 1,
+            data JSONB NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS status_incident_updates (
+            id BIGSERIAL PRIMARY KEY,
+            message_id BIGINT NOT NULL REFERENCES status_incidents (message_id) ON DELETE CASCADE,
+            timestamp BIGINT NOT NULL,
+            status VARCHAR(50),
+            description TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_status_incidents_status
+            ON status_incidents (status);
+        CREATE INDEX IF NOT EXISTS idx_status_incidents_type_start
+            ON status_incidents (type, start_time DESC);
+        CREATE INDEX IF NOT EXISTS idx_status_incidents_active
+            ON status_incidents (type, start_time)
+            WHERE status NOT IN ('resolved', 'completed', 'cancelled');
+        CREATE INDEX IF NOT EXISTS idx_status_incident_updates_message
+            ON status_incident_updates (message_id, timestamp, id);
+    """),
+]
+
+# Arbitrary key so only one instance applies migrations at a time
+MIGRATIONS_LOCK_ID = 4815162342
+
+
+class DurationHistogram(LatencyHistogram):
+    """Fixed-bucket histogram of ticket lifecycle durations (seconds)"""
+
+    BUCKETS = (60, 300, 900, 1800, 3600, 7200, 14400, 28800, 86400, 172800, 345600, 604800)
+
+
+class TicketSLA:
+    """Streaming duration histograms of the ticket lifecycle
+
+    Each event (first claim, first staff reply, archive) updates the histogram
+    of its category and of the staff member involved, so percentiles are
+    available at any time without querying the DB.
+    """
+
+    METRICS = ('claim', 'first_reply', 'archive')
+
+    def __init__(self):
+        self.by_category: Dict[str, Dict[str, DurationHistogram]] = {}
+        self.by_staff: Dict[int, Dict[str, DurationHistogram]] = {}
+        self.since: Optional[datetime] = None
+
+    def observe(self, metric: str, category: str, staff_id: Optional[int], start: Optional[datetime], end: Optional[datetime]):
+        """Records the duration of one lifecycle step"""
+        if not start or not end:
+            return
+        seconds = (end - start).total_seconds()
+        if seconds < 0:
+            return
+
+        for key, table in ((category, self.by_category), (staff_id, self.by_staff)):
+            if key is None:
+                continue
+            histograms = table.setdefault(key, {})
+            if metric not in histograms:
+                histograms[metric] = DurationHistogram()
+            histograms[metric].observe(seconds)
+
+    def load(self, tickets: List[Dict], since: datetime):
+        """Replays the lifecycle of past tickets"""
+        self.by_category = {}
+        self.by_staff = {}
+        self.since = since
+        for ticket in tickets:
+            self.observe('claim', ticket['category'], ticket['first_claimed_by'], ticket['created_at'], ticket['claimed_at'])
+            self.observe('first_reply', ticket['category'], ticket['first_staff_reply_by'], ticket['created_at'], ticket['first_staff_reply_at'])
+            self.observe('archive', ticket['category'], ticket['claimed_by'], ticket['created_at'], ticket['archived_at'])
+
+    def export(self) -> Dict[str, Any]:
+        """Machine-readable summaries (seconds) per category and per staff member"""
+        return {
+            'generated_at': datetime.now(timezone.utc).isoformat(),
+            'since': self.since.isoformat() if self.since else None,
+            'categories': {
+                category: {metric: histogram.summary() for metric, histogram in histograms.items()}
+                for category, histograms in self.by_category.items()
+            },
+            'staff': {
+                str(staff_id): {metric: histogram.summary() for metric, histogram in histograms.items()}
+                for staff_id, histograms in self.by_staff.items()
+            },
+        }
+
+
+class TicketAggregates:
+    """Counters over open tickets, kept up to date by the ticket mutations
+
+    Reads never touch the DB: counts are plain dict lookups and the oldest
+    unclaimed ticket sits at the top of a heap (stale entries are dropped lazily).
+    """
+
+    def __init__(self):
+        self.open_by_category: Dict[str, Dict[str, int]] = {}
+        self.claims_by_staff: Dict[int, int] = {}
+
+        # Unclaimed open tickets: thread_id -> (created_at, category)
+        self.unclaimed: Dict[int, tuple] = {}
+        self.unclaimed_heap: List[tuple] = []
+
+        self.reconciled_at: Optional[datetime] = None
+        self.last_drift = 0
+
+    def add(self, ticket: Dict):
+        """Counts a ticket, if it is open"""
+        if ticket.get('archived'):
+            return
+
+        state = 'claimed' if ticket['claimed_by'] else 'unclaimed'
+        counts = self.open_by_category.setdefault(ticket['category'], {'unclaimed': 0, 'claimed': 0})
+        counts[state] += 1
+
+        if ticket['claimed_by']:
+            self.claims_by_staff[ticket['claimed_by']] = self.claims_by_staff.get(ticket['claimed_by'], 0) + 1
+        else:
+            created_at = ticket.get('created_at') or datetime.now(timezone.utc)
+            self.unclaimed[ticket['thread_id']] = (created_at, ticket['category'])
+            heapq.heappush(self.unclaimed_heap, (created_at, ticket['thread_id']))
+
+    def remove(self, ticket: Dict):
+        """Uncounts a ticket, if it was open"""
+        if ticket.get('archived'):
+            return
+
+        state = 'claimed' if ticket['claimed_by'] else 'unclaimed'
+        counts = self.open_by_category.get(ticket['category'])
+        if counts and counts[state]:
+            counts[state] -= 1
+
+        if ticket['claimed_by']:
+            remaining = self.claims_by_staff.get(ticket['claimed_by'], 0) - 1
+            if remaining > 0:
+                self.claims_by_staff[ticket['claimed_by']] = remaining
+            else:
+                self.claims_by_staff.pop(ticket['claimed_by'], None)
+        else:
+            self.unclaimed.pop(ticket['thread_id'], None)
+
+    def apply(self, before: Dict, after: Dict):
+        """Moves a ticket from its previous state to its new one"""
+        self.remove(before)
+        self.add(after)
+
+    def oldest_unclaimed(self) -> Optional[tuple]:
+        """Returns (created_at, thread_id, category) of the oldest unclaimed ticket"""
+        heap = self.unclaimed_heap
+        while heap:
+            created_at, thread_id = heap[0]
+            entry = self.unclaimed.get(thread_id)
+            if entry and entry[0] == created_at:
+                return created_at, thread_id, entry[1]
+            heapq.heappop(heap)
+        return None
+
+    def load(self, tickets: List[Dict]):
+        """Rebuilds every counter from the open tickets, returns how many counts changed"""
+        previous = {
+            (category, state): count
+            for category, counts in self.open_by_category.items()
+            for state, count in counts.items()
+        }
+
+        self.open_by_category = {}
+        self.claims_by_staff = {}
+        self.unclaimed = {}
+        self.unclaimed_heap = []
+        for ticket in tickets:
+            self.add(ticket)
+        heapq.heapify(self.unclaimed_heap)
+
+        current = {
+            (category, state): count
+            for category, counts in self.open_by_category.items()
+            for state, count in counts.items()
+        }
+        self.last_drift = sum(
+            abs(current.get(key, 0) - previous.get(key, 0))
+            for key in previous.keys() | current.keys()
+        )
+        self.reconciled_at = datetime.now(timezone.utc)
+        return self.last_drift
+
 
 class TicketDatabase:
     """Manages database connections"""
@@ -51,6 +710,52 @@ class TicketDatabase:
         self.moddy_pool: Optional[asyncpg.Pool] = None
         self.systems_pool: Optional[asyncpg.Pool] = None
 
+        # Staff permissions cache: user_id -> (expires_at, staff_info or None), LRU order
+        self.staff_cache: OrderedDict = OrderedDict()
+        self.staff_cache_hits = 0
+        self.staff_cache_misses = 0
+        self.staff_cache_watermark: Optional[datetime] = None
+
+        # Write-through ticket cache: thread_id -> ticket record (LRU order)
+        self.ticket_cache: OrderedDict = OrderedDict()
+
+        # Open ticket counters for the dashboard
+        self.aggregates = TicketAggregates()
+
+        # Lifecycle duration histograms
+        self.sla = TicketSLA()
+
+        # Pool instrumentation and Moddy DB circuit breaker
+        self.pool_metrics = {
+            name: {'acquire_wait': LatencyHistogram(), 'query_duration': LatencyHistogram()}
+            for name in ('moddy', 'systems')
+        }
+        self.moddy_breaker = CircuitBreaker('moddy', MODDY_BREAKER_THRESHOLD, MODDY_BREAKER_RESET)
+
+        # Write-behind queue of (query_name, args, thread_id), flushed in order
+        self.write_queue: Optional[asyncio.Queue] = None
+        self.write_flusher: Optional[asyncio.Task] = None
+        # Mutations queued or in a batch not yet committed, and held while a batch is written
+        self.write_pending = 0
+        self.flush_lock = asyncio.Lock()
+        # Sequence numbers of queued mutations, so a direct write can wait for a ticket's queued ones
+        self.write_seq = 0
+        self.write_committed = 0
+        self.write_last_seq: Dict[int, int] = {}
+        self.write_done = asyncio.Condition()
+        # The flusher, while flush() drains the queue (new mutations wait for it)
+        self.write_draining: Optional[asyncio.Task] = None
+        self.write_stats = {
+            'queued': 0,
+            'flushed': 0,
+            'failed': 0,
+            'batches': 0,
+            'max_queue_depth': 0,
+            'last_flush_ms': 0.0,
+            'max_flush_ms': 0.0,
+            'total_flush_ms': 0.0,
+        }
+
     async def connect(self):
         """Connects to both databases"""
         # Connection to Moddy DB
@@ -60,10 +765,10 @@ class TicketDatabase:
             logger.warning("   (Error codes, moderation cases, and staff permissions won't work)")
         else:
             try:
+                # Short statement timeout so interactions answer within Discord's window
                 self.moddy_pool = await asyncpg.create_pool(
                     moddy_url,
-                    min_size=2,
-                    max_size=10
+                    **get_pool_settings('MODDYDB', 2000)
                 )
                 logger.info("✅ Connected to Moddy database")
             except Exception as e:
@@ -79,32 +784,107 @@ class TicketDatabase:
             try:
                 self.systems_pool = await asyncpg.create_pool(
                     systems_url,
-                    min_size=2,
-                    max_size=10
+                    **get_pool_settings('DATABASE', 10000)
                 )
                 logger.info("✅ Connected to ModdySystems database")
 
-                # Create tickets table if it doesn't exist
-                async with self.systems_pool.acquire() as conn:
-                    await conn.execute('''
-                        CREATE TABLE IF NOT EXISTS tickets (
-                            thread_id BIGINT PRIMARY KEY,
-                            user_id BIGINT NOT NULL,
-                            category VARCHAR(50) NOT NULL,
-                            claimed_by BIGINT,
-                            created_at TIMESTAMPTZ DEFAULT NOW(),
-                            archived BOOLEAN DEFAULT FALSE,
-                            archived_at TIMESTAMPTZ,
-                            metadata JSONB DEFAULT '{}'::jsonb
-                        )
-                    ''')
-                    logger.info("✅ Tickets table ready")
+                # Apply pending schema migrations
+                await self.run_migrations()
+                logger.info("✅ Tickets table ready")
+
+                if WRITE_BEHIND:
+                    self.write_queue = asyncio.Queue()
+                    self.write_flusher = asyncio.create_task(self._write_behind_loop(self.write_queue))
+                    logger.info("✅ Ticket write-behind enabled")
             except Exception as e:
                 logger.error(f"❌ Failed to connect to ModdySystems database: {e}")
                 logger.error("   Tickets won't be saved to database")
 
+    async def run_migrations(self):
+        """Applies pending MIGRATIONS to the ModdySystems DB"""
+        async with self.systems_pool.acquire() as conn:
+            await conn.execute("""
+                CREATE TABLE IF NOT EXISTS schema_migrations (
+                    version INTEGER PRIMARY KEY,
+                    name VARCHAR(100) NOT NULL,
+                    applied_at TIMESTAMPTZ DEFAULT NOW()
+                )
+            """)
+
+            for version, name, sql in MIGRATIONS:
+                async with conn.transaction():
+                    # Index builds may take longer than the pool's statement_timeout
+                    await conn.execute("SET LOCAL statement_timeout = 0")
+                    await conn.execute("SELECT pg_advisory_xact_lock($1)", MIGRATIONS_LOCK_ID)
+
+                    applied = await conn.fetchval(
+                        "SELECT 1 FROM schema_migrations WHERE version = $1",
+                        version
+                    )
+                    if applied:
+                        continue
+
+                    await conn.execute(sql)
+                    await conn.execute(
+                        "INSERT INTO schema_migrations (version, name) VALUES ($1, $2)",
+                        version, name
+                    )
+                    logger.info(f"✅ Applied migration {version}: {name}")
+
+    @asynccontextmanager
+    async def _acquire(self, pool_name: str):
+        """Acquires a pooled connection, recording wait/hold time and breaker state"""
+        pool = self.moddy_pool if pool_name == 'moddy' else self.systems_pool
+        metrics = self.pool_metrics[pool_name]
+        breaker = self.moddy_breaker if pool_name == 'moddy' else None
+
+        is_probe = False
+        if breaker:
+            allowed, is_probe = breaker.allow_request()
+            if not allowed:
+                raise DatabaseUnavailable(f"{pool_name} database circuit is open")
+
+        start = time.monotonic()
+        acquired = None
+        try:
+            async with pool.acquire(timeout=DB_ACQUIRE_TIMEOUT) as conn:
+                acquired = time.monotonic()
+                metrics['acquire_wait'].observe((acquired - start) * 1000)
+                yield conn
+        except DEGRADED_ERRORS:
+            if breaker:
+                breaker.record_failure()
+            raise
+        else:
+            if breaker:
+                breaker.record_success()
+        finally:
+            # Only the half-open trial request releases the probe slot
+            if is_probe:
+                breaker.end_probe()
+            if acquired is not None:
+                metrics['query_duration'].observe((time.monotonic() - acquired) * 1000)
+
+    def get_pool_stats(self) -> Dict[str, Any]:
+        """Returns pool sizes, latency histograms and breaker state"""
+        stats = {}
+        for name, pool in (('moddy', self.moddy_pool), ('systems', self.systems_pool)):
+            if not pool:
+                continue
+            stats[name] = {
+                'size': pool.get_size(),
+                'idle': pool.get_idle_size(),
+                'acquire_wait_ms': self.pool_metrics[name]['acquire_wait'].summary(),
+                'query_duration_ms': self.pool_metrics[name]['query_duration'].summary(),
+            }
+        if 'moddy' in stats:
+            stats['moddy']['breaker'] = self.moddy_breaker.state
+        return stats
+
     async def close(self):
         """Closes database connections"""
+        await self.flush()
+
         if self.moddy_pool:
             await self.moddy_pool.close()
         if self.systems_pool:
@@ -116,9 +896,9 @@ class TicketDatabase:
             return None
 
         try:
-            async with self.moddy_pool.acquire() as conn:
+            async with self._acquire('moddy') as conn:
                 error = await conn.fetchrow(
-                    "SELECT * FROM errors WHERE error_code = $1",
+                    QUERIES['error_by_code'],
                     error_code.upper()
                 )
 
@@ -129,69 +909,295 @@ class TicketDatabase:
             logger.error(f"Error fetching error info: {e}")
             return None
 
+    async def get_recent_error_codes(self, hours: int, limit: int) -> Optional[List[str]]:
+        """Retrieves the most recent error codes (None if the DB is unavailable)"""
+        if not self.moddy_pool:
+            return None
+
+        try:
+            async with self._acquire('moddy') as conn:
+                rows = await conn.fetch(QUERIES['recent_error_codes'], hours, limit)
+                return [row['error_code'].upper() for row in rows]
+        except Exception as e:
+            logger.error(f"Error fetching recent error codes: {e}")
+            return None
+
     async def get_user_cases(self, user_id: int) -> List[Dict]:
-        """Retrieves open cases for a user"""
+        """Retrieves open cases for a user (summary columns only)"""
+        return await self._get_open_cases('user', user_id)
+
+    async def get_guild_cases(self, guild_id: int) -> List[Dict]:
+        """Retrieves open cases for a server (summary columns only)"""
+        return await self._get_open_cases('guild', guild_id)
+
+    async def _get_open_cases(self, entity_type: str, entity_id: int) -> List[Dict]:
+        """Retrieves the open case summaries shown in CaseSelectView"""
         if not self.moddy_pool:
             return []
 
         try:
-            async with self.moddy_pool.acquire() as conn:
+            async with self._acquire('moddy') as conn:
                 cases = await conn.fetch(
-                    """
-                    SELECT * FROM moderation_cases
-                    WHERE entity_type = 'user'
-                    AND entity_id = $1
-                    AND status = 'open'
-                    ORDER BY created_at DESC
-                    """,
-                    user_id
+                    QUERIES['open_cases_summary'],
+                    entity_type, entity_id
                 )
                 return [dict(case) for case in cases]
         except Exception as e:
-            logger.error(f"Error fetching user cases: {e}")
+            logger.error(f"Error fetching {entity_type} cases: {e}")
             return []
 
-    async def get_guild_cases(self, guild_id: int) -> List[Dict]:
-        """Retrieves open cases for a server"""
+    async def get_case(self, case_id: str) -> Optional[Dict]:
+        """Retrieves the details of a single case"""
         if not self.moddy_pool:
-            return []
+            return None
 
         try:
-            async with self.moddy_pool.acquire() as conn:
-                cases = await conn.fetch(
-                    """
-                    SELECT * FROM moderation_cases
-                    WHERE entity_type = 'guild'
-                    AND entity_id = $1
-                    AND status = 'open'
-                    ORDER BY created_at DESC
-                    """,
-                    guild_id
+            async with self._acquire('moddy') as conn:
+                case = await conn.fetchrow(
+                    QUERIES['case_detail'],
+                    case_id
                 )
-                return [dict(case) for case in cases]
+
+                if case:
+                    return dict(case)
+                return None
         except Exception as e:
-            logger.error(f"Error fetching guild cases: {e}")
-            return []
+            logger.error(f"Error fetching case: {e}")
+            return None
 
     async def get_staff_info(self, user_id: int) -> Optional[Dict]:
-        """Retrieves staff information from Moddy DB"""
+        """Retrieves staff information from Moddy DB (cached, roles already parsed)
+
+        Raises DatabaseUnavailable if the Moddy DB is degraded and nothing is cached.
+        """
+        cached = self.staff_cache.get(user_id)
+        if cached:
+            if cached[0] > time.monotonic():
+                self.staff_cache_hits += 1
+                self.staff_cache.move_to_end(user_id)
+                return cached[1]
+            # Expired: evict now, the local copy is kept as an outage fallback
+            del self.staff_cache[user_id]
+
+        self.staff_cache_misses += 1
+
         if not self.moddy_pool:
             return None
 
         try:
-            async with self.moddy_pool.acquire() as conn:
+            async with self._acquire('moddy') as conn:
                 staff = await conn.fetchrow(
-                    "SELECT * FROM staff_permissions WHERE user_id = $1",
+                    QUERIES['staff_by_user'],
                     user_id
                 )
-
-                if staff:
-                    return dict(staff)
-                return None
+        except (DatabaseUnavailable, *DEGRADED_ERRORS) as e:
+            # Serve the last known permissions rather than failing the interaction
+            if cached:
+                self._cache_staff(user_id, cached)
+                return cached[1]
+            logger.warning(f"Moddy DB unavailable for staff lookup: {e}")
+            raise DatabaseUnavailable(str(e)) from e
         except Exception as e:
             logger.error(f"Error fetching staff info: {e}")
             return None
 
+        staff_info = None
+        if staff:
+            # Parse roles and permissions once so checks are plain lookups
+            staff_info = compile_staff_permissions(dict(staff))
+
+        # Non-staff users are cached too, so repeated clicks stay in memory
+        self._cache_staff(user_id, (time.monotonic() + STAFF_CACHE_TTL, staff_info))
+        return staff_info
+
+    def _cache_staff(self, user_id: int, entry: tuple):
+        """Stores a staff cache entry, evicting the least recently used users"""
+        self.staff_cache[user_id] = entry
+        self.staff_cache.move_to_end(user_id)
+        while len(self.staff_cache) > STAFF_CACHE_SIZE:
+            self.staff_cache.popitem(last=False)
+
+    def invalidate_staff(self, user_id: Optional[int] = None):
+        """Drops one staff member (or everyone) from the permissions cache"""
+        if user_id is None:
+            self.staff_cache.clear()
+        else:
+            self.staff_cache.pop(user_id, None)
+
+    async def poll_staff_updates(self):
+        """Invalidates cached staff members whose permissions changed since the last poll"""
+        if not self.moddy_pool:
+            return
+
+        try:
+            async with self._acquire('moddy') as conn:
+                if self.staff_cache_watermark is None:
+                    self.staff_cache_watermark = await conn.fetchval(
+                        QUERIES['staff_watermark']
+                    )
+                    return
+
+                changed = await conn.fetch(
+                    QUERIES['staff_updated_since'],
+                    self.staff_cache_watermark
+                )
+        except Exception as e:
+            logger.error(f"Error polling staff permissions: {e}")
+            return
+
+        for row in changed:
+            self.invalidate_staff(row['user_id'])
+            if row['updated_at'] > self.staff_cache_watermark:
+                self.staff_cache_watermark = row['updated_at']
+
+        if changed:
+            logger.info(f"Staff cache: invalidated {len(changed)} updated staff member(s)")
+
+    def get_staff_cache_stats(self) -> Dict[str, int]:
+        """Returns staff cache counters"""
+        return {
+            'size': len(self.staff_cache),
+            'hits': self.staff_cache_hits,
+            'misses': self.staff_cache_misses,
+        }
+
+    async def _write(self, query_name: str, *args, thread_id: int):
+        """Runs a ticket mutation now, or queues it in write-behind mode"""
+        if self.write_queue is not None and self.write_draining is None:
+            self.write_queue.put_nowait((query_name, args, thread_id))
+            self.write_pending += 1
+            self.write_seq += 1
+            self.write_last_seq[thread_id] = self.write_seq
+            self.write_stats['queued'] += 1
+            depth = self.write_queue.qsize()
+            if depth > self.write_stats['max_queue_depth']:
+                self.write_stats['max_queue_depth'] = depth
+            return
+
+        if self.write_draining is not None:
+            # flush() is draining the queue, this mutation must land after the queued ones
+            await asyncio.shield(self.write_draining)
+
+        async with self._acquire('systems') as conn:
+            await conn.execute(QUERIES[query_name], *args)
+
+    async def _wait_for_writes(self, thread_id: int):
+        """Waits until the mutations queued so far for a ticket are written"""
+        seq = self.write_last_seq.get(thread_id)
+        if seq is None:
+            return
+        async with self.write_done:
+            await self.write_done.wait_for(lambda: self.write_committed >= seq)
+
+    async def _write_behind_loop(self, queue: asyncio.Queue):
+        """Collects queued mutations and flushes them on a size or time trigger"""
+        loop = asyncio.get_running_loop()
+        while True:
+            item = await queue.get()
+            if item is None:
+                return
+
+            batch = [item]
+            deadline = loop.time() + WRITE_BEHIND_FLUSH_INTERVAL
+            stop = False
+            while len(batch) < WRITE_BEHIND_BATCH_SIZE:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                if item is None:
+                    stop = True
+                    break
+                batch.append(item)
+
+            async with self.flush_lock:
+                await self._flush_batch(batch)
+                self.write_pending -= len(batch)
+
+            # Written or given up on, either way direct writes waiting on them can go ahead
+            self.write_committed += len(batch)
+            for _, _, thread_id in batch:
+                if self.write_last_seq.get(thread_id, 0) <= self.write_committed:
+                    self.write_last_seq.pop(thread_id, None)
+            async with self.write_done:
+                self.write_done.notify_all()
+            if stop:
+                return
+
+    async def _flush_batch(self, batch: List[tuple]):
+        """Writes a batch in one transaction, keeping queue order"""
+        start = time.monotonic()
+        try:
+            async with self._acquire('systems') as conn:
+                async with conn.transaction():
+                    # Consecutive mutations of the same kind share one executemany
+                    for query_name, items in groupby(batch, key=lambda item: item[0]):
+                        await conn.executemany(QUERIES[query_name], [item[1] for item in items])
+            self.write_stats['flushed'] += len(batch)
+        except Exception as e:
+            logger.error(f"Error flushing {len(batch)} ticket write(s), retrying one by one: {e}")
+            await self._flush_one_by_one(batch)
+
+        elapsed = (time.monotonic() - start) * 1000
+        self.write_stats['batches'] += 1
+        self.write_stats['last_flush_ms'] = elapsed
+        self.write_stats['total_flush_ms'] += elapsed
+        if elapsed > self.write_stats['max_flush_ms']:
+            self.write_stats['max_flush_ms'] = elapsed
+
+    async def _flush_one_by_one(self, batch: List[tuple]):
+        """Fallback so one bad row doesn't drop the whole batch"""
+        for query_name, args, thread_id in batch:
+            try:
+                async with self._acquire('systems') as conn:
+                    await conn.execute(QUERIES[query_name], *args)
+                self.write_stats['flushed'] += 1
+            except Exception as e:
+                self.write_stats['failed'] += 1
+                self.ticket_cache.pop(thread_id, None)
+                logger.error(f"Error writing ticket {thread_id} ({query_name}): {e}")
+
+    async def flush(self):
+        """Flushes pending write-behind mutations and stops the flusher"""
+        if self.write_queue is None:
+            return
+
+        # Mutations made while the queue drains wait for it, then go straight to the DB
+        self.write_draining = self.write_flusher
+        self.write_queue.put_nowait(None)
+        try:
+            await self.write_flusher
+        finally:
+            self.write_queue = None
+            self.write_flusher = None
+            self.write_draining = None
+        logger.info("Ticket write-behind queue flushed")
+
+    def get_write_stats(self) -> Dict[str, Any]:
+        """Returns write-behind queue depth and flush latency"""
+        stats = dict(self.write_stats)
+        stats['queue_depth'] = self.write_queue.qsize() if self.write_queue else 0
+        stats['avg_flush_ms'] = stats['total_flush_ms'] / stats['batches'] if stats['batches'] else 0.0
+        return stats
+
+    def _cache_ticket(self, ticket: Dict):
+        """Stores a ticket record in the cache, evicting the least recently used"""
+        self.ticket_cache[ticket['thread_id']] = ticket
+        self.ticket_cache.move_to_end(ticket['thread_id'])
+        while len(self.ticket_cache) > TICKET_CACHE_SIZE:
+            self.ticket_cache.popitem(last=False)
+
+    def _update_cached_ticket(self, thread_id: int, **fields):
+        """Applies a successful mutation to the cached record, if any"""
+        ticket = self.ticket_cache.get(thread_id)
+        if ticket:
+            before = dict(ticket)
+            ticket.update(fields)
+            self.aggregates.apply(before, ticket)
+
     async def create_ticket(self, thread_id: int, user_id: int, category: str, metadata: Dict = None):
         """Creates a ticket in DB"""
         if not self.systems_pool:
@@ -204,48 +1210,124 @@ class TicketDatabase:
             # Convert metadata dict to JSON string
             metadata_json = json.dumps(serializable_metadata)
 
-            async with self.systems_pool.acquire() as conn:
-                await conn.execute(
-                    """
-                    INSERT INTO tickets (thread_id, user_id, category, metadata)
-                    VALUES ($1, $2, $3, $4::jsonb)
-                    """,
-                    thread_id, user_id, category, metadata_json
-                )
+            await self._write('ticket_insert', thread_id, user_id, category, metadata_json, thread_id=thread_id)
+
+            ticket = {
+                'thread_id': thread_id,
+                'user_id': user_id,
+                'category': category,
+                'claimed_by': None,
+                'created_at': datetime.now(timezone.utc),
+                'archived': False,
+                'archived_at': None,
+                'metadata': metadata_json,
+                'claimed_at': None,
+                'first_staff_reply_at': None,
+            }
+            self._cache_ticket(ticket)
+            self.aggregates.add(ticket)
         except Exception as e:
             logger.error(f"Error creating ticket: {e}")
 
     async def get_ticket(self, thread_id: int) -> Optional[Dict]:
-        """Retrieves a ticket from DB"""
+        """Retrieves a ticket (from cache, then DB)"""
+        ticket = self.ticket_cache.get(thread_id)
+        if ticket:
+            self.ticket_cache.move_to_end(thread_id)
+            return dict(ticket)
+
         if not self.systems_pool:
             return None
 
         try:
-            async with self.systems_pool.acquire() as conn:
+            async with self._acquire('systems') as conn:
                 ticket = await conn.fetchrow(
-                    "SELECT * FROM tickets WHERE thread_id = $1",
+                    QUERIES['ticket_by_thread'],
                     thread_id
                 )
 
                 if ticket:
+                    self._cache_ticket(dict(ticket))
                     return dict(ticket)
                 return None
         except Exception as e:
             logger.error(f"Error fetching ticket: {e}")
             return None
 
+    async def get_open_ticket_ids(self, user_id: int, limit: int) -> List[int]:
+        """Retrieves up to `limit` open tickets of a user
+
+        Tickets with write-behind mutations still queued (a creation or an
+        archive not in the DB yet) are counted from their cached record.
+        """
+        if not self.systems_pool:
+            return []
+
+        def queued_tickets() -> List[Dict]:
+            tickets = (self.ticket_cache.get(thread_id) for thread_id in self.write_last_seq)
+            return [ticket for ticket in tickets if ticket and ticket['user_id'] == user_id]
+
+        try:
+            async with self._acquire('systems') as conn:
+                # Queued archives may hide some of the rows, read that many more
+                rows = await conn.fetch(QUERIES['open_tickets_by_user'], user_id, limit + len(queued_tickets()))
+                open_ids = [row['thread_id'] for row in rows]
+        except Exception as e:
+            logger.error(f"Error fetching open tickets of {user_id}: {e}")
+            open_ids = []
+
+        # Read after the query, so a batch committed meanwhile is in one or the other
+        for ticket in queued_tickets():
+            if ticket['archived'] and ticket['thread_id'] in open_ids:
+                open_ids.remove(ticket['thread_id'])
+            elif not ticket['archived'] and ticket['thread_id'] not in open_ids:
+                open_ids.append(ticket['thread_id'])
+        return open_ids[:limit]
+
+    async def reconcile_aggregates(self):
+        """Rebuilds the dashboard counters from the open tickets in DB"""
+        if not self.systems_pool:
+            return
+
+        # No batch can be written while we read, so pending writes stay visible in write_pending
+        async with self.flush_lock:
+            # Queued writes are already counted but not in the DB yet, wait for the next round
+            if self.write_pending:
+                return
+
+            try:
+                async with self._acquire('systems') as conn:
+                    rows = await conn.fetch(QUERIES['open_tickets'])
+            except Exception as e:
+                logger.error(f"Error reconciling ticket aggregates: {e}")
+                return
+
+            # Mutations queued during the read would be lost by loading it
+            if self.write_pending:
+                return
+
+        drift = self.aggregates.load([dict(row) for row in rows])
+        if drift:
+            logger.warning(f"Ticket aggregates corrected by {drift} after reconciliation")
+
     async def claim_ticket(self, thread_id: int, user_id: int):
         """Claims a ticket"""
         if not self.systems_pool:
             return
 
+        ticket = self.ticket_cache.get(thread_id)
+        first_claim = ticket is not None and not ticket.get('claimed_at')
+
         try:
-            async with self.systems_pool.acquire() as conn:
-                await conn.execute(
-                    "UPDATE tickets SET claimed_by = $1 WHERE thread_id = $2",
-                    user_id, thread_id
-                )
+            await self._write('ticket_claim', user_id, thread_id, thread_id=thread_id)
+            if first_claim:
+                now = datetime.now(timezone.utc)
+                self.sla.observe('claim', ticket['category'], user_id, ticket['created_at'], now)
+                self._update_cached_ticket(thread_id, claimed_by=user_id, claimed_at=now)
+            else:
+                self._update_cached_ticket(thread_id, claimed_by=user_id)
         except Exception as e:
+            self.ticket_cache.pop(thread_id, None)
             logger.error(f"Error claiming ticket: {e}")
 
     async def unclaim_ticket(self, thread_id: int):
@@ -254,12 +1336,10 @@ class TicketDatabase:
             return
 
         try:
-            async with self.systems_pool.acquire() as conn:
-                await conn.execute(
-                    "UPDATE tickets SET claimed_by = NULL WHERE thread_id = $1",
-                    thread_id
-                )
+            await self._write('ticket_unclaim', thread_id, thread_id=thread_id)
+            self._update_cached_ticket(thread_id, claimed_by=None)
         except Exception as e:
+            self.ticket_cache.pop(thread_id, None)
             logger.error(f"Error unclaiming ticket: {e}")
 
     async def archive_ticket(self, thread_id: int):
@@ -268,12 +1348,14 @@ class TicketDatabase:
             return
 
         try:
-            async with self.systems_pool.acquire() as conn:
-                await conn.execute(
-                    "UPDATE tickets SET archived = TRUE, archived_at = NOW() WHERE thread_id = $1",
-                    thread_id
-                )
+            await self._write('ticket_archive', thread_id, thread_id=thread_id)
+            now = datetime.now(timezone.utc)
+            ticket = self.ticket_cache.get(thread_id)
+            if ticket and not ticket['archived']:
+                self.sla.observe('archive', ticket['category'], ticket['claimed_by'], ticket['created_at'], now)
+            self._update_cached_ticket(thread_id, archived=True, archived_at=now)
         except Exception as e:
+            self.ticket_cache.pop(thread_id, None)
             logger.error(f"Error archiving ticket: {e}")
 
     async def unarchive_ticket(self, thread_id: int):
@@ -282,14 +1364,133 @@ class TicketDatabase:
             return
 
         try:
-            async with self.systems_pool.acquire() as conn:
-                await conn.execute(
-                    "UPDATE tickets SET archived = FALSE, archived_at = NULL WHERE thread_id = $1",
-                    thread_id
-                )
+            await self._write('ticket_unarchive', thread_id, thread_id=thread_id)
+            self._update_cached_ticket(thread_id, archived=False, archived_at=None)
         except Exception as e:
+            self.ticket_cache.pop(thread_id, None)
             logger.error(f"Error unarchiving ticket: {e}")
 
+    async def record_first_staff_reply(self, ticket: Dict, staff_id: int, at: datetime):
+        """Records the first staff message of a ticket"""
+        if not self.systems_pool:
+            return
+
+        thread_id = ticket['thread_id']
+
+        # The caller's check ran before its awaits, another message may have recorded it since
+        cached = self.ticket_cache.get(thread_id)
+        if cached and cached.get('first_staff_reply_at'):
+            return
+        # Marked before awaiting, so a concurrent message stops at the check above
+        self._update_cached_ticket(thread_id, first_staff_reply_at=at)
+
+        try:
+            # Not write-behind: only the row count tells whether this was the first reply.
+            # The ticket's queued mutations (its INSERT at least) are written first.
+            await self._wait_for_writes(thread_id)
+            async with self._acquire('systems') as conn:
+                status = await conn.execute(QUERIES['ticket_first_staff_reply'], thread_id, at, staff_id)
+        except Exception as e:
+            self.ticket_cache.pop(thread_id, None)
+            logger.error(f"Error recording first staff reply: {e}")
+            return
+
+        if status == 'UPDATE 1':
+            self.sla.observe('first_reply', ticket['category'], staff_id, ticket['created_at'], at)
+        else:
+            # Already recorded (or the ticket row failed to insert): reload it from the DB next time
+            self.ticket_cache.pop(thread_id, None)
+
+    async def load_sla_history(self):
+        """Replays the last SLA_WINDOW_DAYS of tickets into the SLA histograms"""
+        if not self.systems_pool:
+            return
+
+        since = datetime.now(timezone.utc) - timedelta(days=SLA_WINDOW_DAYS)
+        try:
+            async with self._acquire('systems') as conn:
+                rows = await conn.fetch(QUERIES['sla_history'], since)
+        except Exception as e:
+            logger.error(f"Error loading SLA history: {e}")
+            return
+
+        self.sla.load([dict(row) for row in rows], since)
+        logger.info(f"SLA histograms loaded from {len(rows)} ticket(s)")
+
+    async def mark_archive_requested(self, thread_id: int):
+        """Starts the grace period before a ticket is auto-archived"""
+        if not self.systems_pool:
+            return
+
+        try:
+            await self._write('ticket_archive_requested', thread_id, thread_id=thread_id)
+        except Exception as e:
+            logger.error(f"Error marking archive request: {e}")
+
+    async def touch_tickets(self, activity: Dict[int, datetime]):
+        """Records the last activity of several tickets at once"""
+        if not self.systems_pool or not activity:
+            return
+
+        if self.write_queue is not None:
+            # Queued behind the tickets' other mutations (their INSERT may not be written yet)
+            for thread_id, at in activity.items():
+                await self._write('ticket_touch', thread_id, at, thread_id=thread_id)
+            return
+
+        async with self._acquire('systems') as conn:
+            await conn.executemany(QUERIES['ticket_touch'], list(activity.items()))
+
+    async def get_stale_tickets(self, query_name: str, before: datetime, limit: int) -> List[int]:
+        """Retrieves open tickets from one of the stale_tickets_* queries"""
+        if not self.systems_pool:
+            return []
+
+        try:
+            async with self._acquire('systems') as conn:
+                rows = await conn.fetch(QUERIES[query_name], before, limit)
+                return [row['thread_id'] for row in rows]
+        except Exception as e:
+            logger.error(f"Error fetching stale tickets: {e}")
+            return []
+
+    async def save_transcript(self, thread_id: int, message_count: int, storage: str,
+                              path: Optional[str], jsonl_gz: Optional[bytes], html_gz: Optional[bytes],
+                              search_text: str = ''):
+        """Stores (or replaces) the transcript of a ticket"""
+        if not self.systems_pool:
+            return
+
+        # Ordered with the ticket's other mutations, the row references the ticket
+        await self._write(
+            'transcript_upsert',
+            thread_id, message_count, storage, path, jsonl_gz, html_gz, search_text,
+            thread_id=thread_id
+        )
+
+    async def search_tickets(self, query: str, categories: List[str], user_id: Optional[int] = None,
+                             after: Optional[datetime] = None, before: Optional[datetime] = None,
+                             cursor: Optional[tuple] = None, limit: int = SEARCH_PAGE_SIZE) -> List[Dict]:
+        """Full-text search over ticket metadata and transcripts
+
+        Results are ordered by rank; pass the (rank, thread_id) of the last
+        result as cursor to get the next page.
+        """
+        if not self.systems_pool:
+            return []
+
+        rank, thread_id = cursor or (None, None)
+        try:
+            async with self._acquire('systems') as conn:
+                rows = await conn.fetch(
+                    QUERIES['ticket_search'],
+                    query, categories, user_id, after, before, rank, thread_id, limit
+                )
+                return [dict(row) for row in rows]
+        except Exception as e:
+            logger.error(f"Error searching tickets: {e}")
+            return []
+
 
 # Global database instance
 db = TicketDatabase()
@@ -314,71 +1515,659 @@ def convert_datetime_to_json_serializable(obj: Any) -> Any:
 
 
 # Utility functions
-async def update_thread_status_indicator(thread: discord.Thread, status: str):
-    """Updates the thread name with a status indicator emoji
+# Thread name prefix for each ticket status
+STATUS_INDICATORS = {
+    'unclaimed': '⚪',
+    'claimed': '🟢',
+    'archive_request': '🟡',
+    'archived': '🔴'
+}
+
+
+def build_thread_name(name: str, status: str) -> str:
+    """Returns the thread name with the indicator of the given status
 
     Args:
-        thread: The thread to update
+        name: The current thread name (with or without an indicator)
         status: One of 'unclaimed', 'claimed', 'archive_request', 'archived'
     """
-    indicators = {
-        'unclaimed': '⚪',
-        'claimed': '🟢',
-        'archive_request': '🟡',
-        'archived': '🔴'
+    indicator = STATUS_INDICATORS.get(status, '⚪')
+
+    # Remove any existing indicator from the name
+    for emoji in STATUS_INDICATORS.values():
+        name = name.replace(f"{emoji} ", "").strip()
+
+    return f"{indicator} {name}"
+
+
+class ThreadRenameScheduler:
+    """Coalesces thread status renames under Discord's rename limit
+
+    Channel renames are limited to 2 per 10 minutes per thread. Only the latest
+    requested status is kept; it's applied in the background as soon as the
+    bucket allows, and skipped if the name already matches.
+    """
+
+    RENAME_LIMIT = 2
+    RENAME_WINDOW = 600
+
+    def __init__(self):
+        self.desired: Dict[int, tuple] = {}  # thread_id -> (thread, status)
+        self.workers: Dict[int, asyncio.Task] = {}
+        self.history: Dict[int, deque] = {}  # thread_id -> rename times
+        self.names: Dict[int, str] = {}  # thread_id -> last name we applied
+
+    def _wait_time(self, thread_id: int) -> float:
+        """Seconds before the thread's rename bucket allows another rename"""
+        history = self.history.get(thread_id)
+        if not history:
+            return 0.0
+        now = time.monotonic()
+        while history and now - history[0] >= self.RENAME_WINDOW:
+            history.popleft()
+        if not history:
+            del self.history[thread_id]
+            return 0.0
+        if len(history) < self.RENAME_LIMIT:
+            return 0.0
+        return history[0] + self.RENAME_WINDOW - now
+
+    def _record(self, thread_id: int, name: str):
+        self.history.setdefault(thread_id, deque()).append(time.monotonic())
+        self.names[thread_id] = name
+
+    def _target_name(self, thread: discord.Thread, status: str) -> Optional[str]:
+        """Returns the new name, or None if no rename is needed"""
+        current = self.names.get(thread.id, thread.name)
+        new_name = build_thread_name(current, status)
+        return None if new_name == current else new_name
+
+    def schedule(self, thread: discord.Thread, status: str):
+        """Requests a status indicator, without waiting for the rename"""
+        self.desired[thread.id] = (thread, status)
+        worker = self.workers.get(thread.id)
+        if not worker or worker.done():
+            self.workers[thread.id] = asyncio.create_task(self._run(thread.id))
+
+    def _cancel(self, thread_id: int):
+        self.desired.pop(thread_id, None)
+        worker = self.workers.pop(thread_id, None)
+        if worker and not worker.done():
+            worker.cancel()
+
+    def _expire(self, thread_id: int):
+        """Forgets a thread once it has no rename pending and its rename window has passed"""
+        if thread_id in self.workers or thread_id in self.desired:
+            return  # Called again when the worker exits
+
+        self._wait_time(thread_id)  # Drops renames older than the window
+        history = self.history.get(thread_id)
+        if not history:
+            self.names.pop(thread_id, None)
+            return
+        remaining = history[-1] + self.RENAME_WINDOW - time.monotonic()
+        asyncio.get_running_loop().call_later(remaining, self._expire, thread_id)
+
+    def forget(self, thread_id: int):
+        """Drops everything about a deleted thread"""
+        self._cancel(thread_id)
+        self.history.pop(thread_id, None)
+        self.names.pop(thread_id, None)
+
+    async def _run(self, thread_id: int):
+        try:
+            while thread_id in self.desired:
+                thread, status = self.desired[thread_id]
+                new_name = self._target_name(thread, status)
+                if new_name is None:
+                    del self.desired[thread_id]
+                    break
+
+                wait = self._wait_time(thread_id)
+                if wait > 0:
+                    # The desired status may change while we wait
+                    await asyncio.sleep(wait)
+                    continue
+
+                del self.desired[thread_id]
+                self._record(thread_id, new_name)
+                try:
+                    await thread.edit(name=new_name)
+                except discord.HTTPException as e:
+                    self.names.pop(thread_id, None)
+                    logger.warning(f"Could not update thread status indicator: {e}")
+        finally:
+            if self.workers.get(thread_id) is asyncio.current_task():
+                del self.workers[thread_id]
+            self._expire(thread_id)
+
+    async def archive(self, thread: discord.Thread):
+        """Archives and locks the thread, renaming it in the same edit if the bucket allows"""
+        self._cancel(thread.id)
+        kwargs = {'archived': True, 'locked': True}
+
+        # An archived thread can't be renamed, so it's now or never
+        new_name = self._target_name(thread, 'archived')
+        if new_name and self._wait_time(thread.id) == 0:
+            kwargs['name'] = new_name
+            self._record(thread.id, new_name)
+
+        try:
+            await thread.edit(**kwargs)
+        finally:
+            self._expire(thread.id)
+
+    async def unarchive(self, thread: discord.Thread, status: str):
+        """Unarchives and unlocks the thread, then restores its status indicator"""
+        self._cancel(thread.id)
+        kwargs = {'archived': False, 'locked': False}
+
+        new_name = self._target_name(thread, status)
+        if new_name and self._wait_time(thread.id) == 0:
+            kwargs['name'] = new_name
+            self._record(thread.id, new_name)
+            new_name = None
+
+        try:
+            await thread.edit(**kwargs)
+        except Exception:
+            self._expire(thread.id)
+            raise
+
+        # Bucket exhausted: rename later
+        if new_name:
+            self.schedule(thread, status)
+        else:
+            self._expire(thread.id)
+
+
+# Global rename scheduler
+thread_renamer = ThreadRenameScheduler()
+
+
+class CompressedSpool:
+    """Gzip stream written to a spooled temp file (spills to disk past max_size)"""
+
+    def __init__(self, max_size: int):
+        self.compressor = zlib.compressobj(6, zlib.DEFLATED, 31)
+        self.file = tempfile.SpooledTemporaryFile(max_size=max_size)
+
+    def write(self, data: bytes):
+        self.file.write(self.compressor.compress(data))
+
+    def finish(self) -> int:
+        """Flushes the compressor and rewinds, returns the compressed size"""
+        self.file.write(self.compressor.flush())
+        size = self.file.tell()
+        self.file.seek(0)
+        return size
+
+    def read(self) -> bytes:
+        return self.file.read()
+
+    def save(self, path: str):
+        with open(path, 'wb') as f:
+            shutil.copyfileobj(self.file, f)
+
+    def close(self):
+        self.file.close()
+
+
+def serialize_transcript_message(message: discord.Message) -> Dict[str, Any]:
+    """Transcript record of a message"""
+    return {
+        'id': message.id,
+        'author_id': message.author.id,
+        'author': str(message.author),
+        'bot': message.author.bot,
+        'created_at': message.created_at.isoformat(),
+        'edited_at': message.edited_at.isoformat() if message.edited_at else None,
+        'content': message.content,
+        'embeds': [
+            {'title': embed.title, 'description': embed.description}
+            for embed in message.embeds
+        ],
+        'attachments': [attachment.url for attachment in message.attachments],
     }
 
-    indicator = indicators.get(status, '⚪')
 
-    # Remove any existing indicator from the name
-    current_name = thread.name
-    for emoji in indicators.values():
-        current_name = current_name.replace(f"{emoji} ", "").strip()
+def render_transcript_message_html(record: Dict[str, Any]) -> str:
+    """HTML block of a transcript record"""
+    parts = [html.escape(record['content'])]
+    for embed in record['embeds']:
+        parts.append(f"<blockquote><b>{html.escape(embed['title'] or '')}</b><br>{html.escape(embed['description'] or '')}</blockquote>")
+    for url in record['attachments']:
+        parts.append(f'<a href="{html.escape(url)}">{html.escape(url.rsplit("/", 1)[-1])}</a>')
+    return (
+        f'<div class="message"><span class="author">{html.escape(record["author"])}</span> '
+        f'<time>{record["created_at"]}</time><div>{"<br>".join(parts)}</div></div>\n'
+    )
+
+
+class TranscriptArchiver:
+    """Captures the history of archived ticket threads in the background
+
+    The history is read page by page and each page is compressed off the event
+    loop into a spooled file, so memory stays bounded whatever the thread size.
+    """
+
+    def __init__(self, storage: str, directory: str, with_html: bool, concurrency: int):
+        self.storage = storage
+        self.directory = directory
+        self.with_html = with_html
+        self.semaphore = asyncio.Semaphore(concurrency)
+        self.tasks: Dict[int, asyncio.Task] = {}
+
+    def schedule(self, thread: discord.Thread, budget: Optional[RestBudget] = None):
+        """Starts capturing a thread, unless disabled or already running
+
+        With a budget, each history page is paid for before it's fetched.
+        """
+        if self.storage == 'off' or thread.id in self.tasks:
+            return
+        task = asyncio.create_task(self._run(thread, budget))
+        self.tasks[thread.id] = task
+        task.add_done_callback(lambda _: self.tasks.pop(thread.id, None))
+
+    async def drain(self):
+        """Waits for the running captures"""
+        if self.tasks:
+            await asyncio.gather(*self.tasks.values(), return_exceptions=True)
+
+    async def _run(self, thread: discord.Thread, budget: Optional[RestBudget]):
+        async with self.semaphore:
+            try:
+                await self.capture(thread, budget)
+            except Exception as e:
+                logger.error(f"Error capturing transcript of {thread.id}: {e}")
 
-    # Add the new indicator
-    new_name = f"{indicator} {current_name}"
+    async def capture(self, thread: discord.Thread, budget: Optional[RestBudget] = None):
+        """Streams the thread history into compressed JSONL (and HTML) and stores it"""
+        started = time.monotonic()
+        jsonl = CompressedSpool(TRANSCRIPT_SPOOL_SIZE)
+        page_html = CompressedSpool(TRANSCRIPT_SPOOL_SIZE) if self.with_html else None
+        message_count = 0
+        search_text = []
+        search_chars = 0
 
+        try:
+            if page_html:
+                await asyncio.to_thread(page_html.write, (
+                    f'<!DOCTYPE html><html><head><meta charset="utf-8">'
+                    f'<title>{html.escape(thread.name)}</title></head><body>\n'
+                    f'<h1>{html.escape(thread.name)}</h1>\n'
+                ).encode())
+
+            page = []
+            if budget:
+                await budget.spend()
+            async for message in thread.history(limit=None, oldest_first=True):
+                record = serialize_transcript_message(message)
+                page.append(record)
+
+                # Keep the beginning of the conversation for search
+                if search_chars < TRANSCRIPT_SEARCH_CHARS:
+                    text = ' '.join(filter(None, [record['content']] + [
+                        part for embed in record['embeds'] for part in (embed['title'], embed['description'])
+                    ]))
+                    search_text.append(text[:TRANSCRIPT_SEARCH_CHARS - search_chars])
+                    search_chars += len(text)
+                if len(page) >= TRANSCRIPT_PAGE_SIZE:
+                    await self._write_page(page, jsonl, page_html)
+                    message_count += len(page)
+                    page = []
+                    if budget:
+                        await budget.spend()
+            if page:
+                await self._write_page(page, jsonl, page_html)
+                message_count += len(page)
+
+            if page_html:
+                await asyncio.to_thread(page_html.write, b'</body></html>\n')
+
+            jsonl_size = await asyncio.to_thread(jsonl.finish)
+            html_size = await asyncio.to_thread(page_html.finish) if page_html else 0
+
+            storage = self.storage
+            if storage == 'db' and jsonl_size + html_size > TRANSCRIPT_MAX_DB_BYTES:
+                logger.warning(f"Transcript of {thread.id} is {jsonl_size + html_size} bytes, storing it locally")
+                storage = 'local'
+
+            if storage == 'db':
+                await db.save_transcript(
+                    thread.id, message_count, storage, None,
+                    await asyncio.to_thread(jsonl.read),
+                    await asyncio.to_thread(page_html.read) if page_html else None,
+                    '\n'.join(search_text)
+                )
+            else:
+                path = os.path.join(self.directory, f"{thread.id}.jsonl.gz")
+                await asyncio.to_thread(os.makedirs, self.directory, exist_ok=True)
+                await asyncio.to_thread(jsonl.save, path)
+                if page_html:
+                    await asyncio.to_thread(page_html.save, os.path.join(self.directory, f"{thread.id}.html.gz"))
+                await db.save_transcript(thread.id, message_count, storage, path, None, None, '\n'.join(search_text))
+        finally:
+            jsonl.close()
+            if page_html:
+                page_html.close()
+
+        logger.info(
+            f"Transcript of {thread.id} captured: {message_count} messages, "
+            f"{jsonl_size} bytes in {time.monotonic() - started:.1f}s"
+        )
+
+    @staticmethod
+    async def _write_page(page: List[Dict], jsonl: CompressedSpool, page_html: Optional[CompressedSpool]):
+        """Compresses one page of records off the event loop"""
+        lines = ''.join(json.dumps(record, ensure_ascii=False) + '\n' for record in page)
+        await asyncio.to_thread(jsonl.write, lines.encode())
+        if page_html:
+            blocks = ''.join(render_transcript_message_html(record) for record in page)
+            await asyncio.to_thread(page_html.write, blocks.encode())
+
+
+# Global transcript archiver
+transcript_archiver = TranscriptArchiver(
+    TRANSCRIPT_STORAGE,
+    TRANSCRIPT_DIR,
+    TRANSCRIPT_HTML,
+    TRANSCRIPT_CONCURRENCY
+)
+
+
+async def defer_while(interaction: discord.Interaction, coro):
+    """Defers the interaction (ephemeral) while awaiting coro, returns coro's result"""
+    _, result = await asyncio.gather(
+        interaction.response.defer(ephemeral=True),
+        coro
+    )
+    return result
+
+
+async def send_flow_timeout(interaction: discord.Interaction):
+    """Tells the user a creation flow timed out"""
+    message = f"{EMOJIS['undone']} This is taking longer than expected. Please try again in a moment."
     try:
-        await thread.edit(name=new_name)
-    except Exception as e:
-        logger.error(f"Error updating thread name: {e}")
+        if interaction.response.is_done():
+            await interaction.followup.send(message, ephemeral=True)
+        else:
+            await interaction.response.send_message(message, ephemeral=True)
+    except discord.HTTPException as e:
+        logger.error(f"Could not send flow timeout message: {e}")
 
 
-async def get_guild_id_from_invite(invite_url: str) -> Optional[int]:
-    """Extracts server ID from invitation link"""
-    # Extract invitation code
-    invite_code = invite_url.strip()
+class InviteResolver:
+    """Resolves invite codes to guild IDs on a shared HTTP session
+
+    Results are cached (invalid codes too), concurrent lookups of the same code
+    share one request, and Discord's rate limit headers on /invites are honored.
+    """
+
+    API_URL = 'https://discord.com/api/v10/invites/{code}'
 
     # Patterns for Discord links
-    patterns = [
-        r'discord\.gg/([a-zA-Z0-9-]+)',
-        r'discord\.com/invite/([a-zA-Z0-9-]+)',
-        r'discordapp\.com/invite/([a-zA-Z0-9-]+)',
+    PATTERNS = [
+        re.compile(r'discord\.gg/([a-zA-Z0-9-]+)'),
+        re.compile(r'discord\.com/invite/([a-zA-Z0-9-]+)'),
+        re.compile(r'discordapp\.com/invite/([a-zA-Z0-9-]+)'),
     ]
 
-    code = None
-    for pattern in patterns:
-        match = re.search(pattern, invite_code)
-        if match:
-            code = match.group(1)
-            break
+    def __init__(self):
+        self.session: Optional[aiohttp.ClientSession] = None
+        self.owns_session = False
+        # code -> (expires_at, guild_id or None)
+        self.cache: OrderedDict = OrderedDict()
+        self.pending: Dict[str, asyncio.Future] = {}
+        self.blocked_until = 0.0
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def extract_code(cls, invite_url: str) -> str:
+        """Extracts the invite code from a link (or returns the input if it's just the code)"""
+        invite_code = invite_url.strip()
+        for pattern in cls.PATTERNS:
+            match = pattern.search(invite_code)
+            if match:
+                return match.group(1)
+        return invite_code
+
+    def get_session(self) -> aiohttp.ClientSession:
+        """Returns the shared session, creating one if the bot didn't provide it"""
+        if self.session is None or self.session.closed:
+            self.session = aiohttp.ClientSession()
+            self.owns_session = True
+        return self.session
+
+    async def close(self):
+        """Closes the session if this resolver created it"""
+        if self.owns_session and self.session and not self.session.closed:
+            await self.session.close()
+        self.session = None
+        self.owns_session = False
+
+    async def resolve(self, invite_url: str) -> Optional[int]:
+        """Returns the guild ID of an invite, or None if invalid/unavailable"""
+        code = self.extract_code(invite_url)
+        if not code:
+            return None
 
-    if not code:
-        # If it's just the code
-        code = invite_code
+        cached = self.cache.get(code)
+        if cached and cached[0] > time.monotonic():
+            self.cache.move_to_end(code)
+            self.hits += 1
+            return cached[1]
+        self.misses += 1
 
-    try:
-        # Use Discord API to retrieve invitation information
-        async with aiohttp.ClientSession() as session:
-            async with session.get(f'https://discord.com/api/v10/invites/{code}') as resp:
-                if resp.status == 200:
-                    data = await resp.json()
-                    if 'guild' in data and 'id' in data['guild']:
-                        return int(data['guild']['id'])
-    except Exception as e:
-        logger.error(f"Error fetching invite info: {e}")
+        # Share the request with concurrent lookups of the same code
+        if code in self.pending:
+            return await asyncio.shield(self.pending[code])
+
+        future = asyncio.get_running_loop().create_future()
+        self.pending[code] = future
+        guild_id = None
+        try:
+            guild_id = await self._fetch(code)
+            return guild_id
+        except Exception as e:
+            logger.error(f"Error fetching invite info: {e}")
+            return None
+        finally:
+            # Also resolves waiters if this lookup was cancelled
+            future.set_result(guild_id)
+            del self.pending[code]
+
+    def _store(self, code: str, guild_id: Optional[int], ttl: int):
+        self.cache[code] = (time.monotonic() + ttl, guild_id)
+        self.cache.move_to_end(code)
+        while len(self.cache) > INVITE_CACHE_SIZE:
+            self.cache.popitem(last=False)
+
+    async def _fetch(self, code: str) -> Optional[int]:
+        """Calls Discord's /invites endpoint, honoring its rate limit"""
+        wait = self.blocked_until - time.monotonic()
+        if wait > 0:
+            if wait > FLOW_TIMEOUT:
+                logger.warning(f"Invite lookups rate limited for {wait:.1f}s, skipping {code}")
+                return None
+            await asyncio.sleep(wait)
+
+        session = self.get_session()
+        async with session.get(self.API_URL.format(code=code)) as resp:
+            # Pause lookups once the bucket is exhausted
+            remaining = resp.headers.get('X-RateLimit-Remaining')
+            reset_after = resp.headers.get('X-RateLimit-Reset-After')
+            if remaining == '0' and reset_after:
+                self.blocked_until = time.monotonic() + float(reset_after)
+
+            if resp.status == 200:
+                data = await resp.json()
+                guild_id = None
+                if 'guild' in data and 'id' in data['guild']:
+                    guild_id = int(data['guild']['id'])
+                self._store(code, guild_id, INVITE_CACHE_TTL if guild_id else INVITE_NEGATIVE_TTL)
+                return guild_id
+
+            if resp.status == 404:
+                # Unknown or expired invite
+                self._store(code, None, INVITE_NEGATIVE_TTL)
+                return None
+
+            if resp.status == 429:
+                retry_after = float(resp.headers.get('Retry-After') or reset_after or 1)
+                self.blocked_until = time.monotonic() + retry_after
+                logger.warning(f"Rate limited on invite lookup, retry after {retry_after}s")
+                return None
+
+            logger.error(f"Unexpected status {resp.status} fetching invite {code}")
+            return None
+
+
+# Global invite resolver (session set by the cog)
+invite_resolver = InviteResolver()
+
+
+async def get_guild_id_from_invite(invite_url: str) -> Optional[int]:
+    """Extracts server ID from invitation link"""
+    return await invite_resolver.resolve(invite_url)
+
+
+def edit_distance(a: str, b: str) -> int:
+    """Levenshtein distance between two short strings"""
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            current.append(min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (char_a != char_b)
+            ))
+        previous = current
+    return previous[-1]
+
+
+class ErrorCodeResolver:
+    """Resolves user-typed error codes to Moddy DB errors
+
+    Input is normalized first (case, spaces, dashes), then looked up exactly,
+    then with look-alike characters fixed (O -> 0, I/L -> 1), then against the
+    codes of the last hours (unique prefix or edit distance 1). Results are
+    cached (unknown codes too), and concurrent lookups of the same code share
+    one query, so a code reported by hundreds of users is served from memory.
+    """
+
+    CONFUSABLES = str.maketrans({'O': '0', 'I': '1', 'L': '1'})
+
+    def __init__(self):
+        # normalized code -> (expires_at, error info or None)
+        self.cache: OrderedDict = OrderedDict()
+        self.pending: Dict[str, asyncio.Future] = {}
+        # (expires_at, codes of the last ERROR_FUZZY_WINDOW_HOURS)
+        self.recent_codes: tuple = (0.0, [])
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def normalize(raw: str) -> str:
+        return re.sub(r'[\s\-_]', '', raw).upper()
+
+    async def resolve(self, raw: str) -> Optional[Dict]:
+        """Returns the error info of a code (its error_code may be the corrected one)"""
+        code = self.normalize(raw)
+        if not code:
+            return None
+
+        cached = self.cache.get(code)
+        if cached and cached[0] > time.monotonic():
+            self.cache.move_to_end(code)
+            self.hits += 1
+            return cached[1]
+        self.misses += 1
+
+        # Share the lookup with concurrent reports of the same code
+        if code in self.pending:
+            return await asyncio.shield(self.pending[code])
 
-    return None
+        future = asyncio.get_running_loop().create_future()
+        self.pending[code] = future
+        error = None
+        try:
+            error = await self._lookup(code)
+            return error
+        except Exception as e:
+            logger.error(f"Error resolving error code {code}: {e}")
+            return None
+        finally:
+            future.set_result(error)
+            del self.pending[code]
+
+    async def _lookup(self, code: str) -> Optional[Dict]:
+        candidates = [code]
+        fixed = code.translate(self.CONFUSABLES)
+        if fixed != code:
+            candidates.append(fixed)
+
+        for candidate in candidates:
+            if len(candidate) == ERROR_CODE_LENGTH:
+                error = await db.get_error_info(candidate)
+                if error:
+                    self._store(code, error, ERROR_CACHE_TTL)
+                    return error
+
+        # Fuzzy match against recent codes
+        recent = await self._get_recent_codes()
+        if recent is None:
+            # DB unavailable: don't remember the miss
+            return None
+
+        # Pure-Python distances over thousands of codes, kept off the event loop
+        match = await asyncio.to_thread(self._closest, candidates, recent)
+        error = await db.get_error_info(match) if match else None
+        self._store(code, error, ERROR_CACHE_TTL if error else ERROR_NEGATIVE_TTL)
+        return error
+
+    @staticmethod
+    def _closest(candidates: List[str], codes: List[str]) -> Optional[str]:
+        """Unique recent code starting with, or one edit away from, a candidate"""
+        for candidate in candidates:
+            if len(candidate) < ERROR_CODE_LENGTH:
+                prefixed = [code for code in codes if code.startswith(candidate)]
+                if len(prefixed) == 1:
+                    return prefixed[0]
+
+        close = set()
+        for code in codes:
+            for candidate in candidates:
+                if abs(len(code) - len(candidate)) <= 1 and edit_distance(candidate, code) <= 1:
+                    close.add(code)
+                    break
+            # A second match makes it ambiguous, no need to look further
+            if len(close) > 1:
+                return None
+        return close.pop() if close else None
+
+    async def _get_recent_codes(self) -> Optional[List[str]]:
+        """Codes of the last hours, refreshed at most every ERROR_RECENT_CODES_TTL seconds"""
+        expires_at, codes = self.recent_codes
+        if expires_at > time.monotonic():
+            return codes
+
+        codes = await db.get_recent_error_codes(ERROR_FUZZY_WINDOW_HOURS, ERROR_FUZZY_MAX_CODES)
+        if codes is not None:
+            self.recent_codes = (time.monotonic() + ERROR_RECENT_CODES_TTL, codes)
+        return codes
+
+    def _store(self, code: str, error: Optional[Dict], ttl: int):
+        self.cache[code] = (time.monotonic() + ttl, error)
+        self.cache.move_to_end(code)
+        while len(self.cache) > ERROR_CACHE_SIZE:
+            self.cache.popitem(last=False)
+
+
+# Global error code resolver
+error_resolver = ErrorCodeResolver()
 
 
 def get_staff_roles(staff_info: Optional[Dict]) -> List[str]:
@@ -403,33 +2192,130 @@ def get_staff_roles(staff_info: Optional[Dict]) -> List[str]:
     return []
 
 
-def can_manage_ticket(staff_roles: List[str], category: str) -> bool:
-    """Checks if a staff member can manage a ticket of a given category"""
-    # Manager and any Supervisor can manage everything
-    if 'Manager' in staff_roles:
-        return True
+# Staff roles interned to bit flags
+ROLE_FLAGS = {
+    'Support': 1 << 0,
+    'Dev': 1 << 1,
+    'Moderator': 1 << 2,
+    'Communication': 1 << 3,
+    'Manager': 1 << 4,
+    'Supervisor_Mod': 1 << 5,
+    'Supervisor_Com': 1 << 6,
+    'Supervisor_Sup': 1 << 7,
+}
+
+# Set for any Supervisor_* role, including ones not listed above
+ROLE_SUPERVISOR = 1 << 8
+
+# Manager and any Supervisor can manage everything
+ROLE_OVERRIDE_MASK = ROLE_FLAGS['Manager'] | ROLE_SUPERVISOR
+
+# Permissions by category
+CATEGORY_ROLES = {
+    'support': ['Support'],
+    'bug_report': ['Dev'],
+    'sanction_appeal': ['Moderator'],
+    'legal_request': ['Manager'],
+    'payments_billing': ['Support'],
+    'other_request': ['Support', 'Communication', 'Moderator', 'Dev'],
+}
+
 
-    # Check if user has any Supervisor role (Supervisor_Mod, Supervisor_Com, Supervisor_Sup)
-    for role in staff_roles:
+def _roles_to_mask(roles: List[str]) -> int:
+    """Converts a list of role names to a bit mask"""
+    mask = 0
+    for role in roles:
+        mask |= ROLE_FLAGS.get(role, 0)
         if role.startswith('Supervisor_'):
-            return True
-
-    # Permissions by category
-    permissions = {
-        'support': ['Support'],
-        'bug_report': ['Dev'],
-        'sanction_appeal': ['Moderator'],
-        'legal_request': ['Manager'],  # Already checked above
-        'payments_billing': ['Support'],
-        'other_request': ['Support', 'Communication', 'Moderator', 'Dev'],
-    }
+            mask |= ROLE_SUPERVISOR
+    return mask
+
+
+# Required role mask for each category, compiled once at import
+CATEGORY_MASKS = {
+    category: _roles_to_mask(roles) | ROLE_OVERRIDE_MASK
+    for category, roles in CATEGORY_ROLES.items()
+}
 
-    if category in permissions:
-        for role in staff_roles:
-            if role in permissions[category]:
-                return True
 
-    return False
+def _parse_json_field(value: Any, default: Any) -> Any:
+    """Decodes a JSONB column that may come back as a string"""
+    if isinstance(value, str):
+        try:
+            return json.loads(value)
+        except json.JSONDecodeError:
+            logger.error(f"Failed to parse JSON field: {value}")
+            return default
+    return value if value is not None else default
+
+
+def compile_staff_permissions(staff_info: Dict) -> Dict:
+    """Precomputes the permission fields used by every authorization check
+
+    Adds to staff_info:
+        roles: parsed list of role names
+        role_mask: roles as bit flags (see ROLE_FLAGS)
+        denied_commands: frozenset of denied command names
+        granted_permissions: frozenset of permissions granted by the staff's roles
+    """
+    roles = get_staff_roles(staff_info)
+    staff_info['roles'] = roles
+    staff_info['role_mask'] = _roles_to_mask(roles)
+
+    denied = _parse_json_field(staff_info.get('denied_commands'), [])
+    staff_info['denied_commands'] = frozenset(denied) if isinstance(denied, list) else frozenset()
+
+    # role_permissions: {role: [permission, ...]} or {role: {permission: bool}}
+    role_permissions = _parse_json_field(staff_info.get('role_permissions'), {})
+    granted = set()
+    if isinstance(role_permissions, dict):
+        for role in roles:
+            perms = role_permissions.get(role)
+            if isinstance(perms, list):
+                granted.update(perms)
+            elif isinstance(perms, dict):
+                granted.update(perm for perm, allowed in perms.items() if allowed)
+    staff_info['role_permissions'] = role_permissions
+    staff_info['granted_permissions'] = frozenset(granted)
+
+    return staff_info
+
+
+def get_staff_role_mask(staff_info: Optional[Dict]) -> int:
+    """Returns the role mask of a staff member"""
+    if not staff_info:
+        return 0
+    if 'role_mask' not in staff_info:
+        compile_staff_permissions(staff_info)
+    return staff_info['role_mask']
+
+
+def can_manage_ticket(role_mask: int, category: str) -> bool:
+    """Checks if a staff member can manage a ticket of a given category"""
+    return bool(role_mask & CATEGORY_MASKS.get(category, ROLE_OVERRIDE_MASK))
+
+
+def is_supervisor_or_manager(role_mask: int) -> bool:
+    """Checks if a staff member is a Manager or any Supervisor"""
+    return bool(role_mask & ROLE_OVERRIDE_MASK)
+
+
+def is_command_denied(staff_info: Optional[Dict], command: str) -> bool:
+    """Checks if a command is in the staff member's denied_commands"""
+    if not staff_info:
+        return True
+    if 'role_mask' not in staff_info:
+        compile_staff_permissions(staff_info)
+    return command in staff_info['denied_commands']
+
+
+def has_role_permission(staff_info: Optional[Dict], permission: str) -> bool:
+    """Checks if one of the staff member's roles grants a permission"""
+    if not staff_info:
+        return False
+    if 'role_mask' not in staff_info:
+        compile_staff_permissions(staff_info)
+    return permission in staff_info['granted_permissions']
 
 
 # Modals
@@ -439,8 +2325,8 @@ class ErrorCodeModal(ui.Modal, title="Error Code"):
     error_code = ui.TextInput(
         label="Error Code",
         placeholder="Ex: BB1FE07D",
-        min_length=8,
-        max_length=8,
+        min_length=ERROR_CODE_MIN_LENGTH,
+        max_length=ERROR_CODE_MAX_LENGTH,
         required=True
     )
 
@@ -449,12 +2335,14 @@ class ErrorCodeModal(ui.Modal, title="Error Code"):
         self.callback_func = callback_func
 
     async def on_submit(self, interaction: discord.Interaction):
-        code = self.error_code.value.upper().strip()
+        # Spaces, dashes and case are forgiven, typos are resolved later
+        code = ErrorCodeResolver.normalize(self.error_code.value)
 
         # Check le format
-        if not re.match(r'^[A-Z0-9]{8}$', code):
+        if not re.match(rf'^[A-Z0-9]{{{ERROR_CODE_MIN_LENGTH},{ERROR_CODE_MAX_LENGTH}}}$', code):
             await interaction.response.send_message(
-                f"{EMOJIS['undone']} Le code erreur doit contenir exactement 8 caractères (lettres majuscules ou chiffres).",
+                f"{EMOJIS['undone']} Le code erreur doit contenir entre {ERROR_CODE_MIN_LENGTH} et "
+                f"{ERROR_CODE_MAX_LENGTH} lettres ou chiffres (format: `BB1FE07D`).",
                 ephemeral=True
             )
             return
@@ -528,11 +2416,16 @@ class SupportTypeView(ui.View):
         await self.create_ticket(interaction, {"type": "other"})
 
     async def on_server_invite_submit(self, interaction: discord.Interaction, invite: str):
-        """Callback quand l'utilisateur soumet le lien d'invitation"""
-        await interaction.response.defer(ephemeral=True)
-
-        # Extraire l'ID du serveur
-        guild_id = await get_guild_id_from_invite(invite)
+        """Callback quand l'utilisateur soumet le lien d'invitation"""
+        # Extraire l'ID du serveur pendant le defer
+        try:
+            guild_id = await asyncio.wait_for(
+                defer_while(interaction, get_guild_id_from_invite(invite)),
+                FLOW_TIMEOUT
+            )
+        except asyncio.TimeoutError:
+            await send_flow_timeout(interaction)
+            return
 
         if not guild_id:
             await interaction.followup.send(
@@ -549,7 +2442,7 @@ class SupportTypeView(ui.View):
 
     async def create_ticket(self, interaction: discord.Interaction, metadata: Dict):
         """Crée le ticket de support"""
-        await create_support_ticket(interaction, self.user, metadata)
+        await ticket_admission.submit(interaction, self.user, 'support', metadata)
 
 
 class BugReportHasCodeView(ui.View):
@@ -585,10 +2478,15 @@ class BugReportHasCodeView(ui.View):
 
     async def on_error_code_submit(self, interaction: discord.Interaction, error_code: str):
         """Callback quand l'utilisateur soumet un code erreur"""
-        await interaction.response.defer(ephemeral=True)
-
-        # Retrieve information de l'erreur
-        error_info = await db.get_error_info(error_code)
+        # Retrieve information de l'erreur pendant le defer
+        try:
+            error_info = await asyncio.wait_for(
+                defer_while(interaction, error_resolver.resolve(error_code)),
+                FLOW_TIMEOUT
+            )
+        except asyncio.TimeoutError:
+            await send_flow_timeout(interaction)
+            return
 
         if not error_info:
             await interaction.followup.send(
@@ -597,14 +2495,19 @@ class BugReportHasCodeView(ui.View):
             )
             return
 
-        await self.create_ticket(interaction, {
-            "error_code": error_code,
+        metadata = {
+            "error_code": error_info['error_code'],
             "error_info": error_info
-        })
+        }
+        # Keep what the user typed when it was corrected
+        if error_info['error_code'] != error_code:
+            metadata["error_code_input"] = error_code
+
+        await self.create_ticket(interaction, metadata)
 
     async def create_ticket(self, interaction: discord.Interaction, metadata: Dict):
         """Crée le ticket de bug report"""
-        await create_bug_report_ticket(interaction, self.user, metadata)
+        await ticket_admission.submit(interaction, self.user, 'bug_report', metadata)
 
 
 class SanctionAppealTypeView(ui.View):
@@ -636,10 +2539,15 @@ class SanctionAppealTypeView(ui.View):
             )
             return
 
-        await interaction.response.defer(ephemeral=True)
-
-        # Retrieve user cases
-        cases = await db.get_user_cases(self.user.id)
+        # Retrieve user cases pendant le defer
+        try:
+            cases = await asyncio.wait_for(
+                defer_while(interaction, db.get_user_cases(self.user.id)),
+                FLOW_TIMEOUT
+            )
+        except asyncio.TimeoutError:
+            await send_flow_timeout(interaction)
+            return
 
         if not cases:
             await interaction.followup.send(
@@ -657,10 +2565,15 @@ class SanctionAppealTypeView(ui.View):
 
     async def on_server_invite_submit(self, interaction: discord.Interaction, invite: str):
         """Callback quand l'utilisateur soumet le lien d'invitation"""
-        await interaction.response.defer(ephemeral=True)
-
-        # Extraire l'ID du serveur
-        guild_id = await get_guild_id_from_invite(invite)
+        try:
+            # Extraire l'ID du serveur pendant le defer, puis les cases (une seule deadline)
+            guild_id, cases = await asyncio.wait_for(
+                self.resolve_server_cases(interaction, invite),
+                FLOW_TIMEOUT
+            )
+        except asyncio.TimeoutError:
+            await send_flow_timeout(interaction)
+            return
 
         if not guild_id:
             await interaction.followup.send(
@@ -669,9 +2582,6 @@ class SanctionAppealTypeView(ui.View):
             )
             return
 
-        # Retrieve server cases
-        cases = await db.get_guild_cases(guild_id)
-
         if not cases:
             await interaction.followup.send(
                 f"{EMOJIS['undone']} This server has no open cases.",
@@ -686,6 +2596,13 @@ class SanctionAppealTypeView(ui.View):
             ephemeral=True
         )
 
+    async def resolve_server_cases(self, interaction: discord.Interaction, invite: str) -> tuple:
+        """Resolves the invite (while deferring) then fetches the server's open cases"""
+        guild_id = await defer_while(interaction, get_guild_id_from_invite(invite))
+        if not guild_id:
+            return None, []
+        return guild_id, await db.get_guild_cases(guild_id)
+
 
 class CaseSelectView(ui.LayoutView):
     """Vue avec menu déroulant pour sélectionner une case"""
@@ -735,15 +2652,26 @@ class CaseSelectView(ui.LayoutView):
 
         case_id = interaction.data['values'][0]
 
-        # Trouver la case sélectionnée
-        selected_case = None
-        for case in self.cases:
-            if case['case_id'] == case_id:
-                selected_case = case
-                break
+        # Check the case belongs to the list shown to the user
+        if not any(case['case_id'] == case_id for case in self.cases):
+            await interaction.response.send_message(
+                f"{EMOJIS['undone']} Error retrieving the case.",
+                ephemeral=True
+            )
+            return
+
+        # Fetch full case details only now that it's selected, pendant le defer
+        try:
+            selected_case = await asyncio.wait_for(
+                defer_while(interaction, db.get_case(case_id)),
+                FLOW_TIMEOUT
+            )
+        except asyncio.TimeoutError:
+            await send_flow_timeout(interaction)
+            return
 
         if not selected_case:
-            await interaction.response.send_message(
+            await interaction.followup.send(
                 f"{EMOJIS['undone']} Error retrieving the case.",
                 ephemeral=True
             )
@@ -759,7 +2687,7 @@ class CaseSelectView(ui.LayoutView):
         if self.invite_link:
             metadata["invite_link"] = self.invite_link
 
-        await create_sanction_appeal_ticket(interaction, self.user, metadata)
+        await ticket_admission.submit(interaction, self.user, 'sanction_appeal', metadata)
 
 
 class LegalRequestTypeView(ui.LayoutView):
@@ -829,7 +2757,7 @@ class LegalRequestTypeView(ui.LayoutView):
         metadata = {
             "legal_type": legal_type
         }
-        await create_legal_request_ticket(interaction, self.user, metadata)
+        await ticket_admission.submit(interaction, self.user, 'legal_request', metadata)
 
 
 class SupportPanelView(ui.LayoutView):
@@ -948,7 +2876,7 @@ class SupportPanelView(ui.LayoutView):
 
     async def payments_billing_button(self, interaction: discord.Interaction):
         # Create ticket directly
-        await create_payments_billing_ticket(interaction, interaction.user, {})
+        await ticket_admission.submit(interaction, interaction.user, 'payments_billing', {})
 
     async def legal_request_button(self, interaction: discord.Interaction):
         # Show dropdown menu to choose request type
@@ -960,212 +2888,255 @@ class SupportPanelView(ui.LayoutView):
 
     async def other_request_button(self, interaction: discord.Interaction):
         # Create ticket directly
-        await create_other_request_ticket(interaction, interaction.user, {})
+        await ticket_admission.submit(interaction, interaction.user, 'other_request', {})
 
 
 class TicketControlView(ui.LayoutView):
-    """View with ticket info, Claim and Archive buttons"""
+    """View with ticket info, Claim and Archive buttons
+
+    Built entirely from the ticket record, so it can be re-rendered at any time.
+    The buttons are dynamic items: nothing is stored per ticket.
+    """
 
-    def __init__(self, thread_id: int, category: str, user: discord.User, emoji: str, title: str, mentions: str = "", is_claimed: bool = False, bot=None):
+    def __init__(self, thread_id: int, category: str, user_id: int, created_at: Optional[datetime] = None, is_claimed: bool = False):
         super().__init__(timeout=None)
         self.thread_id = thread_id
         self.category = category
-        self.user = user
-        self.emoji = emoji
-        self.title = title
-        self.mentions = mentions
-        self.bot = bot
+        self.user_id = user_id
+
+        config = TICKET_CATEGORIES.get(category, {})
+        template = CATEGORY_TEMPLATES.get(category, {})
+        emoji = config.get('emoji', EMOJIS['ticket'])
+        title = template.get('title', "Ticket")
+        created_at = created_at or discord.utils.utcnow()
 
         # Create container
         container = ui.Container()
 
-        # Mentions at the top if provided
-        if mentions:
-            container.add_item(ui.TextDisplay(mentions))
+        # Mentions at the top
+        mentions = f"{template.get('role_mentions', '')} <@{user_id}>".strip()
+        container.add_item(ui.TextDisplay(mentions))
 
         # Header with ticket info
         container.add_item(ui.TextDisplay(
             f"### {emoji} {title}\n"
-            f"**User:** {user.mention} (`{user.id}`)\n"
-            f"**Created:** <t:{int(discord.utils.utcnow().timestamp())}:F>"
+            f"**User:** <@{user_id}> (`{user_id}`)\n"
+            f"**Created:** <t:{int(created_at.timestamp())}:F>"
         ))
 
         # Claim and Archive buttons
         button_row = ui.ActionRow()
+        button_row.add_item(TicketClaimButton(thread_id, is_claimed))
+        button_row.add_item(TicketArchiveButton(thread_id))
+        container.add_item(button_row)
+        self.add_item(container)
+
+    @classmethod
+    def from_ticket(cls, ticket: Dict) -> 'TicketControlView':
+        """Rebuilds the control view of a ticket from its DB record"""
+        return cls(
+            ticket['thread_id'],
+            ticket['category'],
+            ticket['user_id'],
+            created_at=ticket.get('created_at'),
+            is_claimed=bool(ticket['claimed_by'])
+        )
 
-        # Create buttons as instances (not decorators)
-        claim_button = ui.Button(
+
+class TicketClaimButton(ui.DynamicItem[ui.Button], template=r'ticket:claim:(?P<thread_id>[0-9]+)'):
+    """Claim/Unclaim button, routed by custom_id"""
+
+    def __init__(self, thread_id: int, is_claimed: bool = False):
+        super().__init__(ui.Button(
             label="Unclaim" if is_claimed else "Claim",
             style=discord.ButtonStyle.primary,
             emoji=EMOJIS['front_hand'],
             custom_id=f"ticket:claim:{thread_id}"
-        )
-        claim_button.callback = self.handle_claim
+        ))
+        self.thread_id = thread_id
+
+    @classmethod
+    async def from_custom_id(cls, interaction: discord.Interaction, item: ui.Button, match):
+        return cls(int(match['thread_id']))
+
+    async def callback(self, interaction: discord.Interaction):
+        await handle_ticket_claim(interaction, self.thread_id)
+
 
-        archive_button = ui.Button(
+class TicketArchiveButton(ui.DynamicItem[ui.Button], template=r'ticket:archive:(?P<thread_id>[0-9]+)'):
+    """Archive button, routed by custom_id"""
+
+    def __init__(self, thread_id: int):
+        super().__init__(ui.Button(
             label="Archive",
             style=discord.ButtonStyle.secondary,
             emoji=EMOJIS['archive'],
             custom_id=f"ticket:archive:{thread_id}"
-        )
-        archive_button.callback = self.handle_archive
+        ))
+        self.thread_id = thread_id
 
-        button_row.add_item(claim_button)
-        button_row.add_item(archive_button)
-        container.add_item(button_row)
-        self.add_item(container)
+    @classmethod
+    async def from_custom_id(cls, interaction: discord.Interaction, item: ui.Button, match):
+        return cls(int(match['thread_id']))
 
-    async def handle_claim(self, interaction: discord.Interaction):
-        """Gère le claim/unclaim d'un ticket"""
-        # Retrieve information du staff
-        staff_info = await db.get_staff_info(interaction.user.id)
+    async def callback(self, interaction: discord.Interaction):
+        await handle_ticket_archive(interaction, self.thread_id)
 
-        if not staff_info:
-            await interaction.response.send_message(
-                f"{EMOJIS['undone']} You are not a staff member.",
-                ephemeral=True
-            )
-            return
 
-        staff_roles = get_staff_roles(staff_info)
-        logger.info(f"User {interaction.user.id} has roles: {staff_roles} for category {self.category}")
+async def handle_ticket_claim(interaction: discord.Interaction, thread_id: int):
+    """Gère le claim/unclaim d'un ticket"""
+    # Retrieve information du staff
+    try:
+        staff_info = await db.get_staff_info(interaction.user.id)
+    except DatabaseUnavailable:
+        await interaction.response.send_message(
+            f"{EMOJIS['undone']} {DB_UNAVAILABLE_MESSAGE}",
+            ephemeral=True
+        )
+        return
 
-        # Check les permissions
-        if not can_manage_ticket(staff_roles, self.category):
-            await interaction.response.send_message(
-                f"{EMOJIS['undone']} You do not have permission to manage this type of ticket.",
-                ephemeral=True
-            )
-            return
+    if not staff_info:
+        await interaction.response.send_message(
+            f"{EMOJIS['undone']} You are not a staff member.",
+            ephemeral=True
+        )
+        return
 
-        # Retrieve le ticket
-        ticket = await db.get_ticket(self.thread_id)
+    # Retrieve le ticket
+    ticket = await db.get_ticket(thread_id)
 
-        if not ticket:
-            await interaction.response.send_message(
-                f"{EMOJIS['undone']} Ticket not found.",
-                ephemeral=True
-            )
-            return
+    if not ticket:
+        await interaction.response.send_message(
+            f"{EMOJIS['undone']} Ticket not found.",
+            ephemeral=True
+        )
+        return
 
-        # Si le ticket est déjà claim
-        if ticket['claimed_by']:
-            # Check si c'est le même staff ou un supervisor/manager
-            is_supervisor_or_manager = 'Manager' in staff_roles or any(role.startswith('Supervisor_') for role in staff_roles)
-
-            if ticket['claimed_by'] == interaction.user.id or is_supervisor_or_manager:
-                # Unclaim
-                await db.unclaim_ticket(self.thread_id)
-
-                # Update thread status indicator
-                thread = interaction.guild.get_thread(self.thread_id)
-                if thread:
-                    try:
-                        await update_thread_status_indicator(thread, 'unclaimed')
-                    except Exception as e:
-                        logger.warning(f"Could not update thread status indicator (rate limit?): {e}")
-
-                await interaction.response.send_message(
-                    f"{EMOJIS['done']} Ticket unclaimed successfully.",
-                    ephemeral=True
-                )
+    role_mask = get_staff_role_mask(staff_info)
+    logger.info(f"User {interaction.user.id} has roles: {staff_info['roles']} for category {ticket['category']}")
 
-                # Send status message to thread
-                if thread:
-                    await thread.send(f"{EMOJIS['front_hand']} {interaction.user.mention} has unclaimed this ticket")
+    # Check les permissions
+    if not can_manage_ticket(role_mask, ticket['category']):
+        await interaction.response.send_message(
+            f"{EMOJIS['undone']} You do not have permission to manage this type of ticket.",
+            ephemeral=True
+        )
+        return
 
-                # Create une nouvelle vue avec le bon label
-                new_view = TicketControlView(self.thread_id, self.category, self.user, self.emoji, self.title, self.mentions, is_claimed=False, bot=self.bot)
-                if self.bot:
-                    self.bot.add_view(new_view)
-                await interaction.message.edit(view=new_view)
-            else:
-                claimed_user = interaction.guild.get_member(ticket['claimed_by'])
-                claimed_name = claimed_user.mention if claimed_user else f"<@{ticket['claimed_by']}>"
-                await interaction.response.send_message(
-                    f"{EMOJIS['undone']} This ticket is already claimed by {claimed_name}. Only a Supervisor/Manager can unclaim it.",
-                    ephemeral=True
-                )
-        else:
-            # Claim
-            await db.claim_ticket(self.thread_id, interaction.user.id)
+    # Si le ticket est déjà claim
+    if ticket['claimed_by']:
+        # Check si c'est le même staff ou un supervisor/manager
+        if ticket['claimed_by'] == interaction.user.id or is_supervisor_or_manager(role_mask):
+            # Unclaim
+            await db.unclaim_ticket(thread_id)
 
             # Update thread status indicator
-            thread = interaction.guild.get_thread(self.thread_id)
+            thread = interaction.guild.get_thread(thread_id)
             if thread:
-                try:
-                    await update_thread_status_indicator(thread, 'claimed')
-                except Exception as e:
-                    logger.warning(f"Could not update thread status indicator (rate limit?): {e}")
+                thread_renamer.schedule(thread, 'unclaimed')
 
             await interaction.response.send_message(
-                f"{EMOJIS['done']} Ticket claimed successfully.",
+                f"{EMOJIS['done']} Ticket unclaimed successfully.",
                 ephemeral=True
             )
 
             # Send status message to thread
             if thread:
-                await thread.send(f"{EMOJIS['front_hand']} {interaction.user.mention} has claimed this ticket")
+                await thread.send(f"{EMOJIS['front_hand']} {interaction.user.mention} has unclaimed this ticket")
 
-            # Create une nouvelle vue avec le bon label
-            new_view = TicketControlView(self.thread_id, self.category, self.user, self.emoji, self.title, self.mentions, is_claimed=True, bot=self.bot)
-            if self.bot:
-                self.bot.add_view(new_view)
-            await interaction.message.edit(view=new_view)
-
-    async def handle_archive(self, interaction: discord.Interaction):
-        """Gère l'archivage d'un ticket"""
-        # Retrieve information du staff
-        staff_info = await db.get_staff_info(interaction.user.id)
-
-        if not staff_info:
+            # Re-render the controls with the right label
+            await interaction.message.edit(view=TicketControlView.from_ticket({**ticket, 'claimed_by': None}))
+        else:
+            claimed_user = interaction.guild.get_member(ticket['claimed_by'])
+            claimed_name = claimed_user.mention if claimed_user else f"<@{ticket['claimed_by']}>"
             await interaction.response.send_message(
-                f"{EMOJIS['undone']} You are not a staff member.",
+                f"{EMOJIS['undone']} This ticket is already claimed by {claimed_name}. Only a Supervisor/Manager can unclaim it.",
                 ephemeral=True
             )
-            return
+    else:
+        # Claim
+        await db.claim_ticket(thread_id, interaction.user.id)
 
-        staff_roles = get_staff_roles(staff_info)
+        # Update thread status indicator
+        thread = interaction.guild.get_thread(thread_id)
+        if thread:
+            thread_renamer.schedule(thread, 'claimed')
 
-        # Check les permissions
-        if not can_manage_ticket(staff_roles, self.category):
-            await interaction.response.send_message(
-                f"{EMOJIS['undone']} You do not have permission to manage this type of ticket.",
-                ephemeral=True
-            )
-            return
+        await interaction.response.send_message(
+            f"{EMOJIS['done']} Ticket claimed successfully.",
+            ephemeral=True
+        )
+
+        # Send status message to thread
+        if thread:
+            await thread.send(f"{EMOJIS['front_hand']} {interaction.user.mention} has claimed this ticket")
 
-        # Respond to interaction BEFORE archiving the thread
+        # Re-render the controls with the right label
+        await interaction.message.edit(view=TicketControlView.from_ticket({**ticket, 'claimed_by': interaction.user.id}))
+
+
+async def handle_ticket_archive(interaction: discord.Interaction, thread_id: int):
+    """Gère l'archivage d'un ticket"""
+    # Retrieve information du staff
+    try:
+        staff_info = await db.get_staff_info(interaction.user.id)
+    except DatabaseUnavailable:
         await interaction.response.send_message(
-            f"{EMOJIS['done']} Ticket archived successfully.",
+            f"{EMOJIS['undone']} {DB_UNAVAILABLE_MESSAGE}",
             ephemeral=True
         )
+        return
 
-        # Archive le ticket to DB
-        await db.archive_ticket(self.thread_id)
+    if not staff_info:
+        await interaction.response.send_message(
+            f"{EMOJIS['undone']} You are not a staff member.",
+            ephemeral=True
+        )
+        return
 
-        # Lock thread and update status indicator
-        thread = interaction.guild.get_thread(self.thread_id)
-        if thread:
-            # Send status message before locking
-            await thread.send(f"{EMOJIS['archive']} {interaction.user.mention} has archived this ticket")
+    # Retrieve le ticket
+    ticket = await db.get_ticket(thread_id)
 
-            # Update thread status indicator (may hit rate limit, but that's ok)
-            try:
-                await update_thread_status_indicator(thread, 'archived')
-            except Exception as e:
-                logger.warning(f"Could not update thread status indicator (rate limit?): {e}")
+    if not ticket:
+        await interaction.response.send_message(
+            f"{EMOJIS['undone']} Ticket not found.",
+            ephemeral=True
+        )
+        return
+
+    # Check les permissions
+    if not can_manage_ticket(get_staff_role_mask(staff_info), ticket['category']):
+        await interaction.response.send_message(
+            f"{EMOJIS['undone']} You do not have permission to manage this type of ticket.",
+            ephemeral=True
+        )
+        return
+
+    # Respond to interaction BEFORE archiving the thread
+    await interaction.response.send_message(
+        f"{EMOJIS['done']} Ticket archived successfully.",
+        ephemeral=True
+    )
+
+    # Archive le ticket to DB
+    await db.archive_ticket(thread_id)
 
-            await thread.edit(archived=True, locked=True)
+    # Lock thread and update status indicator
+    thread = interaction.guild.get_thread(thread_id)
+    if thread:
+        # Send status message before locking
+        await thread.send(f"{EMOJIS['archive']} {interaction.user.mention} has archived this ticket")
+
+        await thread_renamer.archive(thread)
+        transcript_archiver.schedule(thread)
 
 
 class ArchiveRequestView(ui.LayoutView):
     """View to request ticket archival (Components V2)"""
 
-    def __init__(self, thread_id: int, user: discord.User):
+    def __init__(self, thread_id: int, note: str = None):
         super().__init__(timeout=None)
         self.thread_id = thread_id
-        self.user = user
 
         container = ui.Container()
 
@@ -1174,70 +3145,36 @@ class ArchiveRequestView(ui.LayoutView):
             f"### {EMOJIS['archive']} Archive Request\n"
             f"The team would like to archive this ticket. Do you agree?"
         ))
+        if note:
+            container.add_item(ui.TextDisplay(note))
 
         # Buttons row
         button_row = ui.ActionRow()
-
-        yes_button = ui.Button(
-            label="Yes",
-            style=discord.ButtonStyle.success,
-            emoji=EMOJIS['done'],
-            custom_id=f"archive_request:yes:{thread_id}"
-        )
-        yes_button.callback = self.yes_button
-
-        no_button = ui.Button(
-            label="No",
-            style=discord.ButtonStyle.danger,
-            emoji=EMOJIS['undone'],
-            custom_id=f"archive_request:no:{thread_id}"
-        )
-        no_button.callback = self.no_button
-
-        button_row.add_item(yes_button)
-        button_row.add_item(no_button)
+        button_row.add_item(ArchiveRequestButton(thread_id, 'yes'))
+        button_row.add_item(ArchiveRequestButton(thread_id, 'no'))
         container.add_item(button_row)
         self.add_item(container)
 
-    async def yes_button(self, interaction: discord.Interaction):
-        # Retrieve ticket
-        ticket = await db.get_ticket(self.thread_id)
-
-        if not ticket:
-            await interaction.response.send_message(
-                f"{EMOJIS['undone']} Ticket not found.",
-                ephemeral=True
-            )
-            return
-
-        # Check that it's the ticket user
-        if interaction.user.id != ticket['user_id']:
-            await interaction.response.send_message(
-                f"{EMOJIS['undone']} Only the user who created the ticket can respond.",
-                ephemeral=True
-            )
-            return
-
-        # Respond BEFORE archiving
-        await interaction.response.send_message(
-            f"{EMOJIS['done']} The ticket has been archived.",
-            ephemeral=False
-        )
 
-        # Archive ticket
-        await db.archive_ticket(self.thread_id)
+class ArchiveRequestButton(ui.DynamicItem[ui.Button], template=r'archive_request:(?P<answer>yes|no):(?P<thread_id>[0-9]+)'):
+    """Yes/No answer to an archive request, routed by custom_id"""
 
-        # Lock thread and update status indicator
-        thread = interaction.guild.get_thread(self.thread_id)
-        if thread:
-            try:
-                await update_thread_status_indicator(thread, 'archived')
-            except Exception as e:
-                logger.warning(f"Could not update thread status indicator (rate limit?): {e}")
+    def __init__(self, thread_id: int, answer: str):
+        accepted = answer == 'yes'
+        super().__init__(ui.Button(
+            label="Yes" if accepted else "No",
+            style=discord.ButtonStyle.success if accepted else discord.ButtonStyle.danger,
+            emoji=EMOJIS['done'] if accepted else EMOJIS['undone'],
+            custom_id=f"archive_request:{answer}:{thread_id}"
+        ))
+        self.thread_id = thread_id
+        self.answer = answer
 
-            await thread.edit(archived=True, locked=True)
+    @classmethod
+    async def from_custom_id(cls, interaction: discord.Interaction, item: ui.Button, match):
+        return cls(int(match['thread_id']), match['answer'])
 
-    async def no_button(self, interaction: discord.Interaction):
+    async def callback(self, interaction: discord.Interaction):
         # Retrieve ticket
         ticket = await db.get_ticket(self.thread_id)
 
@@ -1256,180 +3193,255 @@ class ArchiveRequestView(ui.LayoutView):
             )
             return
 
-        await interaction.response.send_message(
-            f"{EMOJIS['done']} The archive request has been declined.",
-            ephemeral=False
-        )
-
-        # Update thread status indicator back to claimed or unclaimed
         thread = interaction.guild.get_thread(self.thread_id)
-        if thread:
-            status = 'claimed' if ticket['claimed_by'] else 'unclaimed'
-            try:
-                await update_thread_status_indicator(thread, status)
-            except Exception as e:
-                logger.warning(f"Could not update thread status indicator (rate limit?): {e}")
-
-
-# Ticket creation functions
-async def create_support_ticket(interaction: discord.Interaction, user: discord.User, metadata: Dict):
-    """Creates a support ticket"""
-    # Check if interaction hasn't been responded to yet
-    if not interaction.response.is_done():
-        await interaction.response.defer(ephemeral=True)
 
-    # Create private thread
-    channel = interaction.guild.get_channel(SUPPORT_CHANNEL_ID)
-    if not channel:
-        await interaction.followup.send(
-            f"{EMOJIS['undone']} Support channel not found.",
-            ephemeral=True
-        )
-        return
+        if self.answer == 'yes':
+            # Respond BEFORE archiving
+            await interaction.response.send_message(
+                f"{EMOJIS['done']} The ticket has been archived.",
+                ephemeral=False
+            )
 
-    # Nom du thread
-    thread_name = f"Support - {user.name}"
+            # Archive ticket
+            await db.archive_ticket(self.thread_id)
 
-    # Create thread
-    thread = await channel.create_thread(
-        name=thread_name,
-        type=discord.ChannelType.private_thread,
-        auto_archive_duration=10080  # 7 days
-    )
+            # Lock thread and update status indicator, then keep a transcript
+            if thread:
+                await thread_renamer.archive(thread)
+                transcript_archiver.schedule(thread)
+        else:
+            await interaction.response.send_message(
+                f"{EMOJIS['done']} The archive request has been declined.",
+                ephemeral=False
+            )
 
-    # Update thread status indicator (unclaimed)
-    await update_thread_status_indicator(thread, 'unclaimed')
+            # Answering counts as activity: cancels the automatic archive
+            stale_sweeper.record_activity(self.thread_id)
 
-    # Add user to thread
-    await thread.add_user(user)
+            # Update thread status indicator back to claimed or unclaimed
+            if thread:
+                status = 'claimed' if ticket['claimed_by'] else 'unclaimed'
+                thread_renamer.schedule(thread, status)
 
-    # Main message avec boutons (Components V2)
-    mentions = f"<@&{ROLES['SUPPORT_AGENT']}> {user.mention}"
-    view = TicketControlView(thread.id, "support", user, EMOJIS['handshake'], "New Ticket - Support", mentions, bot=interaction.client)
-    interaction.client.add_view(view)
-    await thread.send(view=view)
 
-    # Message with information collectées (Components V2)
-    info_view = ui.LayoutView(timeout=None)
-    info_container = ui.Container()
+# Dynamic items routing ticket buttons (registered once, valid across restarts)
+TICKET_DYNAMIC_ITEMS = (TicketClaimButton, TicketArchiveButton, ArchiveRequestButton)
 
-    # Title
-    info_container.add_item(ui.TextDisplay(f"### {EMOJIS['ticket']} Ticket Information"))
 
-    # Support Type
-    support_type = metadata.get('type', 'Unknown').capitalize()
-    info_container.add_item(ui.TextDisplay(f"**Support Type:** {support_type}"))
+# Ticket categories
+def support_info_fields(metadata: Dict) -> List[str]:
+    """Info fields of a support ticket"""
+    fields = [f"**Support Type:** {metadata.get('type', 'Unknown').capitalize()}"]
 
     # Server info if applicable
     if metadata.get('type') == 'server' and metadata.get('guild_id'):
-        info_container.add_item(ui.TextDisplay(
+        fields.append(
             f"\n**Concerned Server:**\n"
             f"• ID: `{metadata['guild_id']}`\n"
             f"• Invite: {metadata.get('invite_link', 'N/A')}"
-        ))
+        )
 
-    info_view.add_item(info_container)
-    await thread.send(view=info_view)
+    return fields
 
-    # Save to DB
-    await db.create_ticket(thread.id, user.id, "support", metadata)
 
-    await interaction.followup.send(
-        f"{EMOJIS['done']} Your ticket has been created, here is the link: {thread.mention}",
-        ephemeral=True
-    )
+def bug_report_info_fields(metadata: Dict) -> List[str]:
+    """Info fields of a bug report ticket"""
+    if not metadata.get('error_code'):
+        return ["**Error Code:** No error code provided"]
 
+    fields = [f"**Error Code:** `{metadata['error_code']}`"]
+    if metadata.get('error_code_input'):
+        fields[0] += f" (typed `{metadata['error_code_input']}`)"
+    error_info = metadata.get('error_info', {})
 
-async def create_bug_report_ticket(interaction: discord.Interaction, user: discord.User, metadata: Dict):
-    """Creates a bug report ticket"""
-    # Check if interaction hasn't been responded to yet
-    if not interaction.response.is_done():
-        await interaction.response.defer(ephemeral=True)
+    if error_info:
+        # Error Context (PAS le traceback)
+        context_parts = ["\n**Error Context:**"]
 
-    # Create private thread
-    channel = interaction.guild.get_channel(SUPPORT_CHANNEL_ID)
-    if not channel:
-        await interaction.followup.send(
-            f"{EMOJIS['undone']} Support channel not found.",
-            ephemeral=True
-        )
-        return
+        if error_info.get('command'):
+            context_parts.append(f"• **Command:** `{error_info['command']}`")
 
-    # Nom du thread
-    thread_name = f"Bug Report - {user.name}"
+        if error_info.get('user_id'):
+            context_parts.append(f"• **User:** <@{error_info['user_id']}> (`{error_info['user_id']}`)")
 
-    # Create thread
-    thread = await channel.create_thread(
-        name=thread_name,
-        type=discord.ChannelType.private_thread,
-        auto_archive_duration=10080  # 7 days
-    )
+        if error_info.get('guild_id'):
+            context_parts.append(f"• **Server:** `{error_info['guild_id']}`")
 
-    # Update thread status indicator (unclaimed)
-    await update_thread_status_indicator(thread, 'unclaimed')
+        if error_info.get('file_source') and error_info.get('line_number'):
+            context_parts.append(f"• **File:** `{error_info['file_source']}:{error_info['line_number']}`")
 
-    # Add user to thread
-    await thread.add_user(user)
+        if error_info.get('error_type'):
+            context_parts.append(f"• **Type:** `{error_info['error_type']}`")
 
-    # Main message avec boutons (Components V2)
-    mentions = f"<@&{ROLES['DEV']}> {user.mention}"
-    view = TicketControlView(thread.id, "bug_report", user, EMOJIS['bug'], "New Ticket - Bug Report", mentions, bot=interaction.client)
-    interaction.client.add_view(view)
-    await thread.send(view=view)
+        if error_info.get('timestamp'):
+            timestamp = int(error_info['timestamp'].timestamp()) if hasattr(error_info['timestamp'], 'timestamp') else 0
+            if timestamp:
+                context_parts.append(f"• **When:** <t:{timestamp}:F>")
 
-    # Message with information collectées (Components V2)
-    info_view = ui.LayoutView(timeout=None)
-    info_container = ui.Container()
+        fields.append('\n'.join(context_parts))
+
+    return fields
+
+
+def sanction_appeal_info_fields(metadata: Dict) -> List[str]:
+    """Info fields of a sanction appeal ticket"""
+    case_info = metadata.get('case_info', {})
+    if not case_info:
+        return []
+
+    # Basic info
+    fields = ['\n'.join([
+        f"**Case ID:** `{case_info['case_id']}`",
+        f"**Case Type:** {case_info.get('case_type', 'N/A').capitalize()}",
+        f"**Sanction Type:** {case_info.get('sanction_type', 'N/A').replace('_', ' ').title()}",
+        f"**Status:** {case_info.get('status', 'N/A').capitalize()}"
+    ])]
+
+    # Entity info
+    entity_type = case_info.get('entity_type', 'N/A')
+    entity_id = case_info.get('entity_id', 'N/A')
+
+    if entity_type == 'user':
+        fields.append(f"\n**Sanctioned User:** <@{entity_id}> (`{entity_id}`)")
+    elif entity_type == 'guild':
+        fields.append(f"\n**Sanctioned Server:** `{entity_id}`")
+
+    # Reason
+    if case_info.get('reason'):
+        fields.append(f"\n**Reason:**\n{case_info['reason'][:1024]}")
+
+    # Created by
+    if case_info.get('created_by'):
+        created_timestamp = int(case_info['created_at'].timestamp()) if case_info.get('created_at') and hasattr(case_info['created_at'], 'timestamp') else 0
+        created_by_text = f"<@{case_info['created_by']}>"
+        if created_timestamp:
+            created_by_text += f" (<t:{created_timestamp}:R>)"
+        fields.append(f"\n**Created by:** {created_by_text}")
+
+    return fields
+
+
+LEGAL_TYPES_NAMES = {
+    'data_access': 'Data Access',
+    'rectification': 'Rectification',
+    'deletion': 'Deletion / Right to be Forgotten',
+    'objection': 'Objection'
+}
 
-    # Title
-    info_container.add_item(ui.TextDisplay(f"### {EMOJIS['ticket']} Ticket Information"))
 
-    if metadata.get('error_code'):
-        error_info = metadata.get('error_info', {})
-        info_container.add_item(ui.TextDisplay(f"**Error Code:** `{metadata['error_code']}`"))
+def legal_request_info_fields(metadata: Dict) -> List[str]:
+    """Info fields of a legal request ticket"""
+    legal_type = metadata.get('legal_type', 'unknown')
+    return [f"**Legal Request Type:** {LEGAL_TYPES_NAMES.get(legal_type, legal_type.capitalize())}"]
+
+
+# Ticket categories as data. To add a category, add an entry here (and a
+# CATEGORY_ROLES entry for who can manage it).
+#   label: used in the thread name and the "New Ticket - {label}" title
+#   emoji: category emoji
+#   roles: ROLES keys mentioned when the ticket is created
+#   info_title: title of the information message
+#   info: list of static lines, or a function(metadata) -> list of lines
+TICKET_CATEGORIES = {
+    'support': {
+        'label': 'Support',
+        'emoji': EMOJIS['handshake'],
+        'roles': ['SUPPORT_AGENT'],
+        'info_title': 'Ticket Information',
+        'info': support_info_fields,
+    },
+    'bug_report': {
+        'label': 'Bug Report',
+        'emoji': EMOJIS['bug'],
+        'roles': ['DEV'],
+        'info_title': 'Ticket Information',
+        'info': bug_report_info_fields,
+    },
+    'sanction_appeal': {
+        'label': 'Sanction Appeal',
+        'emoji': EMOJIS['gavel'],
+        'roles': ['MODERATOR'],
+        'info_title': 'Case Information',
+        'info': sanction_appeal_info_fields,
+    },
+    'legal_request': {
+        'label': 'Legal Request',
+        'emoji': EMOJIS['balance'],
+        'roles': ['MANAGER'],
+        'info_title': 'Ticket Information',
+        'info': legal_request_info_fields,
+    },
+    'payments_billing': {
+        'label': 'Payments & Billing',
+        'emoji': EMOJIS['payments'],
+        'roles': ['MANAGER', 'SUPERVISOR'],
+        'info_title': 'Ticket Information',
+        'info': [
+            "**Category:** Payments & Billing\n"
+            "-# Please provide details about your payment or billing inquiry"
+        ],
+    },
+    'other_request': {
+        'label': 'Other Request',
+        'emoji': EMOJIS['question_mark'],
+        'roles': ['SUPPORT_AGENT'],
+        'info_title': 'Ticket Information',
+        'info': [
+            "**Category:** Other Request\n"
+            "-# Please describe your request in detail"
+        ],
+    },
+}
 
-        if error_info:
-            # Error Context (PAS le traceback)
-            context_parts = ["\n**Error Context:**"]
+# Static parts of each category, compiled once
+CATEGORY_TEMPLATES = {
+    category: {
+        'role_mentions': ' '.join(f"<@&{ROLES[role]}>" for role in config['roles']),
+        'title': f"New Ticket - {config['label']}",
+        'info_header': f"### {EMOJIS['ticket']} {config['info_title']}",
+        'static_info': None if callable(config['info']) else list(config['info']),
+    }
+    for category, config in TICKET_CATEGORIES.items()
+}
 
-            if error_info.get('command'):
-                context_parts.append(f"• **Command:** `{error_info['command']}`")
+# Fully static info views, built on first use (views need a running loop)
+_static_info_views: Dict[str, ui.LayoutView] = {}
 
-            if error_info.get('user_id'):
-                context_parts.append(f"• **User:** <@{error_info['user_id']}> (`{error_info['user_id']}`)")
 
-            if error_info.get('guild_id'):
-                context_parts.append(f"• **Server:** `{error_info['guild_id']}`")
+def render_info_view(category: str, metadata: Dict) -> ui.LayoutView:
+    """Builds the information message of a ticket from its category template"""
+    template = CATEGORY_TEMPLATES[category]
 
-            if error_info.get('file_source') and error_info.get('line_number'):
-                context_parts.append(f"• **File:** `{error_info['file_source']}:{error_info['line_number']}`")
+    # Static categories share one non-interactive view
+    if template['static_info'] is not None and category in _static_info_views:
+        return _static_info_views[category]
 
-            if error_info.get('error_type'):
-                context_parts.append(f"• **Type:** `{error_info['error_type']}`")
+    lines = template['static_info']
+    if lines is None:
+        lines = TICKET_CATEGORIES[category]['info'](metadata)
 
-            if error_info.get('timestamp'):
-                timestamp = int(error_info['timestamp'].timestamp()) if hasattr(error_info['timestamp'], 'timestamp') else 0
-                if timestamp:
-                    context_parts.append(f"• **When:** <t:{timestamp}:F>")
+    info_view = ui.LayoutView(timeout=None)
+    info_container = ui.Container()
+    info_container.add_item(ui.TextDisplay(template['info_header']))
+    for line in lines:
+        info_container.add_item(ui.TextDisplay(line))
+    info_view.add_item(info_container)
 
-            info_container.add_item(ui.TextDisplay('\n'.join(context_parts)))
-    else:
-        info_container.add_item(ui.TextDisplay("**Error Code:** No error code provided"))
+    if template['static_info'] is not None:
+        _static_info_views[category] = info_view
 
-    info_view.add_item(info_container)
-    await thread.send(view=info_view)
+    return info_view
 
-    # Save to DB
-    await db.create_ticket(thread.id, user.id, "bug_report", metadata)
 
-    await interaction.followup.send(
-        f"{EMOJIS['done']} Your ticket has been created, here is the link: {thread.mention}",
-        ephemeral=True
-    )
+# Ticket creation
+async def create_category_ticket(interaction: discord.Interaction, user: discord.User, category: str, metadata: Dict):
+    """Creates a ticket of the given category
 
+    The thread is created with its final name (status indicator included), then
+    the user add, the messages, the DB insert and the confirmation run concurrently.
+    """
+    config = TICKET_CATEGORIES[category]
 
-async def create_sanction_appeal_ticket(interaction: discord.Interaction, user: discord.User, metadata: Dict):
-    """Creates a sanction appeal ticket"""
     # Check if interaction hasn't been responded to yet
     if not interaction.response.is_done():
         await interaction.response.defer(ephemeral=True)
@@ -1443,271 +3455,449 @@ async def create_sanction_appeal_ticket(interaction: discord.Interaction, user:
         )
         return
 
-    # Nom du thread
-    thread_name = f"Sanction Appeal - {user.name}"
-
-    # Create thread
+    # Create thread, already marked as unclaimed
     thread = await channel.create_thread(
-        name=thread_name,
+        name=build_thread_name(f"{config['label']} - {user.name}", 'unclaimed'),
         type=discord.ChannelType.private_thread,
         auto_archive_duration=10080  # 7 days
     )
 
-    # Update thread status indicator (unclaimed)
-    await update_thread_status_indicator(thread, 'unclaimed')
-
-    # Add user to thread
-    await thread.add_user(user)
-
     # Main message avec boutons (Components V2)
-    mentions = f"<@&{ROLES['MODERATOR']}> {user.mention}"
-    view = TicketControlView(thread.id, "sanction_appeal", user, EMOJIS['gavel'], "New Ticket - Sanction Appeal", mentions, bot=interaction.client)
-    interaction.client.add_view(view)
-    await thread.send(view=view)
+    view = TicketControlView(thread.id, category, user.id, created_at=discord.utils.utcnow())
 
-    # Message with information of the case (Components V2)
-    case_info = metadata.get('case_info', {})
-    info_view = ui.LayoutView(timeout=None)
-    info_container = ui.Container()
+    # Message with information collectées (Components V2)
+    info_view = render_info_view(category, metadata)
+
+    async def send_messages():
+        # Sequential so the control message stays first
+        await thread.send(view=view)
+        await thread.send(view=info_view)
+
+    results = await asyncio.gather(
+        thread.add_user(user),
+        send_messages(),
+        db.create_ticket(thread.id, user.id, category, metadata),
+        interaction.followup.send(
+            f"{EMOJIS['done']} Your ticket has been created, here is the link: {thread.mention}",
+            ephemeral=True
+        ),
+        return_exceptions=True
+    )
 
-    # Title
-    info_container.add_item(ui.TextDisplay(f"### {EMOJIS['ticket']} Case Information"))
+    for result in results:
+        if isinstance(result, Exception):
+            logger.error(f"Error setting up {category} ticket {thread.id}: {result}")
 
-    if case_info:
-        # Basic info
-        basic_info = [
-            f"**Case ID:** `{case_info['case_id']}`",
-            f"**Case Type:** {case_info.get('case_type', 'N/A').capitalize()}",
-            f"**Sanction Type:** {case_info.get('sanction_type', 'N/A').replace('_', ' ').title()}",
-            f"**Status:** {case_info.get('status', 'N/A').capitalize()}"
-        ]
-        info_container.add_item(ui.TextDisplay('\n'.join(basic_info)))
 
-        # Entity info
-        entity_type = case_info.get('entity_type', 'N/A')
-        entity_id = case_info.get('entity_id', 'N/A')
+class TicketAdmission:
+    """Admission control in front of ticket creation
 
-        if entity_type == 'user':
-            info_container.add_item(ui.TextDisplay(f"\n**Sanctioned User:** <@{entity_id}> (`{entity_id}`)"))
-        elif entity_type == 'guild':
-            info_container.add_item(ui.TextDisplay(f"\n**Sanctioned Server:** `{entity_id}`"))
+    Rejects duplicates and users over their open-ticket limit, then hands the
+    creation to a bounded queue drained by a few workers, so a flood of panel
+    clicks turns into a steady stream of thread creations.
+    """
 
-        # Reason
-        if case_info.get('reason'):
-            info_container.add_item(ui.TextDisplay(f"\n**Reason:**\n{case_info['reason'][:1024]}"))
+    def __init__(self, max_open_per_user: int, queue_size: int, category_cap: int, workers: int):
+        self.max_open_per_user = max_open_per_user
+        self.category_cap = category_cap
+        self.worker_count = workers
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self.workers: List[asyncio.Task] = []
+        self.busy = 0
+
+        # Users and categories with a creation queued or in progress
+        self.pending_users = set()
+        self.pending_categories: Dict[str, int] = {}
+
+    def start(self):
+        """Starts the creation workers"""
+        if not self.workers:
+            self.workers = [asyncio.create_task(self._worker()) for _ in range(self.worker_count)]
+
+    async def stop(self):
+        """Stops the creation workers (queued creations are dropped)"""
+        for worker in self.workers:
+            worker.cancel()
+        await asyncio.gather(*self.workers, return_exceptions=True)
+        self.workers = []
+
+    def _release(self, user_id: int, category: str):
+        self.pending_users.discard(user_id)
+        self.pending_categories[category] -= 1
+
+    async def submit(self, interaction: discord.Interaction, user: discord.User, category: str, metadata: Dict):
+        """Queues the creation of a ticket, or tells the user why it can't be created"""
+        if not interaction.response.is_done():
+            await interaction.response.defer(ephemeral=True)
+
+        # One creation at a time per user, reserved before any await
+        if user.id in self.pending_users:
+            await interaction.followup.send(
+                f"{EMOJIS['undone']} Your ticket is already being created, please wait.",
+                ephemeral=True
+            )
+            return
 
-        # Created by
-        if case_info.get('created_by'):
-            created_timestamp = int(case_info['created_at'].timestamp()) if case_info.get('created_at') and hasattr(case_info['created_at'], 'timestamp') else 0
-            created_by_text = f"<@{case_info['created_by']}>"
-            if created_timestamp:
-                created_by_text += f" (<t:{created_timestamp}:R>)"
-            info_container.add_item(ui.TextDisplay(f"\n**Created by:** {created_by_text}"))
+        if self.pending_categories.get(category, 0) >= self.category_cap or self.queue.full():
+            await interaction.followup.send(
+                f"{EMOJIS['undone']} Too many tickets are being created right now. Please try again in a few minutes.",
+                ephemeral=True
+            )
+            return
 
-    info_view.add_item(info_container)
-    await thread.send(view=info_view)
+        self.pending_users.add(user.id)
+        self.pending_categories[category] = self.pending_categories.get(category, 0) + 1
 
-    # Save to DB
-    await db.create_ticket(thread.id, user.id, "sanction_appeal", metadata)
+        try:
+            open_tickets = await db.get_open_ticket_ids(user.id, self.max_open_per_user)
+            if len(open_tickets) >= self.max_open_per_user:
+                self._release(user.id, category)
+                links = ', '.join(f"<#{thread_id}>" for thread_id in open_tickets)
+                await interaction.followup.send(
+                    f"{EMOJIS['undone']} You already have {len(open_tickets)} open tickets: {links}\n"
+                    f"-# Please use them or wait until one is archived.",
+                    ephemeral=True
+                )
+                return
 
-    await interaction.followup.send(
-        f"{EMOJIS['done']} Your ticket has been created, here is the link: {thread.mention}",
-        ephemeral=True
-    )
+            self.queue.put_nowait((interaction, user, category, metadata))
+        except Exception:
+            self._release(user.id, category)
+            raise
 
+        # Tell the user where they stand if no worker is free
+        position = self.queue.qsize()
+        if position > self.worker_count - self.busy:
+            await interaction.followup.send(
+                f"{EMOJIS['ticket']} Many tickets are being created right now. You are **#{position}** in the queue, "
+                f"your ticket link will be sent here.",
+                ephemeral=True
+            )
 
-async def create_legal_request_ticket(interaction: discord.Interaction, user: discord.User, metadata: Dict):
-    """Creates a legal request ticket"""
-    # Check if interaction hasn't been responded to yet
-    if not interaction.response.is_done():
-        await interaction.response.defer(ephemeral=True)
+    async def _worker(self):
+        while True:
+            interaction, user, category, metadata = await self.queue.get()
+            self.busy += 1
+            try:
+                await create_category_ticket(interaction, user, category, metadata)
+            except Exception as e:
+                logger.error(f"Error creating {category} ticket for {user.id}: {e}")
+            finally:
+                self.busy -= 1
+                self._release(user.id, category)
+                self.queue.task_done()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Returns the admission queue state"""
+        return {
+            'queued': self.queue.qsize(),
+            'in_progress': self.busy,
+            'pending_by_category': {k: v for k, v in self.pending_categories.items() if v},
+        }
 
-    # Create private thread
-    channel = interaction.guild.get_channel(SUPPORT_CHANNEL_ID)
-    if not channel:
-        await interaction.followup.send(
-            f"{EMOJIS['undone']} Support channel not found.",
-            ephemeral=True
-        )
-        return
 
-    # Nom du thread
-    thread_name = f"Legal Request - {user.name}"
+ticket_admission = TicketAdmission(
+    MAX_OPEN_TICKETS_PER_USER,
+    CREATION_QUEUE_SIZE,
+    CREATION_CATEGORY_CAP,
+    CREATION_WORKERS
+)
 
-    # Create thread
-    thread = await channel.create_thread(
-        name=thread_name,
-        type=discord.ChannelType.private_thread,
-        auto_archive_duration=10080  # 7 days
-    )
 
-    # Update thread status indicator (unclaimed)
-    await update_thread_status_indicator(thread, 'unclaimed')
+class StaleTicketSweeper:
+    """Asks inactive tickets to be archived, then archives them if nobody answers
 
-    # Add user to thread
-    await thread.add_user(user)
+    Human messages in ticket threads are recorded in memory and written in
+    one batch per sweep. Every REST call of a sweep is paid from a per-minute
+    budget, so a large cleanup is spread out instead of eating the rate limits.
+    """
 
-    # Main message avec boutons (Components V2)
-    mentions = f"<@&{ROLES['MANAGER']}> {user.mention}"
-    view = TicketControlView(thread.id, "legal_request", user, EMOJIS['balance'], "New Ticket - Legal Request", mentions, bot=interaction.client)
-    interaction.client.add_view(view)
-    await thread.send(view=view)
+    def __init__(self, stale_after: float, grace: float, batch_size: int, rest_per_minute: int):
+        self.stale_after = stale_after
+        self.grace = grace
+        self.batch_size = batch_size
+        self.budget = RestBudget(rest_per_minute)
 
-    # Message with le type de demande (Components V2)
-    legal_type = metadata.get('legal_type', 'unknown')
+        # thread_id -> last human message, not written yet
+        self.activity: Dict[int, datetime] = {}
+        self.stats = {'requested': 0, 'archived': 0, 'missing': 0}
 
-    legal_types_names = {
-        'data_access': 'Data Access',
-        'rectification': 'Rectification',
-        'deletion': 'Deletion / Right to be Forgotten',
-        'objection': 'Objection'
-    }
+    def record_activity(self, thread_id: int, at: Optional[datetime] = None):
+        self.activity[thread_id] = at or discord.utils.utcnow()
 
-    info_view = ui.LayoutView(timeout=None)
-    info_container = ui.Container()
+    async def flush_activity(self):
+        """Writes the recorded activity (kept for the next flush on error)"""
+        activity, self.activity = self.activity, {}
+        try:
+            await db.touch_tickets(activity)
+        except Exception as e:
+            logger.error(f"Error recording ticket activity: {e}")
+            for thread_id, at in activity.items():
+                self.activity.setdefault(thread_id, at)
 
-    # Title
-    info_container.add_item(ui.TextDisplay(f"### {EMOJIS['ticket']} Ticket Information"))
+    async def sweep(self, bot: commands.Bot):
+        """Runs one batch of archive requests and one batch of auto-archives"""
+        await self.flush_activity()
+        now = discord.utils.utcnow()
 
-    # Legal request type
-    info_container.add_item(ui.TextDisplay(
-        f"**Legal Request Type:** {legal_types_names.get(legal_type, legal_type.capitalize())}"
-    ))
+        to_request = await db.get_stale_tickets(
+            'stale_tickets_to_request', now - timedelta(hours=self.stale_after), self.batch_size
+        )
+        for thread_id in to_request:
+            await self._request_archive(bot, thread_id)
 
-    info_view.add_item(info_container)
-    await thread.send(view=info_view)
+        to_archive = await db.get_stale_tickets(
+            'stale_tickets_to_archive', now - timedelta(hours=self.grace), self.batch_size
+        )
+        for thread_id in to_archive:
+            await self._auto_archive(bot, thread_id)
 
-    # Save to DB
-    await db.create_ticket(thread.id, user.id, "legal_request", metadata)
+        if to_request or to_archive:
+            logger.info(f"Stale tickets: {len(to_request)} archive request(s), {len(to_archive)} auto-archive(s)")
 
-    await interaction.followup.send(
-        f"{EMOJIS['done']} Your ticket has been created, here is the link: {thread.mention}",
-        ephemeral=True
-    )
+    async def _get_thread(self, bot: commands.Bot, thread_id: int) -> Optional[discord.Thread]:
+        """Thread from cache, or fetched (threads archived by Discord aren't cached)"""
+        thread = bot.get_channel(thread_id)
+        if thread:
+            return thread
 
+        await self.budget.spend()
+        try:
+            return await bot.fetch_channel(thread_id)
+        except (discord.NotFound, discord.Forbidden):
+            return None
 
-async def create_payments_billing_ticket(interaction: discord.Interaction, user: discord.User, metadata: Dict):
-    """Creates a payments & billing ticket"""
-    # Check if interaction hasn't been responded to yet
-    if not interaction.response.is_done():
-        await interaction.response.defer(ephemeral=True)
+    async def _request_archive(self, bot: commands.Bot, thread_id: int):
+        try:
+            thread = await self._get_thread(bot, thread_id)
+            if not thread:
+                # Thread deleted: nothing left to ask
+                self.stats['missing'] += 1
+                await db.archive_ticket(thread_id)
+                return
 
-    # Create private thread
-    channel = interaction.guild.get_channel(SUPPORT_CHANNEL_ID)
-    if not channel:
-        await interaction.followup.send(
-            f"{EMOJIS['undone']} Support channel not found.",
-            ephemeral=True
-        )
-        return
+            await self.budget.spend(2)
+            await thread.send(view=ArchiveRequestView(
+                thread_id,
+                note=f"-# No activity for {self.stale_after:g} hours. "
+                     f"This ticket will be archived automatically in {self.grace:g} hours without an answer."
+            ))
+            thread_renamer.schedule(thread, 'archive_request')
+            await db.mark_archive_requested(thread_id)
+            self.stats['requested'] += 1
+        except Exception as e:
+            logger.error(f"Error requesting archive of stale ticket {thread_id}: {e}")
 
-    # Nom du thread
-    thread_name = f"Payments & Billing - {user.name}"
+    async def _auto_archive(self, bot: commands.Bot, thread_id: int):
+        try:
+            await db.archive_ticket(thread_id)
 
-    # Create thread
-    thread = await channel.create_thread(
-        name=thread_name,
-        type=discord.ChannelType.private_thread,
-        auto_archive_duration=10080  # 7 days
-    )
+            thread = await self._get_thread(bot, thread_id)
+            if not thread:
+                self.stats['missing'] += 1
+                return
 
-    # Update thread status indicator (unclaimed)
-    await update_thread_status_indicator(thread, 'unclaimed')
+            await self.budget.spend(2)
+            await thread.send(f"{EMOJIS['archive']} This ticket has been archived automatically after no answer.")
+            await thread_renamer.archive(thread)
+            transcript_archiver.schedule(thread, self.budget)
+            self.stats['archived'] += 1
+        except Exception as e:
+            logger.error(f"Error auto-archiving stale ticket {thread_id}: {e}")
 
-    # Add user to thread
-    await thread.add_user(user)
 
-    # Main message avec boutons (Components V2)
-    mentions = f"<@&{ROLES['MANAGER']}> <@&{ROLES['SUPERVISOR']}> {user.mention}"
-    view = TicketControlView(thread.id, "payments_billing", user, EMOJIS['payments'], "New Ticket - Payments & Billing", mentions, bot=interaction.client)
-    interaction.client.add_view(view)
-    await thread.send(view=view)
+stale_sweeper = StaleTicketSweeper(
+    STALE_AFTER_HOURS,
+    STALE_GRACE_HOURS,
+    SWEEP_BATCH_SIZE,
+    SWEEP_REST_BUDGET
+)
 
-    # Message with information (Components V2)
-    info_view = ui.LayoutView(timeout=None)
-    info_container = ui.Container()
 
-    # Title
-    info_container.add_item(ui.TextDisplay(f"### {EMOJIS['ticket']} Ticket Information"))
+def build_dashboard_view(aggregates: TicketAggregates) -> ui.LayoutView:
+    """Renders the ticket backlog dashboard from the in-memory counters"""
+    view = ui.LayoutView(timeout=None)
+    container = ui.Container()
 
-    # Basic info
-    info_container.add_item(ui.TextDisplay(
-        f"**Category:** Payments & Billing\n"
-        f"-# Please provide details about your payment or billing inquiry"
+    total_unclaimed = sum(counts['unclaimed'] for counts in aggregates.open_by_category.values())
+    total_claimed = sum(counts['claimed'] for counts in aggregates.open_by_category.values())
+    container.add_item(ui.TextDisplay(
+        f"### {EMOJIS['ticket']} Ticket Dashboard\n"
+        f"**{total_unclaimed + total_claimed}** open · **{total_unclaimed}** unclaimed · **{total_claimed}** claimed"
     ))
+    container.add_item(ui.Separator())
+
+    # Per category, in panel order
+    lines = []
+    for category, config in TICKET_CATEGORIES.items():
+        counts = aggregates.open_by_category.get(category, {'unclaimed': 0, 'claimed': 0})
+        lines.append(
+            f"{config['emoji']} **{config['label']}:** {counts['unclaimed'] + counts['claimed']} open "
+            f"({counts['unclaimed']} unclaimed, {counts['claimed']} claimed)"
+        )
+    container.add_item(ui.TextDisplay("\n".join(lines)))
 
-    info_view.add_item(info_container)
-    await thread.send(view=info_view)
+    oldest = aggregates.oldest_unclaimed()
+    if oldest:
+        created_at, thread_id, category = oldest
+        label = TICKET_CATEGORIES.get(category, {}).get('label', category)
+        container.add_item(ui.TextDisplay(
+            f"**Oldest unclaimed:** <#{thread_id}> ({label}), created <t:{int(created_at.timestamp())}:R>"
+        ))
+    else:
+        container.add_item(ui.TextDisplay("**Oldest unclaimed:** none"))
+
+    container.add_item(ui.Separator())
+    if aggregates.claims_by_staff:
+        claims = sorted(aggregates.claims_by_staff.items(), key=lambda item: item[1], reverse=True)
+        claim_lines = [f"<@{staff_id}>: {count}" for staff_id, count in claims[:DASHBOARD_MAX_STAFF]]
+        if len(claims) > DASHBOARD_MAX_STAFF:
+            claim_lines.append(f"-# and {len(claims) - DASHBOARD_MAX_STAFF} more")
+        container.add_item(ui.TextDisplay("**Claims per staff:**\n" + "\n".join(claim_lines)))
+    else:
+        container.add_item(ui.TextDisplay("**Claims per staff:** none"))
 
-    # Save to DB
-    await db.create_ticket(thread.id, user.id, "payments_billing", metadata)
+    if aggregates.reconciled_at:
+        container.add_item(ui.TextDisplay(
+            f"-# Last reconciled with the database <t:{int(aggregates.reconciled_at.timestamp())}:R>"
+        ))
 
-    await interaction.followup.send(
-        f"{EMOJIS['done']} Your ticket has been created, here is the link: {thread.mention}",
-        ephemeral=True
-    )
+    view.add_item(container)
+    return view
 
 
-async def create_other_request_ticket(interaction: discord.Interaction, user: discord.User, metadata: Dict):
-    """Creates an other request ticket"""
-    # Check if interaction hasn't been responded to yet
-    if not interaction.response.is_done():
-        await interaction.response.defer(ephemeral=True)
+def format_seconds(seconds: float) -> str:
+    """Short human duration: 45s, 12m, 3h 05m, 2d 4h"""
+    seconds = int(seconds)
+    if seconds < 60:
+        return f"{seconds}s"
+    if seconds < 3600:
+        return f"{seconds // 60}m"
+    if seconds < 86400:
+        return f"{seconds // 3600}h {seconds % 3600 // 60:02d}m"
+    return f"{seconds // 86400}d {seconds % 86400 // 3600}h"
 
-    # Create private thread
-    channel = interaction.guild.get_channel(SUPPORT_CHANNEL_ID)
-    if not channel:
-        await interaction.followup.send(
-            f"{EMOJIS['undone']} Support channel not found.",
-            ephemeral=True
-        )
-        return
 
-    # Nom du thread
-    thread_name = f"Other Request - {user.name}"
+SLA_METRIC_NAMES = {
+    'claim': "Time to claim",
+    'first_reply': "Time to first staff reply",
+    'archive': "Time to archive",
+}
+
 
-    # Create thread
-    thread = await channel.create_thread(
-        name=thread_name,
-        type=discord.ChannelType.private_thread,
-        auto_archive_duration=10080  # 7 days
+def format_sla_line(name: str, histogram: Optional[DurationHistogram]) -> str:
+    if not histogram or not histogram.count:
+        return f"{name}: no data"
+    return (
+        f"{name}: p50 **{format_seconds(histogram.percentile(50))}** · "
+        f"p90 {format_seconds(histogram.percentile(90))} · "
+        f"p99 {format_seconds(histogram.percentile(99))} ({histogram.count})"
     )
 
-    # Update thread status indicator (unclaimed)
-    await update_thread_status_indicator(thread, 'unclaimed')
 
-    # Add user to thread
-    await thread.add_user(user)
+def build_sla_view(sla: TicketSLA) -> ui.LayoutView:
+    """Renders lifecycle percentiles per category and for the busiest staff members"""
+    view = ui.LayoutView(timeout=None)
+    container = ui.Container()
+
+    since = f" since <t:{int(sla.since.timestamp())}:d>" if sla.since else ""
+    container.add_item(ui.TextDisplay(f"### {EMOJIS['ticket']} Ticket SLA\n-# Percentiles{since}"))
+    container.add_item(ui.Separator())
+
+    for category, config in TICKET_CATEGORIES.items():
+        histograms = sla.by_category.get(category, {})
+        lines = [f"{config['emoji']} **{config['label']}**"]
+        lines += [format_sla_line(name, histograms.get(metric)) for metric, name in SLA_METRIC_NAMES.items()]
+        container.add_item(ui.TextDisplay("\n".join(lines)))
+
+    container.add_item(ui.Separator())
+
+    # Busiest staff members first (claims, then replies)
+    def activity(item):
+        histograms = item[1]
+        return sum(histograms[metric].count for metric in ('claim', 'first_reply') if metric in histograms)
+
+    staff = sorted(sla.by_staff.items(), key=activity, reverse=True)[:SLA_MAX_STAFF]
+    if staff:
+        lines = ["**Per staff (p50):**"]
+        for staff_id, histograms in staff:
+            parts = [
+                f"{label} {format_seconds(histograms[metric].percentile(50))} ({histograms[metric].count})"
+                for metric, label in (('claim', "claim"), ('first_reply', "reply"), ('archive', "archive"))
+                if metric in histograms
+            ]
+            lines.append(f"<@{staff_id}>: " + " · ".join(parts))
+        container.add_item(ui.TextDisplay("\n".join(lines)))
+    else:
+        container.add_item(ui.TextDisplay("**Per staff:** no data"))
 
-    # Main message avec boutons (Components V2)
-    mentions = f"<@&{ROLES['SUPPORT_AGENT']}> {user.mention}"
-    view = TicketControlView(thread.id, "other_request", user, EMOJIS['question_mark'], "New Ticket - Other Request", mentions, bot=interaction.client)
-    interaction.client.add_view(view)
-    await thread.send(view=view)
+    view.add_item(container)
+    return view
 
-    # Message with information (Components V2)
-    info_view = ui.LayoutView(timeout=None)
-    info_container = ui.Container()
 
-    # Title
-    info_container.add_item(ui.TextDisplay(f"### {EMOJIS['ticket']} Ticket Information"))
+class TicketSearchView(ui.LayoutView):
+    """One page of /ticket-search results, with keyset Previous/Next buttons"""
 
-    # Basic info
-    info_container.add_item(ui.TextDisplay(
-        f"**Category:** Other Request\n"
-        f"-# Please describe your request in detail"
-    ))
+    def __init__(self, user_id: int, search: Dict[str, Any], results: List[Dict], cursors: List[Optional[tuple]]):
+        super().__init__(timeout=300)
+        self.user_id = user_id
+        self.search = search
+        # cursors[-1] produced the current page; earlier ones are the previous pages
+        self.cursors = cursors
+        self.has_next = len(results) > SEARCH_PAGE_SIZE
+        self.results = results[:SEARCH_PAGE_SIZE]
 
-    info_view.add_item(info_container)
-    await thread.send(view=info_view)
+        container = ui.Container()
+        container.add_item(ui.TextDisplay(
+            f"### {EMOJIS['eyes']} Ticket Search\n"
+            f"-# `{search['query'].replace('`', '')}` · page {len(cursors)}"
+        ))
+        container.add_item(ui.Separator(spacing=discord.SeparatorSpacing.small))
 
-    # Save to DB
-    await db.create_ticket(thread.id, user.id, "other_request", metadata)
+        if self.results:
+            lines = []
+            for ticket in self.results:
+                config = TICKET_CATEGORIES.get(ticket['category'], {})
+                state = "archived" if ticket['archived'] else ("claimed" if ticket['claimed_by'] else "open")
+                lines.append(
+                    f"{config.get('emoji', EMOJIS['ticket'])} <#{ticket['thread_id']}> · <@{ticket['user_id']}> · "
+                    f"{state} · <t:{int(ticket['created_at'].timestamp())}:d>"
+                )
+            container.add_item(ui.TextDisplay("\n".join(lines)))
+        else:
+            container.add_item(ui.TextDisplay("No tickets found."))
 
-    await interaction.followup.send(
-        f"{EMOJIS['done']} Your ticket has been created, here is the link: {thread.mention}",
-        ephemeral=True
-    )
+        button_row = ui.ActionRow()
+        previous_button = ui.Button(label="Previous", style=discord.ButtonStyle.secondary, disabled=len(cursors) < 2)
+        previous_button.callback = self.previous_page
+        next_button = ui.Button(label="Next", style=discord.ButtonStyle.secondary, disabled=not self.has_next)
+        next_button.callback = self.next_page
+        button_row.add_item(previous_button)
+        button_row.add_item(next_button)
+        container.add_item(button_row)
+
+        self.add_item(container)
+
+    @classmethod
+    async def fetch(cls, user_id: int, search: Dict[str, Any], cursors: List[Optional[tuple]]) -> 'TicketSearchView':
+        """Runs the search for the page starting at cursors[-1]"""
+        # One extra row tells whether there is a next page
+        results = await db.search_tickets(**search, cursor=cursors[-1], limit=SEARCH_PAGE_SIZE + 1)
+        return cls(user_id, search, results, cursors)
+
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        return interaction.user.id == self.user_id
+
+    async def next_page(self, interaction: discord.Interaction):
+        last = self.results[-1]
+        view = await defer_while(interaction, TicketSearchView.fetch(
+            self.user_id, self.search, self.cursors + [(last['rank'], last['thread_id'])]
+        ))
+        await interaction.edit_original_response(view=view)
+
+    async def previous_page(self, interaction: discord.Interaction):
+        view = await defer_while(interaction, TicketSearchView.fetch(self.user_id, self.search, self.cursors[:-1]))
+        await interaction.edit_original_response(view=view)
 
 
 class Tickets(commands.Cog):
@@ -1721,19 +3911,205 @@ class Tickets(commands.Cog):
         """Appelé quand le cog est chargé"""
         # Connecter à la base de données
         await db.connect()
+        await db.load_sla_history()
+
+        # Réutiliser la session HTTP du bot pour les invitations
+        invite_resolver.session = getattr(self.bot, 'session', None)
+
+        # Finish running transcripts, then flush queued ticket writes before the bot shuts down
+        self.bot.add_shutdown_hook(transcript_archiver.drain)
+        self.bot.add_shutdown_hook(db.flush)
 
         # Register persistent views
         self.bot.add_view(self.support_panel_view)
         logger.info("✅ Registered persistent SupportPanelView")
 
+        # Ticket buttons are routed by custom_id, no per-ticket view to register
+        self.bot.add_dynamic_items(*TICKET_DYNAMIC_ITEMS)
+
+        # Start ticket creation workers
+        ticket_admission.start()
+
+        # Start staff permissions cache invalidation
+        self.refresh_staff_cache.start()
+
+        # Load the dashboard counters, then keep them reconciled
+        self.reconcile_aggregates.start()
+
+        # Archive request / auto-archive of inactive tickets
+        if STALE_AFTER_HOURS > 0:
+            self.sweep_stale_tickets.start()
+
         logger.info("Tickets cog loaded")
 
     async def cog_unload(self):
         """Appelé quand le cog est déchargé"""
+        self.refresh_staff_cache.cancel()
+        self.reconcile_aggregates.cancel()
+        self.sweep_stale_tickets.cancel()
+        self.bot.remove_dynamic_items(*TICKET_DYNAMIC_ITEMS)
+        await ticket_admission.stop()
+
+        # Hooks bound to this instance would flush a dead cog on the next reload
+        self.bot.remove_shutdown_hook(transcript_archiver.drain)
+        self.bot.remove_shutdown_hook(db.flush)
+
         # Fermer la connexion à la base de données
+        await transcript_archiver.drain()
+        await stale_sweeper.flush_activity()
         await db.close()
+        await invite_resolver.close()
         logger.info("Tickets cog unloaded")
 
+    @tasks.loop(seconds=STAFF_CACHE_POLL_INTERVAL)
+    async def refresh_staff_cache(self):
+        """Invalidates staff cache entries changed in the Moddy DB"""
+        await db.poll_staff_updates()
+
+    @tasks.loop(seconds=AGGREGATES_RECONCILE_INTERVAL)
+    async def reconcile_aggregates(self):
+        """Reconciles the dashboard counters with the ModdySystems DB"""
+        await db.reconcile_aggregates()
+
+    @tasks.loop(seconds=SWEEP_INTERVAL)
+    async def sweep_stale_tickets(self):
+        """Archive requests and auto-archives for inactive tickets"""
+        await stale_sweeper.sweep(self.bot)
+
+    @sweep_stale_tickets.before_loop
+    async def before_sweep_stale_tickets(self):
+        # Threads are looked up in the cache first
+        await self.bot.wait_until_ready()
+
+    @app_commands.command(name="tickets-dashboard", description="View the ticket backlog (staff only)")
+    async def tickets_dashboard(self, interaction: discord.Interaction):
+        """Shows open tickets by category and state, from in-memory counters"""
+        try:
+            staff_info = await db.get_staff_info(interaction.user.id)
+        except DatabaseUnavailable:
+            await interaction.response.send_message(
+                f"{EMOJIS['undone']} {DB_UNAVAILABLE_MESSAGE}",
+                ephemeral=True
+            )
+            return
+
+        if not staff_info:
+            await interaction.response.send_message(
+                f"{EMOJIS['undone']} You do not have permission to use this command.",
+                ephemeral=True
+            )
+            return
+
+        await interaction.response.send_message(view=build_dashboard_view(db.aggregates), ephemeral=True)
+
+    @app_commands.command(name="tickets-sla", description="View ticket lifecycle percentiles (staff only)")
+    @app_commands.describe(export="Attach the full data as JSON")
+    async def tickets_sla(self, interaction: discord.Interaction, export: bool = False):
+        """Time to claim / first reply / archive, per category and staff member"""
+        try:
+            staff_info = await db.get_staff_info(interaction.user.id)
+        except DatabaseUnavailable:
+            await interaction.response.send_message(
+                f"{EMOJIS['undone']} {DB_UNAVAILABLE_MESSAGE}",
+                ephemeral=True
+            )
+            return
+
+        if not staff_info:
+            await interaction.response.send_message(
+                f"{EMOJIS['undone']} You do not have permission to use this command.",
+                ephemeral=True
+            )
+            return
+
+        if export:
+            data = json.dumps(db.sla.export(), indent=2).encode()
+            file = discord.File(
+                io.BytesIO(data),
+                filename=f"tickets_sla_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+            )
+            await interaction.response.send_message(
+                f"{EMOJIS['ticket']} **Ticket SLA Export** (durations in seconds)",
+                file=file,
+                ephemeral=True
+            )
+            return
+
+        await interaction.response.send_message(view=build_sla_view(db.sla), ephemeral=True)
+
+    @app_commands.command(name="ticket-search", description="Search tickets and their transcripts (staff only)")
+    @app_commands.describe(
+        query="Words to search (error code, guild ID, invite, case ID, message text...)",
+        category="Only tickets of this category",
+        user="Only tickets opened by this user",
+        after="Only tickets created on or after this date (YYYY-MM-DD)",
+        before="Only tickets created before this date (YYYY-MM-DD)"
+    )
+    @app_commands.choices(category=[
+        app_commands.Choice(name=config['label'], value=key)
+        for key, config in TICKET_CATEGORIES.items()
+    ])
+    async def ticket_search(self, interaction: discord.Interaction, query: str,
+                            category: Optional[app_commands.Choice[str]] = None,
+                            user: Optional[discord.User] = None,
+                            after: Optional[str] = None, before: Optional[str] = None):
+        """Ranked full-text search over ticket metadata and transcripts"""
+        try:
+            staff_info = await db.get_staff_info(interaction.user.id)
+        except DatabaseUnavailable:
+            await interaction.response.send_message(
+                f"{EMOJIS['undone']} {DB_UNAVAILABLE_MESSAGE}",
+                ephemeral=True
+            )
+            return
+
+        if not staff_info:
+            await interaction.response.send_message(
+                f"{EMOJIS['undone']} You do not have permission to use this command.",
+                ephemeral=True
+            )
+            return
+
+        try:
+            dates = [
+                datetime.strptime(value, '%Y-%m-%d').replace(tzinfo=timezone.utc) if value else None
+                for value in (after, before)
+            ]
+        except ValueError:
+            await interaction.response.send_message(
+                f"{EMOJIS['undone']} Dates must use the YYYY-MM-DD format.",
+                ephemeral=True
+            )
+            return
+
+        # Only categories this staff member can manage
+        role_mask = get_staff_role_mask(staff_info)
+        categories = [
+            key for key in TICKET_CATEGORIES
+            if can_manage_ticket(role_mask, key) and (category is None or key == category.value)
+        ]
+        if not categories:
+            await interaction.response.send_message(
+                f"{EMOJIS['undone']} You do not have permission to manage this type of ticket.",
+                ephemeral=True
+            )
+            return
+
+        search = {
+            'query': query,
+            'categories': categories,
+            'user_id': user.id if user else None,
+            'after': dates[0],
+            'before': dates[1],
+        }
+        view = await defer_while(interaction, TicketSearchView.fetch(interaction.user.id, search, [None]))
+        await interaction.followup.send(view=view, ephemeral=True)
+
+    @commands.Cog.listener()
+    async def on_raw_thread_delete(self, payload: discord.RawThreadDeleteEvent):
+        """Oublie l'historique de renommage d'un thread supprimé"""
+        thread_renamer.forget(payload.thread_id)
+
     @commands.Cog.listener()
     async def on_message(self, message: discord.Message):
         """Écoute les messages pour la commande !tickets"""
@@ -1741,6 +4117,12 @@ class Tickets(commands.Cog):
         if message.author.bot:
             return
 
+        # Activité dans un ticket (sweeper et SLA)
+        if isinstance(message.channel, discord.Thread) and message.channel.parent_id == SUPPORT_CHANNEL_ID:
+            stale_sweeper.record_activity(message.channel.id, message.created_at)
+            await self.track_first_staff_reply(message)
+            return
+
         # Check si c'est dans le bon salon
         if message.channel.id != SUPPORT_CHANNEL_ID:
             return
@@ -1748,7 +4130,14 @@ class Tickets(commands.Cog):
         # Check si c'est la commande !tickets
         if message.content.strip() == '!tickets':
             # Check si l'utilisateur est un staff
-            staff_info = await db.get_staff_info(message.author.id)
+            try:
+                staff_info = await db.get_staff_info(message.author.id)
+            except DatabaseUnavailable:
+                await message.reply(
+                    f"{EMOJIS['undone']} {DB_UNAVAILABLE_MESSAGE}",
+                    delete_after=5
+                )
+                return
 
             if not staff_info:
                 await message.reply(
@@ -1766,6 +4155,21 @@ class Tickets(commands.Cog):
             # Send support panel
             await message.channel.send(view=self.support_panel_view)
 
+    async def track_first_staff_reply(self, message: discord.Message):
+        """Records the first message of a staff member in a ticket"""
+        ticket = await db.get_ticket(message.channel.id)
+        if not ticket or ticket['archived'] or ticket.get('first_staff_reply_at'):
+            return
+        if message.author.id == ticket['user_id']:
+            return
+
+        try:
+            staff_info = await db.get_staff_info(message.author.id)
+        except DatabaseUnavailable:
+            return
+        if staff_info:
+            await db.record_first_staff_reply(ticket, message.author.id, message.created_at)
+
     @commands.command(name='archiverequest')
     async def archive_request(self, ctx: commands.Context):
         """Command pour demander l'archivage d'un ticket"""
@@ -1778,7 +4182,14 @@ class Tickets(commands.Cog):
             return
 
         # Check si l'utilisateur est un staff
-        staff_info = await db.get_staff_info(ctx.author.id)
+        try:
+            staff_info = await db.get_staff_info(ctx.author.id)
+        except DatabaseUnavailable:
+            await ctx.reply(
+                f"{EMOJIS['undone']} {DB_UNAVAILABLE_MESSAGE}",
+                delete_after=5
+            )
+            return
 
         if not staff_info:
             await ctx.reply(
@@ -1798,8 +4209,7 @@ class Tickets(commands.Cog):
             return
 
         # Check les permissions
-        staff_roles = get_staff_roles(staff_info)
-        if not can_manage_ticket(staff_roles, ticket['category']):
+        if not can_manage_ticket(get_staff_role_mask(staff_info), ticket['category']):
             await ctx.reply(
                 f"{EMOJIS['undone']} You do not have permission to manage this type of ticket.",
                 delete_after=5
@@ -1813,19 +4223,15 @@ class Tickets(commands.Cog):
             pass
 
         # Update thread status indicator to archive_request
-        if isinstance(ctx.channel, discord.Thread):
-            try:
-                await update_thread_status_indicator(ctx.channel, 'archive_request')
-            except Exception as e:
-                logger.warning(f"Could not update thread status indicator (rate limit?): {e}")
-
-        # Get ticket user
-        ticket_user = ctx.guild.get_member(ticket['user_id']) or await ctx.guild.fetch_member(ticket['user_id'])
+        thread_renamer.schedule(ctx.channel, 'archive_request')
 
         # Send archive request (Components V2 - no content parameter)
-        view = ArchiveRequestView(ctx.channel.id, ticket_user)
+        view = ArchiveRequestView(ctx.channel.id)
         await ctx.send(view=view)
 
+        # Archived automatically if the user never answers
+        await db.mark_archive_requested(ctx.channel.id)
+
     @commands.command(name='unarchive')
     async def unarchive_ticket_command(self, ctx: commands.Context):
         """Command to unarchive a ticket"""
@@ -1838,7 +4244,14 @@ class Tickets(commands.Cog):
             return
 
         # Check if user is staff
-        staff_info = await db.get_staff_info(ctx.author.id)
+        try:
+            staff_info = await db.get_staff_info(ctx.author.id)
+        except DatabaseUnavailable:
+            await ctx.reply(
+                f"{EMOJIS['undone']} {DB_UNAVAILABLE_MESSAGE}",
+                delete_after=5
+            )
+            return
 
         if not staff_info:
             await ctx.reply(
@@ -1858,8 +4271,7 @@ class Tickets(commands.Cog):
             return
 
         # Check permissions
-        staff_roles = get_staff_roles(staff_info)
-        if not can_manage_ticket(staff_roles, ticket['category']):
+        if not can_manage_ticket(get_staff_role_mask(staff_info), ticket['category']):
             await ctx.reply(
                 f"{EMOJIS['undone']} You do not have permission to manage this type of ticket.",
                 delete_after=5
@@ -1869,13 +4281,9 @@ class Tickets(commands.Cog):
         # Unarchive ticket in DB
         await db.unarchive_ticket(ctx.channel.id)
 
-        # Unlock and unarchive thread
-        thread = ctx.channel
-        await thread.edit(archived=False, locked=False)
-
-        # Update thread status indicator
+        # Unlock and unarchive thread, restoring its status indicator
         status = 'claimed' if ticket['claimed_by'] else 'unclaimed'
-        await update_thread_status_indicator(thread, status)
+        await thread_renamer.unarchive(ctx.channel, status)
 
         # Delete command message
         try:
@@ -0,0 +1,119 @@
+"""Golden-output tests and a render micro-benchmark for cogs/_status_render.py"""
+import json
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from cogs._status_render import ReportRenderer, build_report_view, report_duration  # noqa: E402
+
+GOLDEN_PATH = os.path.join(os.path.dirname(__file__), 'fixtures', 'status_render.json')
+
+INCIDENT = {
+    'title': 'API down',
+    'issue': 'Requests time out',
+    'services': 'API, Dashboard',
+    'severity': 'Critical',
+    'eta': 'TBD',
+    'status': 'ongoing',
+    'type': 'incident',
+    'start_time': 1700000000,
+    'status_id': '202311140001',
+    'updates': [],
+    'mentions': [],
+}
+
+MAINTENANCE = {
+    'title': 'Database upgrade',
+    'description': 'Upgrading PostgreSQL',
+    'services': 'Moddy Bot',
+    'scheduled_time': '1700086400',
+    'duration': '2 hours',
+    'status': 'scheduled',
+    'type': 'maintenance',
+    'status_id': '202311140002',
+    'updates': [],
+    'mentions': [],
+}
+
+UPDATES = [
+    {'description': 'Investigating the load balancer', 'timestamp': '1700000600', 'number': 1, 'status': 'investigating'},
+    {'description': 'Fix deployed', 'timestamp': '1700003600', 'number': 2, 'status': 'monitoring'},
+]
+
+# name -> (record, displayed duration)
+CASES = {
+    'incident': (INCIDENT, None),
+    'incident_resolved': (
+        {**INCIDENT, 'status': 'resolved', 'eta': 'Resolved', 'resolution_time': 1700005400},
+        '1h 30m',
+    ),
+    'maintenance_scheduled': (MAINTENANCE, None),
+    'maintenance_unscheduled': ({k: v for k, v in MAINTENANCE.items() if k != 'scheduled_time'}, None),
+    'incident_with_updates': ({**INCIDENT, 'status': 'monitoring', 'updates': UPDATES}, None),
+    'incident_with_mentions': ({**INCIDENT, 'mentions': ['@here', '<@&1424466344832925847>']}, None),
+}
+
+
+def load_golden() -> dict:
+    with open(GOLDEN_PATH, 'r') as f:
+        return json.load(f)
+
+
+def test_golden_outputs():
+    golden = load_golden()
+    assert set(golden) == set(CASES)
+    for name, (record, duration) in CASES.items():
+        assert build_report_view(record, duration).to_components() == golden[name], name
+
+
+def test_resolved_duration_stops_at_resolution_time():
+    record, duration = CASES['incident_resolved']
+    assert report_duration(record) == duration
+    assert report_duration(MAINTENANCE) is None
+
+
+def test_render_is_memoized_per_version():
+    renderer = ReportRenderer()
+    record = {**INCIDENT, 'status': 'resolved', 'resolution_time': 1700005400, 'version': 3}
+
+    first = renderer.render(record, '123')
+    assert renderer.render(record, '123') is first
+    assert renderer.render(dict(record), '123') is first
+
+    # A new version renders again, an unstored report is never cached
+    changed = renderer.render({**record, 'version': 4}, '123')
+    assert changed is not first
+    assert changed[1] == first[1]
+    assert renderer.render(record) is not renderer.render(record)
+
+
+def test_render_cache_is_bounded():
+    renderer = ReportRenderer(max_size=2)
+    for version in range(5):
+        renderer.render({**INCIDENT, 'version': version}, '123')
+    assert len(renderer.cache) == 2
+
+
+def benchmark(number: int = 200) -> tuple:
+    """Seconds per render, cold (new renderer each time) vs memoized"""
+    record = {**INCIDENT, 'updates': UPDATES, 'status': 'resolved',
+              'resolution_time': 1700005400, 'version': 1}
+    renderer = ReportRenderer()
+    renderer.render(record, '123')
+
+    cold = timeit.timeit(lambda: ReportRenderer().render(record, '123'), number=number) / number
+    memoized = timeit.timeit(lambda: renderer.render(record, '123'), number=number) / number
+    return cold, memoized
+
+
+def test_memoized_render_is_faster():
+    cold, memoized = benchmark()
+    assert memoized < cold
+
+
+if __name__ == '__main__':
+    cold, memoized = benchmark(2000)
+    print(f"cold render:     {cold * 1e6:8.1f} µs")
+    print(f"memoized render: {memoized * 1e6:8.1f} µs ({cold / memoized:.0f}x)")
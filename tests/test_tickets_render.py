@@ -0,0 +1,139 @@
+"""Golden-output tests and a render micro-benchmark for the ticket category templates in cogs/tickets.py
+
+The fixtures were captured from the per-category create_*_ticket functions the
+templates replaced, so they pin the rendered output to the original one.
+"""
+import json
+import os
+import sys
+import timeit
+from datetime import datetime, timezone
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from discord import ui  # noqa: E402
+
+from cogs.tickets import EMOJIS, TICKET_CATEGORIES, TicketControlView, render_info_view  # noqa: E402
+
+GOLDEN_PATH = os.path.join(os.path.dirname(__file__), 'fixtures', 'tickets_render.json')
+
+THREAD_ID = 1448000000000000001
+USER_ID = 1448000000000000002
+CREATED_AT = datetime(2023, 11, 14, 22, 13, 20, tzinfo=timezone.utc)
+
+# name -> (category, metadata)
+INFO_CASES = {
+    'support_server': ('support', {
+        'type': 'server',
+        'guild_id': '1394001780148535387',
+        'invite_link': 'https://discord.gg/moddy',
+    }),
+    'support_user': ('support', {'type': 'user'}),
+    'bug_report': ('bug_report', {
+        'error_code': 'A1B2C3D4',
+        'error_info': {
+            'command': '/config',
+            'user_id': USER_ID,
+            'guild_id': 1394001780148535387,
+            'file_source': 'cogs/config.py',
+            'line_number': 42,
+            'error_type': 'KeyError',
+            'timestamp': CREATED_AT,
+        },
+    }),
+    'bug_report_no_code': ('bug_report', {}),
+    'sanction_appeal': ('sanction_appeal', {
+        'case_info': {
+            'case_id': 'C-1042',
+            'case_type': 'interserver',
+            'sanction_type': 'global_ban',
+            'status': 'open',
+            'entity_type': 'user',
+            'entity_id': USER_ID,
+            'reason': 'Spam across servers',
+            'created_by': 1448000000000000003,
+            'created_at': CREATED_AT,
+        },
+    }),
+    'legal_request': ('legal_request', {'legal_type': 'deletion'}),
+    'payments_billing': ('payments_billing', {}),
+    'other_request': ('other_request', {}),
+}
+
+# name -> (category, is_claimed)
+CONTROL_CASES = {
+    **{category: (category, False) for category in TICKET_CATEGORIES},
+    'support_claimed': ('support', True),
+}
+
+
+def load_golden() -> dict:
+    with open(GOLDEN_PATH, 'r') as f:
+        return json.load(f)
+
+
+def test_cases_cover_every_category():
+    assert {category for category, _ in INFO_CASES.values()} == set(TICKET_CATEGORIES)
+    assert {category for category, _ in CONTROL_CASES.values()} == set(TICKET_CATEGORIES)
+
+
+def test_info_view_golden_outputs():
+    golden = load_golden()['info']
+    assert set(golden) == set(INFO_CASES)
+    for name, (category, metadata) in INFO_CASES.items():
+        assert render_info_view(category, metadata).to_components() == golden[name], name
+
+
+def test_control_view_golden_outputs():
+    golden = load_golden()['control']
+    assert set(golden) == set(CONTROL_CASES)
+    for name, (category, is_claimed) in CONTROL_CASES.items():
+        view = TicketControlView(THREAD_ID, category, USER_ID, created_at=CREATED_AT, is_claimed=is_claimed)
+        assert view.to_components() == golden[name], name
+
+
+def test_static_info_views_are_shared():
+    assert render_info_view('payments_billing', {}) is render_info_view('payments_billing', {})
+    assert render_info_view('support', {'type': 'user'}) is not render_info_view('support', {'type': 'user'})
+
+
+def build_info_view_cold(category: str, metadata: dict) -> ui.LayoutView:
+    """Builds an info view the way the per-category functions did, with nothing precompiled"""
+    config = TICKET_CATEGORIES[category]
+    info = config['info']
+    lines = info(metadata) if callable(info) else list(info)
+
+    info_view = ui.LayoutView(timeout=None)
+    info_container = ui.Container()
+    info_container.add_item(ui.TextDisplay(f"### {EMOJIS['ticket']} {config['info_title']}"))
+    for line in lines:
+        info_container.add_item(ui.TextDisplay(line))
+    info_view.add_item(info_container)
+    return info_view
+
+
+def benchmark(number: int = 100) -> tuple:
+    """Seconds per render of one ticket of each case, cold vs from the category templates"""
+    cases = list(INFO_CASES.values())
+    for category, metadata in cases:
+        render_info_view(category, metadata)
+
+    def run(render):
+        for category, metadata in cases:
+            render(category, metadata)
+
+    # Best of a few runs, so a GC pause in one run does not decide the comparison
+    cold = min(timeit.repeat(lambda: run(build_info_view_cold), number=number, repeat=5)) / number
+    templated = min(timeit.repeat(lambda: run(render_info_view), number=number, repeat=5)) / number
+    return cold, templated
+
+
+def test_template_render_is_faster():
+    cold, templated = benchmark()
+    assert templated < cold
+
+
+if __name__ == '__main__':
+    cold, templated = benchmark(2000)
+    print(f"cold render:     {cold * 1e6:8.1f} µs")
+    print(f"template render: {templated * 1e6:8.1f} µs ({cold / templated:.2f}x)")